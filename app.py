@@ -1,28 +1,71 @@
 """Entry point for the GUI application.
 
 Точка входа для графического приложения.
+
+Ключ ``--profile-startup[=ФАЙЛ]`` (или переменная окружения
+``STAND_PROFILE_STARTUP=ФАЙЛ``) включает отчёт о запуске в JSON: время импорта
+модулей, создания виджетов и получения первого кадра данных от ПЛК.
 """
 
+import time
+
+T_START = time.perf_counter()   # до импорта модулей приложения - для отчёта о запуске
+
+import os
 import sys
+
+from src.utils.startup_profile import profiler, report_path_from
+
+PROFILE_PATH = report_path_from(sys.argv, os.environ)
+if PROFILE_PATH:
+    profiler.enable(PROFILE_PATH, T_START)
+
 import logging
 
-from PyQt6.QtWidgets import QApplication
+from PyQt6.QtCore import Qt, QTimer
+from PyQt6.QtWidgets import QApplication, QWidget
 
 from src.ui.main_window import MainWindow
 from src.utils.config import Config
 
+T_IMPORTED = time.perf_counter()
+FIRST_FRAME_TIMEOUT_MS = 10000  # ожидание первого кадра данных для отчёта о запуске
+
 if __name__ == '__main__':
     logging.basicConfig(level=logging.INFO)
-    app = QApplication(sys.argv)
-    app.setStyle('Fusion')
+    profiler.mark('imports_done', T_IMPORTED)
+    profiler.instrument_widgets(QWidget)
+    with profiler.section('QApplication'):
+        app = QApplication(sys.argv)
+        app.setStyle('Fusion')
     # app.setStyle('Windows11')
     # app.setStyleSheet(STYLE_SHEET)
-    config = Config('config/config.yaml')
-    window = MainWindow(config)
-    window.on_btn_hand_click()
-    window.show()
-    #window.setGeometry(50, 50, 1920, 1080)
-    window.showMaximized()
+    with profiler.section('Config'):
+        config = Config('config/config.yaml')
+    t_window = time.perf_counter()
+    with profiler.section('MainWindow'):
+        window = MainWindow(config)
+    t_created = time.perf_counter()
+    if profiler.enabled:
+        window.realtime_data.poller.data_received.connect(
+            profiler.first_data_frame, Qt.ConnectionType.QueuedConnection
+        )
+        QTimer.singleShot(FIRST_FRAME_TIMEOUT_MS, profiler.write)
+        app.aboutToQuit.connect(profiler.write)
+    with profiler.section('first_show'):
+        window.on_btn_hand_click()
+        window.show()
+        #window.setGeometry(50, 50, 1920, 1080)
+        window.showMaximized()
+        app.processEvents()
+    t_shown = time.perf_counter()
+    profiler.mark('window_shown', t_shown)
+    profiler.stop_imports()
+    logging.info(
+        "Запуск: импорт %.0f мс, главное окно %.0f мс, первый показ %.0f мс, всего %.0f мс",
+        (T_IMPORTED - T_START) * 1000.0,
+        (t_created - t_window) * 1000.0,
+        (t_shown - t_created) * 1000.0,
+        (t_shown - T_START) * 1000.0,
+    )
     sys.exit(app.exec())
-
-
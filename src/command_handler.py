@@ -7,6 +7,7 @@ commands are reported via the ``error`` signal.
 
 import logging
 import struct
+import time
 
 from PyQt6.QtCore import QObject, pyqtSignal as Signal, QTimer
 
@@ -26,6 +27,9 @@ CONTROL_CMD = {
     "move_to_angle":0b100,
     "stop":         0b111,
 }
+# Регистры движения и управления: команда, затрагивающая хотя бы один из них,
+# отправляется в ПЛК немедленно, не дожидаясь очередного опроса
+PRIORITY_REGISTERS = {"Modbus_CTRL", "Modbus_VelocitySV"}
 
 def words_to_float(word1, word2, byte_order="CDAB"):
     """
@@ -79,22 +83,32 @@ class CommandHandler(QObject):
     Signals
     -------
     write_to_plc: dict
-        Emitted with the Modbus register dictionary when a command should
-        be sent to the PLC.
+        Emitted with the Modbus registers changed by a command (a new
+        ``{name: value}`` dict); only the changed words reach the PLC.
+    write_urgent: dict, float
+        Emitted instead of ``write_to_plc`` for commands touching a motion or
+        control register (``PRIORITY_REGISTERS``) together with
+        ``time.perf_counter()`` of the command; the poller sends them
+        immediately between scheduled polls.
+
+    Both signals go to the poller thread, so commands are applied to the
+    write block in the order they were issued; an urgent write carries all
+    words changed before it (see ``ModbusPoller.send_urgent``).
     error: str
         Emitted when an invalid command argument is provided.
     """
 
     write_to_plc = Signal(dict)
+    write_urgent = Signal(dict, float)
     error = Signal(str)
 
     def __init__(self, parent=None):
         """Initialize the command handler and connect its signals."""
         super(CommandHandler, self).__init__(parent)
         self.parent = parent
-        self.write_to_plc.connect(
-            self.parent.realtime_data.modbus_registers_to_PLC_update
-        )
+        # Обычные и срочные записи - в один поток (опроса), чтобы не менять их порядок
+        self.write_to_plc.connect(self.parent.realtime_data.poller.send_registers)
+        self.write_urgent.connect(self.parent.realtime_data.poller.send_urgent)
         self.timer = QTimer()
         self.timer.setSingleShot(True)
         self.timer.setInterval(250)  # интервал 250 мс
@@ -139,7 +153,7 @@ class CommandHandler(QObject):
                 self.error.emit(message)
                 raise ValueError(message)
         regs_['Modbus_CTRL'] |= mask
-        self.write_to_plc.emit(regs_)
+        self._emit_registers('Modbus_CTRL')
 
     def servo_power_on(self):
         """Turn on the servo drive."""
@@ -171,7 +185,7 @@ class CommandHandler(QObject):
         regs_ = self.parent.modbus_write_regs
         regs_['Modbus_TensionSV'] = tension
         regs_['Modbus_VelocitySV'] = velocity
-        self.write_to_plc.emit(regs_)
+        self._emit_registers('Modbus_TensionSV', 'Modbus_VelocitySV')
 
     def torque_hold(self):
         self._do_command("torque_hold")
@@ -196,7 +210,7 @@ class CommandHandler(QObject):
         regs_["Modbus_KP"] = kp
         regs_["Modbus_KI"] = ki
         regs_["Modbus_KD"] = kd
-        self.write_to_plc.emit(regs_)
+        self._emit_registers("Modbus_KP", "Modbus_KI", "Modbus_KD")
 
     def set_calibration_coefficients(self, coeffs: dict):
         """Set caliration coefficients on PLC."""
@@ -205,13 +219,24 @@ class CommandHandler(QObject):
         regs_ = self.parent.modbus_write_regs
         regs_["Modbus_CC_LO"] = cc_lo
         regs_["Modbus_CC_HI"] = cc_hi
-        self.write_to_plc.emit(regs_)
+        self._emit_registers("Modbus_CC_LO", "Modbus_CC_HI")
+        # Те же коэффициенты - для пересчёта потока момента на стороне АРМ
+        self.parent.realtime_data.set_calibration(coeffs)
 
     def set_plc_register(self, name='Modbus_CTRL', value=0):
         """Write a raw value to a Modbus register."""
         regs_ = self.parent.modbus_write_regs
         regs_[name] = value
-        self.write_to_plc.emit(regs_)
+        self._emit_registers(name)
+
+    def _emit_registers(self, *names):
+        """Send the given registers (only them) to the PLC."""
+        regs_ = self.parent.modbus_write_regs
+        changed = {name: regs_[name] for name in names}
+        if PRIORITY_REGISTERS.intersection(names):
+            self.write_urgent.emit(changed, time.perf_counter())
+        else:
+            self.write_to_plc.emit(changed)
 
     def _do_command(self, command):
         regs_ = self.parent.modbus_write_regs
@@ -222,21 +247,21 @@ class CommandHandler(QObject):
         # Устанавливаем новые значения
         regs_['Modbus_CTRL'] |= (CONTROL_CMD[command] << 1)
         # Отправляем в ПЛК
-        self.write_to_plc.emit(regs_)
+        self._emit_registers('Modbus_CTRL')
 
     def _set_control_bit(self, bit):
         regs_: dict = self.parent.modbus_write_regs
         regs_['Modbus_CTRL'] |= (1 << bit)
-        self.write_to_plc.emit(regs_)
+        self._emit_registers('Modbus_CTRL')
 
     def _clear_control_bit(self, bit):
         regs_: dict = self.parent.modbus_write_regs
         regs_['Modbus_CTRL'] &= ~(1 << bit)
-        self.write_to_plc.emit(regs_)
+        self._emit_registers('Modbus_CTRL')
 
     def clear_all_control_bits(self):
         """Clear all control bits."""
         regs_: dict = self.parent.modbus_write_regs
         for bit in CONTROL_BITS.values():
             regs_['Modbus_CTRL'] &= ~(1 << bit)
-        self.write_to_plc.emit(regs_)
\ No newline at end of file
+        self._emit_registers('Modbus_CTRL')
\ No newline at end of file
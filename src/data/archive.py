@@ -0,0 +1,392 @@
+"""Архив испытаний: поток значений момента на диске.
+
+На каждое испытание создаётся файл ``test_ГГГГММДД_ЧЧММСС.arc``: заголовок
+``ARCHIVE_HEADER`` и далее сжатые блоки записей ``ARCHIVE_DTYPE`` - по одной
+на каждое значение момента с частотой цикла ПЛК (250 Гц): метка времени,
+значение момента ПЛК (int16, масштаб ``TORQUE_SCALE``, разрыв -
+``GAP_MARKER``) и угол и слово дискретных входов из того же опроса ПЛК.
+
+Блок - ``CHUNK_RECORDS`` записей (около 16 с): заголовок ``CHUNK_HEADER``
+(число записей, время первой и последней, CRC32) и данные, сжатые zlib.
+Данные хранятся по столбцам, каждый - разностями соседних значений: метки
+времени (в микросекундах), момент, входы и угол меняются от значения к
+значению мало, поэтому разности сжимаются в несколько раз лучше самих
+значений. Метки времени хранятся с точностью 1 мкс.
+
+Файл только дописывается. Сжатие и запись выполняет фоновый поток; поток
+обработки данных лишь ставит блок каждого опроса в очередь. Неполный блок
+держится в памяти до заполнения (после сбоя его восстанавливает журнал,
+см. ``journal``); неполный или повреждённый последний блок при чтении
+отбрасывается.
+
+Чтение - ``ArchiveReader``: при открытии по заголовкам блоков строится
+индекс (номер первой записи, время, положение в файле), запрос по номерам
+записей или по времени распаковывает только затронутые блоки. Файлы
+первой версии (``STNDARC1``, несжатые записи) читаются через ``np.memmap``.
+"""
+
+import logging
+import os
+import queue
+import threading
+import time
+import zlib
+
+import numpy as np
+
+logger = logging.getLogger(__name__)
+
+ARCHIVE_MAGIC = b'STNDARC2'
+ARCHIVE_MAGIC_V1 = b'STNDARC1'      # несжатые записи подряд
+ARCHIVE_SUFFIX = '.arc'
+ARCHIVE_HEADER = np.dtype([
+    ('magic', 'S8'),
+    ('record_size', '<u2'),     # длина записи, байт
+    ('chunk_records', '<u2'),   # записей в полном блоке (0 - версия 1, без блоков)
+    ('reserved', '<u2', (2,)),
+    ('created', '<f8'),         # время создания файла (time.time())
+    ('time_origin', '<f8'),     # time.time() для t = 0
+    ('sample_rate', '<f8'),     # номинальная частота значений момента, Гц
+    ('torque_scale', '<f8'),    # единиц значения момента на Нм
+    ('angle_scale', '<f8'),     # единиц угла на градус
+    ('calibration', '<f8', (6,)),   # A1, B1, C1, A2, B2, граница поддиапазонов
+])
+ARCHIVE_DTYPE = np.dtype([
+    ('t', '<f8'),               # метка времени значения, с от time_origin
+    ('torque', '<i2'),          # значение момента ПЛК (GAP_MARKER - разрыв)
+    ('di', '<u2'),              # слово дискретных входов (опрос, в котором пришло значение)
+    ('angle', '<u4'),           # угол поворота, сырое значение (тот же опрос)
+])
+
+CHUNK_MAGIC = b'CHNK'
+CHUNK_RECORDS = 4096            # записей в блоке (16 с при 250 Гц)
+COMPRESS_LEVEL = 6
+CHUNK_HEADER = np.dtype([
+    ('magic', 'S4'),
+    ('count', '<u4'),           # записей в блоке
+    ('nbytes', '<u4'),          # длина сжатых данных, байт
+    ('crc', '<u4'),             # CRC32 сжатых данных
+    ('t0_us', '<i8'),           # метка первой записи, мкс
+    ('t_last', '<f8'),          # метка последней записи, с
+])
+CHUNK_INDEX = np.dtype([
+    ('offset', '<u8'),          # номер первой записи блока
+    ('count', '<u4'),
+    ('nbytes', '<u4'),
+    ('crc', '<u4'),
+    ('position', '<u8'),        # положение сжатых данных в файле
+    ('t0_us', '<i8'),
+    ('t_first', '<f8'),
+    ('t_last', '<f8'),
+])
+# Столбцы блока: поле записи и тип разностей
+_CHUNK_COLUMNS = (('t', np.dtype('<i4')), ('torque', np.dtype('<i2')),
+                  ('di', np.dtype('<u2')), ('angle', np.dtype('<u4')))
+_CACHE_CHUNKS = 16              # распакованных блоков в кэше читателя
+
+
+def archive_name(directory, created=None):
+    """Имя нового файла архива в каталоге ``directory``."""
+    stamp = time.strftime('%Y%m%d_%H%M%S', time.localtime(created))
+    return os.path.join(directory, f'test_{stamp}{ARCHIVE_SUFFIX}')
+
+
+def list_archives(directory):
+    """Файлы архива в каталоге, новые первыми."""
+    if not os.path.isdir(directory):
+        return []
+    names = [name for name in os.listdir(directory) if name.endswith(ARCHIVE_SUFFIX)]
+    return [os.path.join(directory, name) for name in sorted(names, reverse=True)]
+
+
+def archive_slice(records, t_from=None, t_to=None):
+    """Записи с меткой времени в ``[t_from, t_to)`` (представление, без копирования).
+
+    Метки пропущенных значений возрастают, как и остальные, поэтому границы
+    находятся двоичным поиском.
+    """
+    t = records['t']
+    start = 0 if t_from is None else int(np.searchsorted(t, t_from, side='left'))
+    end = t.size if t_to is None else int(np.searchsorted(t, t_to, side='left'))
+    return records[start:end]
+
+
+def encode_chunk(records):
+    """Сжать записи ``ARCHIVE_DTYPE`` в блок: ``(заголовок CHUNK_HEADER, данные)``."""
+    t_us = np.round(records['t'] * 1e6).astype(np.int64)
+    columns = [np.diff(t_us, prepend=t_us[0]).astype(np.int32)]
+    # Разности целых по модулю 2**n: обратное преобразование (cumsum) точное
+    for name, dtype in _CHUNK_COLUMNS[1:]:
+        values = records[name].astype(dtype)
+        columns.append(np.diff(values, prepend=dtype.type(0)))
+    payload = zlib.compress(b''.join(column.tobytes() for column in columns), COMPRESS_LEVEL)
+    header = np.zeros(1, dtype=CHUNK_HEADER)
+    header['magic'] = CHUNK_MAGIC
+    header['count'] = records.size
+    header['nbytes'] = len(payload)
+    header['crc'] = zlib.crc32(payload)
+    header['t0_us'] = t_us[0]
+    header['t_last'] = t_us[-1] * 1e-6
+    return header, payload
+
+
+def decode_chunk(count, t0_us, payload):
+    """Распаковать данные блока в массив записей ``ARCHIVE_DTYPE``."""
+    data = zlib.decompress(payload)
+    records = np.empty(count, dtype=ARCHIVE_DTYPE)
+    position = 0
+    for name, dtype in _CHUNK_COLUMNS:
+        deltas = np.frombuffer(data, dtype=dtype, count=count, offset=position)
+        position += count * dtype.itemsize
+        if name == 't':
+            records['t'] = (t0_us + np.cumsum(deltas, dtype=np.int64)) * 1e-6
+        else:
+            records[name] = np.cumsum(deltas, dtype=dtype)
+    return records
+
+
+class ArchiveReader:
+    """Файл архива, открытый для чтения.
+
+    Индекс блоков строится при открытии (читаются только их заголовки);
+    записи распаковываются по запросу, последние блоки держатся в кэше.
+    Архив, который ещё пишется, виден до последнего записанного блока.
+
+    Attributes
+    ----------
+    header: numpy.void
+        Заголовок ``ARCHIVE_HEADER``.
+    chunks: numpy.ndarray
+        Индекс блоков ``CHUNK_INDEX`` (для файла версии 1 пуст).
+    size: int
+        Число записей.
+    """
+
+    def __init__(self, path):
+        self.path = path
+        header = np.fromfile(path, dtype=ARCHIVE_HEADER, count=1)
+        if header.size == 0 or header['magic'][0] not in (ARCHIVE_MAGIC, ARCHIVE_MAGIC_V1):
+            raise ValueError(f"{path}: не является файлом архива")
+        if header['record_size'][0] != ARCHIVE_DTYPE.itemsize:
+            raise ValueError(f"{path}: длина записи {header['record_size'][0]} вместо {ARCHIVE_DTYPE.itemsize}")
+        self.header = header[0]
+        self._records = None        # версия 1: отображение файла в память
+        self._cache = {}
+        if self.header['magic'] == ARCHIVE_MAGIC_V1:
+            self.chunks = np.zeros(0, dtype=CHUNK_INDEX)
+            count = (os.path.getsize(path) - ARCHIVE_HEADER.itemsize) // ARCHIVE_DTYPE.itemsize
+            self._records = np.zeros(0, dtype=ARCHIVE_DTYPE) if count <= 0 else np.memmap(
+                path, dtype=ARCHIVE_DTYPE, mode='r', offset=ARCHIVE_HEADER.itemsize, shape=(count,))
+            self.size = int(self._records.size)
+        else:
+            self.chunks = self._scan_chunks()
+            self.size = int(self.chunks['offset'][-1] + self.chunks['count'][-1]) if self.chunks.size else 0
+
+    def __len__(self):
+        return self.size
+
+    @property
+    def t_first(self):
+        if self._records is not None:
+            return float(self._records['t'][0]) if self.size else 0.0
+        return float(self.chunks['t_first'][0]) if self.size else 0.0
+
+    @property
+    def t_last(self):
+        if self._records is not None:
+            return float(self._records['t'][-1]) if self.size else 0.0
+        return float(self.chunks['t_last'][-1]) if self.size else 0.0
+
+    def read(self, start=0, stop=None):
+        """Записи с номерами ``[start, stop)`` (распаковываются только нужные блоки)."""
+        stop = self.size if stop is None else min(int(stop), self.size)
+        start = max(0, int(start))
+        if start >= stop:
+            return np.zeros(0, dtype=ARCHIVE_DTYPE)
+        if self._records is not None:
+            return np.asarray(self._records[start:stop])
+        offsets = self.chunks['offset']
+        first = int(np.searchsorted(offsets, start, side='right')) - 1
+        last = int(np.searchsorted(offsets, stop, side='left'))
+        parts = [self._chunk(i) for i in range(first, last)]
+        records = parts[0] if len(parts) == 1 else np.concatenate(parts)
+        base = int(offsets[first])
+        return records[start - base:stop - base]
+
+    def search(self, t):
+        """Номер первой записи с меткой времени не меньше ``t``."""
+        if self._records is not None:
+            return int(np.searchsorted(self._records['t'], t, side='left'))
+        # Граница - в первом блоке, последняя метка которого не меньше t
+        i = int(np.searchsorted(self.chunks['t_last'], t, side='left'))
+        if i >= self.chunks.size:
+            return self.size
+        if t <= self.chunks['t_first'][i]:
+            return int(self.chunks['offset'][i])
+        return int(self.chunks['offset'][i]) + int(np.searchsorted(self._chunk(i)['t'], t, side='left'))
+
+    def slice(self, t_from=None, t_to=None):
+        """Записи с меткой времени в ``[t_from, t_to)``."""
+        start = 0 if t_from is None else self.search(t_from)
+        stop = self.size if t_to is None else self.search(t_to)
+        return self.read(start, stop)
+
+    def blocks(self, size=1 << 20):
+        """Все записи по порядку частями не больше ``size`` (без загрузки файла целиком)."""
+        for start in range(0, self.size, size):
+            yield self.read(start, start + size)
+
+    def _scan_chunks(self):
+        """Индекс блоков по их заголовкам; неполный хвост файла отбрасывается."""
+        entries = []
+        offset = 0
+        with open(self.path, 'rb') as f:
+            f.seek(0, 2)
+            size = f.tell()
+            position = ARCHIVE_HEADER.itemsize
+            while position + CHUNK_HEADER.itemsize <= size:
+                f.seek(position)
+                header = np.frombuffer(f.read(CHUNK_HEADER.itemsize), dtype=CHUNK_HEADER)[0]
+                data_position = position + CHUNK_HEADER.itemsize
+                if header['magic'] != CHUNK_MAGIC or data_position + int(header['nbytes']) > size:
+                    break
+                count = int(header['count'])
+                entries.append((offset, count, header['nbytes'], header['crc'], data_position,
+                                header['t0_us'], header['t0_us'] * 1e-6, header['t_last']))
+                offset += count
+                position = data_position + int(header['nbytes'])
+        return np.array(entries, dtype=CHUNK_INDEX)
+
+    def _chunk(self, i):
+        """Распакованные записи блока ``i`` (с кэшем)."""
+        records = self._cache.get(i)
+        if records is not None:
+            return records
+        entry = self.chunks[i]
+        with open(self.path, 'rb') as f:
+            f.seek(int(entry['position']))
+            payload = f.read(int(entry['nbytes']))
+        if zlib.crc32(payload) != entry['crc']:
+            raise ValueError(f"{self.path}: повреждён блок {i}")
+        records = decode_chunk(int(entry['count']), int(entry['t0_us']), payload)
+        if len(self._cache) >= _CACHE_CHUNKS:
+            del self._cache[next(iter(self._cache))]
+        self._cache[i] = records
+        return records
+
+
+class ArchiveWriter:
+    """Фоновая запись значений испытания в файл архива.
+
+    Parameters
+    ----------
+    path: str
+        Имя файла (создаётся заново).
+    header: dict
+        Поля заголовка ``ARCHIVE_HEADER`` (кроме служебных).
+    flush_interval_s: float
+        Как часто забирать накопленные записи из очереди, с.
+    summaries:
+        Построитель сводок (``archive_index.SummaryWriter``): получает каждый
+        блок записей в потоке записи.
+    chunk_records: int
+        Записей в сжатом блоке.
+    """
+
+    def __init__(self, path, header=None, flush_interval_s=1.0, summaries=None, chunk_records=CHUNK_RECORDS):
+        self.path = path
+        self.header = dict(header or {})
+        self.flush_interval_s = float(flush_interval_s)
+        self.summaries = summaries
+        self.chunk_records = int(chunk_records)
+        self.records_written = 0
+        self.bytes_written = 0
+        self._pending = np.zeros(0, dtype=ARCHIVE_DTYPE)   # неполный блок
+        self._queue = queue.SimpleQueue()
+        self._stop = threading.Event()
+        self._thread = None
+        self._file = None
+
+    def start(self):
+        """Создать файл и запустить поток записи."""
+        self._file = open(self.path, 'wb')
+        header = np.zeros(1, dtype=ARCHIVE_HEADER)
+        header['magic'] = ARCHIVE_MAGIC
+        header['record_size'] = ARCHIVE_DTYPE.itemsize
+        header['chunk_records'] = self.chunk_records
+        header['created'] = time.time()
+        for name, value in self.header.items():
+            header[name] = value
+        header.tofile(self._file)
+        self._file.flush()
+        self.bytes_written = ARCHIVE_HEADER.itemsize
+        if self.summaries is not None:
+            self.summaries.start()
+        self._stop.clear()
+        self._thread = threading.Thread(target=self._run, name='ArchiveWriter', daemon=True)
+        self._thread.start()
+        logger.info("Архив испытания: %s", self.path)
+
+    def append(self, t, torque, di, angle):
+        """Поставить в очередь значения одного опроса (вызывается из потока обработки).
+
+        ``t`` и ``torque`` - массивы одной длины, ``di`` и ``angle`` - значения
+        опроса, общие для всех его значений момента.
+        """
+        block = np.empty(len(t), dtype=ARCHIVE_DTYPE)
+        block['t'] = t
+        block['torque'] = torque
+        block['di'] = di
+        block['angle'] = angle
+        self._queue.put(block)
+
+    def stop(self):
+        """Дописать очередь и неполный блок, сбросить файл на диск (``fsync``) и закрыть его."""
+        if self._thread is None:
+            return
+        self._stop.set()
+        self._thread.join()
+        self._thread = None
+        self._write_chunks(final=True)
+        # Журнал испытания удаляется после stop - архив должен быть на диске
+        self._file.flush()
+        os.fsync(self._file.fileno())
+        self._file.close()
+        self._file = None
+        if self.summaries is not None:
+            self.summaries.close()
+        logger.info("Архив испытания записан: %s, значений %d, %.2f байт на значение",
+                    self.path, self.records_written, self.bytes_written / max(self.records_written, 1))
+
+    def _run(self):
+        while not self._stop.is_set():
+            self._stop.wait(self.flush_interval_s)
+            self._drain()
+
+    def _drain(self):
+        """Забрать накопленные записи из очереди и записать заполненные блоки."""
+        pending = []
+        while True:
+            try:
+                pending.append(self._queue.get_nowait())
+            except queue.Empty:
+                break
+        if not pending:
+            return
+        block = np.concatenate(pending)
+        self._pending = np.concatenate((self._pending, block))
+        self._write_chunks()
+        if self.summaries is not None:
+            self.summaries.add(block)
+
+    def _write_chunks(self, final=False):
+        """Сжать и записать заполненные блоки (``final`` - и неполный последний)."""
+        while self._pending.size >= self.chunk_records or (final and self._pending.size):
+            records = self._pending[:self.chunk_records]
+            self._pending = self._pending[records.size:]
+            header, payload = encode_chunk(records)
+            header.tofile(self._file)
+            self._file.write(payload)
+            self.records_written += records.size
+            self.bytes_written += CHUNK_HEADER.itemsize + len(payload)
+        self._file.flush()
@@ -0,0 +1,355 @@
+"""Сводки архива испытания: агрегаты по секундам и минутам.
+
+Рядом с файлом архива ``test_*.arc`` пишутся файлы сводок ``test_*.1s.idx``
+и ``test_*.60s.idx``: заголовок ``SUMMARY_HEADER`` и записи ``SUMMARY_DTYPE``
+фиксированной длины - по одной на каждую секунду (минуту) испытания. Запись
+содержит начало интервала, номер первой записи архива в нём (индекс
+время -> смещение), число значений и по каналам: момент (Нм, по калибровке
+из заголовка архива) и угол (градусы) - min/max/mean/last, дискретные
+входы - объединение (OR) и последнее слово за интервал.
+
+Сводки строятся во время записи (``SummaryWriter`` в потоке ``ArchiveWriter``):
+секундные - из значений архива, минутные - из секундных. Если файлов сводок
+нет (архив записан до их появления), ``ArchiveIndex`` строит их по архиву.
+
+``ArchiveIndex`` отвечает на запросы по интервалу времени: огибающая для
+графика - из самого подробного уровня, у которого на интервал приходится не
+больше заданного числа точек (к значениям архива - только при сильном
+увеличении); статистика (пиковый момент и т. п.) - точно, из минутных и
+секундных сводок и значений архива лишь на неполных секундах по краям.
+"""
+
+import math
+import os
+
+import numpy as np
+
+from src.data.archive import ARCHIVE_DTYPE, ArchiveReader
+from src.data.calibration import CALIBRATION_KEYS, TorqueCalibration
+
+SUMMARY_PERIODS = (1.0, 60.0)       # длительность интервалов сводок, с
+SUMMARY_MAGIC = b'STNDSUM1'
+SUMMARY_HEADER = np.dtype([
+    ('magic', 'S8'),
+    ('record_size', '<u2'),     # длина записи, байт
+    ('reserved', '<u2', (3,)),
+    ('period', '<f8'),          # длительность интервала, с
+])
+SUMMARY_DTYPE = np.dtype([
+    ('t', '<f8'),               # начало интервала, с (кратно period)
+    ('offset', '<u8'),          # номер первой записи архива в интервале
+    ('count', '<u4'),           # записей архива в интервале (с разрывами)
+    ('valid', '<u4'),           # из них действительных значений момента
+    ('torque_min', '<f4'),
+    ('torque_max', '<f4'),
+    ('torque_mean', '<f4'),
+    ('torque_last', '<f4'),
+    ('angle_min', '<f4'),
+    ('angle_max', '<f4'),
+    ('angle_mean', '<f4'),
+    ('angle_last', '<f4'),
+    ('di_any', '<u2'),          # OR слов дискретных входов
+    ('di_last', '<u2'),
+])
+CHANNELS = ('torque', 'angle')
+STATS_FIELDS = ('count', 'valid', 'torque_min', 'torque_max', 'torque_mean',
+                'angle_min', 'angle_max', 'angle_mean', 'di_any')
+RAW_POINTS_FACTOR = 8   # значения архива - если их в интервале не больше 8 на колонку
+
+
+def summary_path(archive_path, period):
+    """Имя файла сводок уровня ``period`` для файла архива."""
+    return f"{os.path.splitext(archive_path)[0]}.{period:g}s.idx"
+
+
+def read_summaries(path):
+    """Открыть файл сводок только для чтения: ``(period, записи SUMMARY_DTYPE)``."""
+    header = np.fromfile(path, dtype=SUMMARY_HEADER, count=1)
+    if header.size == 0 or header['magic'][0] != SUMMARY_MAGIC:
+        raise ValueError(f"{path}: не является файлом сводок архива")
+    if header['record_size'][0] != SUMMARY_DTYPE.itemsize:
+        raise ValueError(f"{path}: длина записи {header['record_size'][0]} вместо {SUMMARY_DTYPE.itemsize}")
+    count = (os.path.getsize(path) - SUMMARY_HEADER.itemsize) // SUMMARY_DTYPE.itemsize
+    if count <= 0:
+        return float(header['period'][0]), np.zeros(0, dtype=SUMMARY_DTYPE)
+    records = np.memmap(path, dtype=SUMMARY_DTYPE, mode='r',
+                        offset=SUMMARY_HEADER.itemsize, shape=(count,))
+    return float(header['period'][0]), records
+
+
+def header_calibration(header):
+    """Калибровка значений момента по коэффициентам из заголовка архива."""
+    coeffs = header['calibration']
+    return TorqueCalibration(dict(zip(CALIBRATION_KEYS, coeffs[:-1])), coeffs[-1])
+
+
+def _bucket_starts(t, period):
+    """Начала групп записей с одинаковым интервалом ``floor(t / period)``."""
+    bucket = np.floor(t / period)
+    return np.flatnonzero(np.r_[True, bucket[1:] != bucket[:-1]]), bucket
+
+
+def summarize(records, offset, period, calibration, angle_scale):
+    """Сводки по интервалам ``period`` для подряд идущих записей архива.
+
+    ``offset`` - номер первой из ``records`` в архиве.
+    """
+    if records.size == 0:
+        return np.zeros(0, dtype=SUMMARY_DTYPE)
+    starts, bucket = _bucket_starts(records['t'], period)
+    ends = np.r_[starts[1:], records.size]
+    out = np.empty(starts.size, dtype=SUMMARY_DTYPE)
+    out['t'] = bucket[starts] * period
+    out['offset'] = offset + starts
+    out['count'] = ends - starts
+    torque = calibration.apply(records['torque'])
+    valid = ~np.isnan(torque)
+    out['valid'] = np.add.reduceat(valid, starts)
+    channels = {'torque': (torque, valid), 'angle': (records['angle'] / angle_scale, None)}
+    for name, (values, mask) in channels.items():
+        total = np.add.reduceat(values if mask is None else np.where(mask, values, 0.0), starts)
+        n = out['count'] if mask is None else out['valid']
+        out[name + '_min'] = np.fmin.reduceat(values, starts)
+        out[name + '_max'] = np.fmax.reduceat(values, starts)
+        with np.errstate(invalid='ignore', divide='ignore'):
+            out[name + '_mean'] = np.where(n > 0, total / np.maximum(n, 1), np.nan)
+        out[name + '_last'] = values[ends - 1]
+    out['di_any'] = np.bitwise_or.reduceat(records['di'], starts)
+    out['di_last'] = records['di'][ends - 1]
+    return out
+
+
+def combine(summaries, period):
+    """Свести сводки более подробного уровня в интервалы ``period``."""
+    if summaries.size == 0:
+        return np.zeros(0, dtype=SUMMARY_DTYPE)
+    starts, bucket = _bucket_starts(summaries['t'], period)
+    ends = np.r_[starts[1:], summaries.size]
+    out = np.empty(starts.size, dtype=SUMMARY_DTYPE)
+    out['t'] = bucket[starts] * period
+    out['offset'] = summaries['offset'][starts]
+    out['count'] = np.add.reduceat(summaries['count'], starts)
+    out['valid'] = np.add.reduceat(summaries['valid'], starts)
+    for name in CHANNELS:
+        weight = summaries['valid'] if name == 'torque' else summaries['count']
+        mean = summaries[name + '_mean'].astype(np.float64)
+        total = np.add.reduceat(np.where(weight > 0, mean * weight, 0.0), starts)
+        n = np.add.reduceat(weight.astype(np.int64), starts)
+        out[name + '_min'] = np.fmin.reduceat(summaries[name + '_min'], starts)
+        out[name + '_max'] = np.fmax.reduceat(summaries[name + '_max'], starts)
+        with np.errstate(invalid='ignore', divide='ignore'):
+            out[name + '_mean'] = np.where(n > 0, total / np.maximum(n, 1), np.nan)
+        out[name + '_last'] = summaries[name + '_last'][ends - 1]
+    out['di_any'] = np.bitwise_or.reduceat(summaries['di_any'], starts)
+    out['di_last'] = summaries['di_last'][ends - 1]
+    return out
+
+
+class _SummaryFile:
+    """Файл сводок одного уровня, открытый на дозапись."""
+
+    def __init__(self, path, period):
+        self.period = period
+        self._file = open(path, 'wb')
+        header = np.zeros(1, dtype=SUMMARY_HEADER)
+        header['magic'] = SUMMARY_MAGIC
+        header['record_size'] = SUMMARY_DTYPE.itemsize
+        header['period'] = period
+        header.tofile(self._file)
+
+    def write(self, summaries):
+        if summaries.size:
+            summaries.tofile(self._file)
+            self._file.flush()
+
+    def close(self):
+        self._file.flush()
+        os.fsync(self._file.fileno())
+        self._file.close()
+
+
+class SummaryWriter:
+    """Построение сводок по мере записи архива (вызывается потоком записи архива).
+
+    Незавершённый интервал каждого уровня держится в памяти и записывается,
+    когда приходит значение следующего интервала (или при ``close``).
+
+    Parameters
+    ----------
+    archive_path: str
+        Имя файла архива (имена файлов сводок - по нему).
+    calibration: TorqueCalibration
+        Калибровка значений момента.
+    angle_scale: float
+        Единиц угла на градус.
+    periods: tuple[float, ...]
+        Уровни сводок; первый строится из значений, остальные - из предыдущего.
+    """
+
+    def __init__(self, archive_path, calibration, angle_scale, periods=SUMMARY_PERIODS):
+        self.archive_path = archive_path
+        self.calibration = calibration
+        self.angle_scale = float(angle_scale)
+        self.periods = tuple(periods)
+        self._files = []
+        self._offset = 0            # номер первой записи архива в _pending_raw
+        self._pending_raw = np.zeros(0, dtype=ARCHIVE_DTYPE)
+        self._pending = []          # незавершённые интервалы уровней 2..n
+
+    def start(self):
+        self._files = [_SummaryFile(summary_path(self.archive_path, p), p) for p in self.periods]
+        self._pending = [np.zeros(0, dtype=SUMMARY_DTYPE) for _ in self.periods[1:]]
+
+    def add(self, records):
+        """Учесть очередной блок записей архива (в порядке записи)."""
+        raw = np.concatenate((self._pending_raw, records))
+        if raw.size == 0:
+            return
+        # Последний интервал может быть не завершён - оставляем его до следующего блока
+        starts, _ = _bucket_starts(raw['t'], self.periods[0])
+        split = starts[-1]
+        self._push(0, summarize(raw[:split], self._offset, self.periods[0], self.calibration, self.angle_scale))
+        self._offset += split
+        self._pending_raw = raw[split:]
+
+    def close(self):
+        """Записать незавершённые интервалы и закрыть файлы."""
+        if not self._files:
+            return
+        tail = summarize(self._pending_raw, self._offset, self.periods[0], self.calibration, self.angle_scale)
+        self._pending_raw = self._pending_raw[:0]
+        self._push(0, tail, final=True)
+        for f in self._files:
+            f.close()
+        self._files = []
+
+    def _push(self, level, summaries, final=False):
+        self._files[level].write(summaries)
+        if level + 1 >= len(self.periods):
+            return
+        period = self.periods[level + 1]
+        pending = np.concatenate((self._pending[level], summaries))
+        if pending.size == 0:
+            return
+        split = pending.size if final else _bucket_starts(pending['t'], period)[0][-1]
+        self._pending[level] = pending[split:]
+        self._push(level + 1, combine(pending[:split], period), final)
+
+
+def build_summaries(archive_path, periods=SUMMARY_PERIODS):
+    """Построить файлы сводок по готовому файлу архива (частями, без загрузки целиком)."""
+    reader = ArchiveReader(archive_path)
+    header = reader.header
+    writer = SummaryWriter(archive_path, header_calibration(header), header['angle_scale'] or 1.0, periods)
+    writer.start()
+    for records in reader.blocks():
+        writer.add(records)
+    writer.close()
+
+
+class ArchiveIndex:
+    """Файл архива со сводками: быстрые запросы по интервалу времени.
+
+    Во время записи сводки отстают от архива не больше чем на свой интервал -
+    значения после последней сводки берутся из архива.
+    """
+
+    def __init__(self, archive_path, periods=SUMMARY_PERIODS):
+        self.path = archive_path
+        self.reader = ArchiveReader(archive_path)
+        self.header = self.reader.header
+        self.calibration = header_calibration(self.header)
+        self.sample_rate = float(self.header['sample_rate']) or 250.0
+        if not all(os.path.exists(summary_path(archive_path, p)) for p in periods):
+            build_summaries(archive_path, periods)
+        # Уровни от грубого к подробному
+        self.levels = sorted((read_summaries(summary_path(archive_path, p)) for p in periods), reverse=True)
+
+    @property
+    def size(self):
+        """Число записей архива."""
+        return self.reader.size
+
+    @property
+    def t_first(self):
+        return self.reader.t_first
+
+    @property
+    def t_last(self):
+        return self.reader.t_last
+
+    def envelope(self, t_from, t_to, max_points):
+        """Огибающая момента за интервал: ``(источник, t, min, max)``.
+
+        ``источник`` - длительность интервала сводок, с, или 0 для значений
+        архива (тогда ``min`` и ``max`` совпадают). Выбирается самый подробный
+        уровень, у которого на интервал приходится не больше ``max_points``
+        точек; значения архива - если их не больше ``RAW_POINTS_FACTOR`` на точку.
+        """
+        # Число значений в интервале - по номерам граничных записей, без распаковки всего интервала
+        start, stop = self.reader.search(t_from), self.reader.search(t_to)
+        if stop - start <= RAW_POINTS_FACTOR * max_points:
+            raw = self.reader.read(start, stop)
+            values = self.calibration.apply(raw['torque'])
+            return 0.0, np.asarray(raw['t'], dtype=np.float64), values, values
+        chosen = self.levels[0]
+        for period, summaries in self.levels:
+            if (t_to - t_from) / period <= max_points:
+                chosen = (period, summaries)
+        period, summaries = chosen
+        part = summaries[np.searchsorted(summaries['t'], t_from - period):np.searchsorted(summaries['t'], t_to)]
+        return (period, np.asarray(part['t'], dtype=np.float64) + 0.5 * period,
+                np.asarray(part['torque_min']), np.asarray(part['torque_max']))
+
+    def stats(self, t_from=None, t_to=None):
+        """Статистика за интервал ``[t_from, t_to)`` (по умолчанию - всё испытание), точно.
+
+        Returns
+        -------
+        dict | None
+            ``count``, ``valid``, ``torque_min``/``max``/``mean``,
+            ``angle_min``/``max``/``mean``, ``di_any`` (``None`` - значений нет).
+        """
+        t_from = -math.inf if t_from is None else t_from
+        t_to = math.inf if t_to is None else t_to
+        pieces = [part for part in self._collect(0, t_from, t_to) if part.size]
+        if not pieces:
+            return None
+        merged = np.concatenate(pieces)
+        merged['t'] = 0.0
+        total = combine(merged, 1.0)[0]
+        return {name: total[name].item() for name in STATS_FIELDS}
+
+    def peak_torque(self, t_from=None, t_to=None):
+        """Пиковый (по модулю) момент за интервал, Нм."""
+        stats = self.stats(t_from, t_to)
+        if stats is None:
+            return math.nan
+        return float(np.nanmax(np.abs([stats['torque_min'], stats['torque_max']])))
+
+    def _collect(self, level, t_from, t_to):
+        """Сводки, точно покрывающие ``[t_from, t_to)``.
+
+        Целые интервалы уровня ``level`` внутри ``[t_from, t_to)`` берутся из
+        его сводок, остатки по краям - из более подробного уровня, а на
+        последнем шаге - из значений архива. Значения, ещё не вошедшие в
+        сводки (идёт запись), попадают в правый остаток.
+        """
+        if level >= len(self.levels):
+            raw = self.reader.slice(t_from, t_to)
+            period = self.levels[-1][0]
+            return [summarize(raw, 0, period, self.calibration, self.header['angle_scale'] or 1.0)]
+        period, summaries = self.levels[level]
+        t = summaries['t']
+        i = int(np.searchsorted(t, t_from, side='left'))
+        j = int(np.searchsorted(t, t_to - period, side='right'))
+        if j <= i:
+            return self._collect(level + 1, t_from, t_to)
+        inner_from = float(t[i])
+        inner_to = float(t[j - 1]) + period
+        parts = [np.asarray(summaries[i:j])]
+        if t_from < inner_from:
+            parts += self._collect(level + 1, t_from, inner_from)
+        if inner_to < t_to:
+            parts += self._collect(level + 1, inner_to, t_to)
+        return parts
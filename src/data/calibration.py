@@ -0,0 +1,100 @@
+"""Калибровка потока значений датчика момента по таблице.
+
+Значения момента приходят от ПЛК как int16 в масштабе ``TORQUE_SCALE``
+(500:1). Калибровочная модель - кусочная (см. ``ServoCalibrationWidget``):
+
+- нижний поддиапазон ``|x| < threshold``: ``y = A1*x^2 + B1*x + C1``;
+- верхний поддиапазон: ``y = A2*x + B2``,
+
+где ``x`` - нескорректированный момент со знаком, Нм. Модель вычисляется
+для значения со знаком, как и аппроксимируется по точкам калибровки
+(``np.polyfit``): смещение ``C1`` сохраняется и при нулевом моменте, кривая
+непрерывна в нуле.
+
+Поскольку различных значений int16 всего 65536, кривая один раз
+табулируется в массив float32 (256 КБ), а калибровка блока значений любой
+длины - одна операция ``np.take``. Маркер разрыва ``GAP_MARKER`` (-32768)
+переводится в NaN: это значение зарезервировано, показание ПЛК -32768
+``PlcRingReader`` принимает как -32767. Таблица перестраивается только при
+смене коэффициентов.
+"""
+
+import numpy as np
+
+from src.data.plc_ring_reader import GAP_MARKER
+from src.data.register_frame import TORQUE_SCALE
+
+CALIBRATION_KEYS = ('A1', 'B1', 'C1', 'A2', 'B2')
+DEFAULT_COEFFS = {'A1': 0.0, 'B1': 1.0, 'C1': 0.0, 'A2': 1.0, 'B2': 0.0}
+CALIBRATION_THRESHOLD = 10.0    # граница поддиапазонов, Нм (точка калибровки №6)
+
+_INT16_MIN = np.iinfo(np.int16).min
+_INT16_MAX = np.iinfo(np.int16).max
+
+
+def build_table(coeffs, threshold=CALIBRATION_THRESHOLD, scale=TORQUE_SCALE):
+    """Таблица ``int16 -> Нм`` (float32, 65536 значений) для коэффициентов ``coeffs``.
+
+    Индекс таблицы - значение int16, прочитанное как uint16
+    (``raw.view(np.uint16)``).
+    """
+    raw = np.arange(65536, dtype=np.uint16).view(np.int16)
+    x = raw.astype(np.float64) / scale
+    low = (coeffs['A1'] * x + coeffs['B1']) * x + coeffs['C1']
+    high = coeffs['A2'] * x + coeffs['B2']
+    table = np.where(np.abs(x) < threshold, low, high).astype(np.float32)
+    table[np.uint16(GAP_MARKER & 0xFFFF)] = np.nan
+    return table
+
+
+class TorqueCalibration:
+    """Калибровочная таблица потока момента.
+
+    Таблица заменяется целиком (новый массив), поэтому ``apply`` можно
+    вызывать из потока обработки данных, пока поток GUI меняет коэффициенты.
+
+    Parameters
+    ----------
+    coeffs: dict | None
+        Коэффициенты ``A1, B1, C1, A2, B2`` (по умолчанию - без коррекции).
+    threshold: float
+        Граница нижнего и верхнего поддиапазонов, Нм.
+    """
+
+    def __init__(self, coeffs=None, threshold=CALIBRATION_THRESHOLD):
+        self._key = None
+        self.table = None
+        self.set_coefficients(coeffs, threshold)
+
+    @property
+    def coefficients(self):
+        """Действующие коэффициенты."""
+        return dict(zip(CALIBRATION_KEYS, self._key[:-1]))
+
+    @property
+    def threshold(self):
+        """Граница поддиапазонов, Нм."""
+        return self._key[-1]
+
+    def set_coefficients(self, coeffs=None, threshold=None):
+        """Задать коэффициенты; вернуть ``True``, если таблица перестроена."""
+        coeffs = {**DEFAULT_COEFFS, **(coeffs or {})}
+        if threshold is None:
+            threshold = self._key[-1] if self._key is not None else CALIBRATION_THRESHOLD
+        key = tuple(float(coeffs[name]) for name in CALIBRATION_KEYS) + (float(threshold),)
+        if key == self._key:
+            return False
+        self.table = build_table(dict(zip(CALIBRATION_KEYS, key)), key[-1])
+        self._key = key
+        return True
+
+    def apply(self, raw, out=None):
+        """Откалиброванные значения (Нм, float32) для массива int16 ``raw``."""
+        raw = np.asarray(raw, dtype=np.int16)
+        return np.take(self.table, raw.view(np.uint16), out=out)
+
+    def convert(self, value):
+        """Откалибровать одно значение момента, Нм (с точностью шкалы ``TORQUE_SCALE``)."""
+        index = int(round(float(value) * TORQUE_SCALE))
+        index = min(max(index, _INT16_MIN + 1), _INT16_MAX)
+        return float(self.table[index & 0xFFFF])
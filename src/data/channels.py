@@ -0,0 +1,137 @@
+"""Реестр каналов данных реального времени.
+
+Каждый канал описывается один раз (``Channel``): имя, тип хранения, частота,
+масштаб и единица измерения. Кольцевые буферы ``RealTimeData`` выделяются по
+реестру (``ChannelStore``), поэтому объём памяти известен заранее и
+выводится в журнал при запуске.
+
+Целые типы хранят значения с фиксированной точкой: ``хранимое = значение *
+scale`` (момент - int16 в масштабе ПЛК 500:1, угол - int32 в масштабе
+датчика 768:1), так что точность ограничена только разрешением датчика, а не
+типом хранения. Типы с плавающей точкой хранят значение как есть
+(``scale = 1``). ``decode`` переводит хранимые значения в физические
+(float64), маркер разрыва - в NaN.
+"""
+
+import math
+from dataclasses import dataclass
+
+import numpy as np
+
+from src.data.plc_ring_reader import GAP_MARKER
+from src.data.register_frame import ANGLE_SCALE, TORQUE_SCALE
+from src.data.ring_buffer import RingBuffer
+
+
+@dataclass(frozen=True)
+class Channel:
+    """Описание канала."""
+
+    name: str
+    dtype: np.dtype                 # тип хранения
+    rate: float                     # частота значений, Гц
+    scale: float = 1.0              # единиц хранения на единицу измерения
+    unit: str = ''
+    fill: float = 0                 # начальное значение слотов буфера
+    gap: int | None = None          # хранимое значение «разрыв» (NaN при чтении)
+    description: str = ''
+
+    @property
+    def resolution(self):
+        """Шаг значений, в единицах измерения (0 - тип с плавающей точкой)."""
+        return 1.0 / self.scale if np.issubdtype(self.dtype, np.integer) else 0.0
+
+    @property
+    def limits(self):
+        """Диапазон представимых значений, в единицах измерения."""
+        if np.issubdtype(self.dtype, np.integer):
+            info = np.iinfo(self.dtype)
+            return info.min / self.scale, info.max / self.scale
+        info = np.finfo(self.dtype)
+        return float(info.min), float(info.max)
+
+    def encode(self, values):
+        """Перевести значения (в единицах измерения) в тип хранения."""
+        values = np.asarray(values, dtype=np.float64) * self.scale
+        if np.issubdtype(self.dtype, np.integer):
+            info = np.iinfo(self.dtype)
+            values = np.clip(np.rint(values), info.min, info.max)
+        return values.astype(self.dtype)
+
+    def decode(self, stored):
+        """Перевести хранимые значения в единицы измерения (float64)."""
+        stored = np.asarray(stored)
+        values = stored.astype(np.float64) / self.scale
+        if self.gap is not None:
+            values = np.where(stored == self.gap, np.nan, values)
+        return values
+
+
+def realtime_channels(sample_rate, poll_rate):
+    """Каналы ``RealTimeData``: поток момента (``sample_rate``) и значения опроса (``poll_rate``)."""
+    return (
+        Channel('torque', np.dtype(np.int16), sample_rate, TORQUE_SCALE, 'Нм', gap=GAP_MARKER,
+                description='момент ПЛК без калибровки (разрыв - GAP_MARKER)'),
+        Channel('torque_time', np.dtype(np.float64), sample_rate, 1.0, 'с', fill=math.nan,
+                description='метка времени значения момента от начала датасета'),
+        Channel('torque_rate', np.dtype(np.float32), sample_rate, 1.0, 'Нм/с', fill=math.nan,
+                description='скорость нарастания момента (NaN - разрыв или разгон фильтра)'),
+        Channel('poll_time', np.dtype(np.int32), poll_rate, 1000.0, 'с',
+                description='время получения кадра от начала датасета (мс в хранении)'),
+        Channel('tension', np.dtype(np.float32), poll_rate, 1.0, 'Нм',
+                description='момент по калибровке, на каждый опрос'),
+        Channel('angle', np.dtype(np.int32), poll_rate, ANGLE_SCALE, '°',
+                description='угол поворота, значение датчика'),
+    )
+
+
+class ChannelStore:
+    """Кольцевые буферы каналов на заданное окно времени.
+
+    Parameters
+    ----------
+    channels: iterable[Channel]
+        Реестр каналов.
+    window_s: float
+        Сколько секунд данных хранит каждый буфер (ёмкость - ``rate * window_s``).
+    """
+
+    def __init__(self, channels, window_s):
+        self.window_s = float(window_s)
+        self.channels = {channel.name: channel for channel in channels}
+        self.buffers = {
+            name: RingBuffer(max(1, math.ceil(channel.rate * self.window_s)), channel.dtype, channel.fill)
+            for name, channel in self.channels.items()
+        }
+
+    def __getitem__(self, name):
+        """Буфер канала (хранимые значения)."""
+        return self.buffers[name]
+
+    def __contains__(self, name):
+        return name in self.buffers
+
+    def channel(self, name):
+        """Описание канала."""
+        return self.channels[name]
+
+    def values(self, name, n=None):
+        """Последние ``n`` значений канала в единицах измерения (float64)."""
+        return self.channels[name].decode(self.buffers[name].last(n))
+
+    @property
+    def nbytes(self):
+        """Память всех буферов, байт."""
+        return sum(buffer.capacity * buffer.dtype.itemsize for buffer in self.buffers.values())
+
+    def describe(self):
+        """Строки описания каналов: ёмкость, тип, память, разрешение."""
+        lines = []
+        for name, channel in self.channels.items():
+            buffer = self.buffers[name]
+            resolution = f"шаг {channel.resolution:.3g} {channel.unit}" if channel.resolution else "float"
+            lines.append(
+                f"{name}: {channel.rate:g} Гц x {buffer.capacity}, {channel.dtype.name}, "
+                f"{buffer.capacity * channel.dtype.itemsize / 1024:.0f} КБ, {resolution}"
+            )
+        return lines
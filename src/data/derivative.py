@@ -0,0 +1,141 @@
+"""Потоковая производная значений (скорость нарастания момента, Нм/с).
+
+``StreamingDerivative`` обрабатывает каждый новый блок значений целиком
+средствами numpy и хранит состояние фильтра между блоками, так что результат
+не зависит от того, как поток разбит на блоки. Один выходной отсчёт на
+каждый входной - канал производной выровнен с каналом значений.
+
+Сглаживание:
+
+- ``'savgol'`` - фильтр Савицкого-Голея: производная полинома степени
+  ``order``, приближающего по МНК последние ``window`` значений, в последнем
+  из них (причинный КИХ-фильтр; задержка около половины окна при ``order=1``,
+  меньше - при большей степени ценой большего шума);
+- ``'iir'`` - первая разность, сглаженная БИХ-фильтром первого порядка
+  с постоянной времени ``tau_s``.
+
+Разрыв данных (NaN) сбрасывает состояние: на разрыве и пока фильтр заново
+не наберёт значения, на выходе NaN.
+"""
+
+import math
+
+import numpy as np
+
+DERIVATIVE_FILTERS = ('savgol', 'iir')
+SAVGOL_WINDOW = 31      # окно фильтра Савицкого-Голея, значений (124 мс при 250 Гц)
+SAVGOL_ORDER = 2        # степень полинома
+IIR_TAU_S = 0.02        # постоянная времени БИХ-фильтра, с
+_IIR_CHUNK = 64         # длина участка для матричного расчёта БИХ-фильтра
+
+
+def savgol_derivative_coeffs(window, order, sample_rate):
+    """Коэффициенты причинного фильтра производной Савицкого-Голея.
+
+    ``np.correlate(x, h, 'valid')[i]`` - производная в значении ``x[i + window - 1]``
+    (в единицах ``x`` в секунду).
+    """
+    if window < order + 2 or order < 1:
+        raise ValueError(f"Недопустимые параметры фильтра: окно {window}, степень {order}")
+    k = np.arange(1 - window, 1, dtype=np.float64)      # положение относительно последнего
+    vander = np.vander(k, order + 1, increasing=True)
+    return np.linalg.pinv(vander)[1] * float(sample_rate)
+
+
+class StreamingDerivative:
+    """Производная потока значений с сохранением состояния между блоками.
+
+    Parameters
+    ----------
+    sample_rate: float
+        Частота значений, Гц.
+    kind: str
+        ``'savgol'`` или ``'iir'`` (см. описание модуля).
+    window, order: int
+        Окно и степень полинома фильтра Савицкого-Голея.
+    tau_s: float
+        Постоянная времени БИХ-фильтра, с.
+    """
+
+    def __init__(self, sample_rate, kind='savgol', window=SAVGOL_WINDOW, order=SAVGOL_ORDER, tau_s=IIR_TAU_S):
+        if kind not in DERIVATIVE_FILTERS:
+            raise ValueError(f"Неизвестный фильтр производной: {kind!r}")
+        self.sample_rate = float(sample_rate)
+        self.kind = kind
+        if kind == 'savgol':
+            self._coeffs = savgol_derivative_coeffs(int(window), int(order), self.sample_rate)
+        else:
+            alpha = math.exp(-1.0 / (max(tau_s, 1e-9) * self.sample_rate))
+            self._gain = (1.0 - alpha) * self.sample_rate
+            # y[i] = alpha**(i+1) * y_prev + sum(alpha**(i-j) * u[j], j <= i)
+            lags = np.arange(_IIR_CHUNK)
+            self._powers = alpha ** (lags + 1.0)
+            self._impulse = np.tril(alpha ** (lags[:, None] - lags[None, :]).astype(np.float64))
+        self.value = math.nan       # последнее рассчитанное значение
+        self.reset()
+
+    def reset(self):
+        """Сбросить состояние (разрыв данных)."""
+        self._history = np.empty(0)     # savgol: последние window - 1 значений
+        self._last_x = math.nan         # iir: последнее значение
+        self._last_y = math.nan         # iir: последний выход фильтра
+        self.value = math.nan
+
+    def process(self, values):
+        """Производные для блока ``values`` (NaN - разрыв); массив float32 той же длины."""
+        values = np.asarray(values, dtype=np.float64)
+        out = np.full(values.size, np.nan, dtype=np.float32)
+        if values.size == 0:
+            return out
+        gaps = np.isnan(values)
+        if not gaps.any():
+            self._run(values, out)
+        else:
+            # Участки без разрывов; каждый разрыв сбрасывает состояние
+            edges = np.flatnonzero(np.diff(gaps)) + 1
+            bounds = np.concatenate(([0], edges, [values.size]))
+            for start, end in zip(bounds[:-1], bounds[1:]):
+                if gaps[start]:
+                    self.reset()
+                else:
+                    self._run(values[start:end], out[start:end])
+        return out
+
+    def _run(self, x, out):
+        if self.kind == 'savgol':
+            self._run_savgol(x, out)
+        else:
+            self._run_iir(x, out)
+        if not math.isnan(out[-1]):
+            self.value = float(out[-1])
+
+    def _run_savgol(self, x, out):
+        window = self._coeffs.size
+        series = np.concatenate((self._history, x))
+        if series.size >= window:
+            rates = np.correlate(series, self._coeffs, 'valid')
+            out[out.size - rates.size:] = rates
+        self._history = series[series.size - (window - 1):].copy()
+
+    def _run_iir(self, x, out):
+        # Первые разности; первое значение после сброса разности не имеет
+        if math.isnan(self._last_x):
+            u = np.diff(x) * self._gain
+            target = out[1:]
+        else:
+            u = np.diff(x, prepend=self._last_x) * self._gain
+            target = out
+        self._last_x = float(x[-1])
+        if u.size == 0:
+            return
+        y_prev = self._last_y
+        if math.isnan(y_prev):
+            # Начальное состояние - по первой разности, без переходного процесса от нуля
+            y_prev = u[0] / (self._gain / self.sample_rate)
+        for start in range(0, u.size, _IIR_CHUNK):
+            chunk = u[start:start + _IIR_CHUNK]
+            n = chunk.size
+            y = self._powers[:n] * y_prev + self._impulse[:n, :n] @ chunk
+            target[start:start + n] = y
+            y_prev = float(y[-1])
+        self._last_y = y_prev
@@ -0,0 +1,145 @@
+"""Запись «сырых» кадров регистров ПЛК в двоичный файл.
+
+Формат файла: заголовок ``FRAME_LOG_HEADER`` и далее записи ``FRAME_DTYPE``
+фиксированной длины - время получения кадра (``time.monotonic()``, с) и блок
+из ``READ_BUFFER_SIZE`` слов ``uint16``. Файл только дописывается, поэтому
+после аварийного завершения в нём остаются все записанные целиком кадры;
+неполная последняя запись при чтении отбрасывается.
+
+Запись выполняется в фоновом потоке: поток опроса лишь кладёт кадр в очередь.
+"""
+
+import logging
+import queue
+import threading
+import time
+
+import numpy as np
+
+from src.data.register_frame import READ_BUFFER_SIZE, WORD
+
+logger = logging.getLogger(__name__)
+
+FRAME_LOG_MAGIC = b'STNDFRM1'
+FRAME_LOG_HEADER = np.dtype([
+    ('magic', 'S8'),
+    ('words', '<u2'),           # слов в кадре
+    ('reserved', '<u2', (3,)),
+    ('created', '<f8'),         # время создания файла (time.time())
+    ('t_origin', '<f8'),        # time.monotonic() в момент создания
+])
+FRAME_DTYPE = np.dtype([
+    ('t', '<f8'),               # время получения кадра, time.monotonic()
+    ('words', WORD, (READ_BUFFER_SIZE,)),
+])
+
+
+def read_frames(path):
+    """Открыть файл кадров только для чтения.
+
+    Returns
+    -------
+    tuple[numpy.ndarray, numpy.memmap]
+        Заголовок и массив записей ``FRAME_DTYPE`` (отображение файла в память).
+    """
+    header = np.fromfile(path, dtype=FRAME_LOG_HEADER, count=1)
+    if header.size == 0 or header['magic'][0] != FRAME_LOG_MAGIC:
+        raise ValueError(f"{path}: не является файлом кадров регистров")
+    if header['words'][0] != READ_BUFFER_SIZE:
+        raise ValueError(f"{path}: размер кадра {header['words'][0]} вместо {READ_BUFFER_SIZE}")
+    header = header[0]
+    with open(path, 'rb') as f:
+        f.seek(0, 2)
+        size = f.tell()
+    count = (size - FRAME_LOG_HEADER.itemsize) // FRAME_DTYPE.itemsize
+    if count == 0:
+        return header, np.zeros(0, dtype=FRAME_DTYPE)
+    frames = np.memmap(path, dtype=FRAME_DTYPE, mode='r',
+                       offset=FRAME_LOG_HEADER.itemsize, shape=(count,))
+    return header, frames
+
+
+def create_frame_log(path):
+    """Создать файл кадров с заголовком; вернуть открытый на запись файл."""
+    f = open(path, 'wb')
+    header = np.zeros(1, dtype=FRAME_LOG_HEADER)
+    header['magic'] = FRAME_LOG_MAGIC
+    header['words'] = READ_BUFFER_SIZE
+    header['created'] = time.time()
+    header['t_origin'] = time.monotonic()
+    header.tofile(f)
+    f.flush()
+    return f
+
+
+def frame_block(pending):
+    """Массив ``FRAME_DTYPE`` из списка пар ``(t_received, registers)``."""
+    block = np.empty(len(pending), dtype=FRAME_DTYPE)
+    for i, (t, registers) in enumerate(pending):
+        block[i]['t'] = t
+        block[i]['words'] = registers
+    return block
+
+
+class FrameRecorder:
+    """Фоновая запись кадров регистров в файл.
+
+    Parameters
+    ----------
+    path: str
+        Имя файла (создаётся заново).
+    flush_interval_s: float
+        Как часто сбрасывать накопленные кадры на диск, с.
+    """
+
+    def __init__(self, path, flush_interval_s=0.5):
+        self.path = path
+        self.flush_interval_s = float(flush_interval_s)
+        self.frames_written = 0
+        self._queue = queue.SimpleQueue()
+        self._stop = threading.Event()
+        self._thread = None
+        self._file = None
+
+    def start(self):
+        """Создать файл и запустить поток записи."""
+        self._file = create_frame_log(self.path)
+        self._stop.clear()
+        self._thread = threading.Thread(target=self._run, name='FrameRecorder', daemon=True)
+        self._thread.start()
+        logger.info("Запись кадров регистров: %s", self.path)
+
+    def record(self, registers, t_received):
+        """Поставить кадр в очередь записи (вызывается из потока опроса)."""
+        self._queue.put((t_received, registers))
+
+    def stop(self):
+        """Дописать очередь, закрыть файл и остановить поток."""
+        if self._thread is None:
+            return
+        self._stop.set()
+        self._thread.join()
+        self._thread = None
+        self._file.close()
+        self._file = None
+        logger.info("Запись кадров завершена: %s, кадров %d", self.path, self.frames_written)
+
+    def _run(self):
+        while not self._stop.is_set():
+            self._stop.wait(self.flush_interval_s)
+            self._drain()
+
+    def _drain(self):
+        """Записать все накопленные кадры одним блоком."""
+        pending = []
+        while True:
+            try:
+                pending.append(self._queue.get_nowait())
+            except queue.Empty:
+                break
+        if not pending:
+            return
+        block = frame_block(pending)
+        block.tofile(self._file)
+        self._file.flush()
+        self.frames_written += len(pending)
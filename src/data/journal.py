@@ -0,0 +1,279 @@
+"""Журнал упреждающей записи (WAL) кадров испытания.
+
+Архив испытания (``archive``) пишется сжатыми блоками по 16 с и без
+``fsync``: при отключении питания или аварийном завершении незаписанный
+блок и хвост сводок теряются. Поэтому на время испытания каждый кадр
+регистров ПЛК дополнительно пишется в журнал - каталог
+``journal/<имя архива>/``:
+
+- ``session.json`` - всё, что нужно для восстановления архива: имя файла,
+  поля заголовка, цикл ПЛК, начало шкалы времени, последний кадр перед
+  началом испытания (от него отсчитываются новые значения буфера ПЛК) и
+  состояние ``SampleTimebase`` после него;
+- ``segment_NNNN.wal`` - кадры в формате ``frame_log`` (время получения и
+  блок регистров); сегмент закрывается после ``segment_frames`` кадров.
+
+Поток опроса лишь ставит кадр в очередь; фоновый поток пишет накопленное
+одним блоком и вызывает ``os.fsync`` не чаще раза в ``fsync_interval_s``, так
+что при сбое теряется не больше этого интервала. После штатного завершения
+испытания архив закрывается с ``fsync``, и журнал удаляется.
+
+Журнал, оставшийся после сбоя, ``recover_journals`` при следующем запуске
+переводит в архив: кадры заново проходят через ``PlcRingReader`` и
+``SampleTimebase`` с того же состояния, что и при записи (значения и метки
+времени совпадают с записанными), - архив переписывается, если
+журнал содержит больше значений, чем успело попасть в файл, сводки
+строятся заново.
+"""
+
+import glob
+import json
+import logging
+import os
+import queue
+import shutil
+import threading
+import time
+
+import numpy as np
+
+from src.data.archive import ARCHIVE_DTYPE, ArchiveReader, ArchiveWriter
+from src.data.archive_index import SUMMARY_PERIODS, SummaryWriter, build_summaries, summary_path
+from src.data.calibration import CALIBRATION_KEYS, TorqueCalibration
+from src.data.frame_log import FRAME_DTYPE, create_frame_log, frame_block, read_frames
+from src.data.plc_ring_reader import GAP_MARKER, PlcRingReader
+from src.data.register_frame import RegisterFrame
+from src.data.timebase import SampleTimebase
+
+logger = logging.getLogger(__name__)
+
+JOURNAL_MANIFEST = 'session.json'
+JOURNAL_SUFFIX = '.wal'
+FSYNC_INTERVAL_S = 1.0      # период fsync журнала, с
+SEGMENT_FRAMES = 600        # кадров в сегменте (минута при опросе 100 мс, ~140 КБ)
+
+
+def _fsync_file(f):
+    f.flush()
+    os.fsync(f.fileno())
+
+
+class FrameJournal:
+    """Журнал кадров текущего испытания.
+
+    Parameters
+    ----------
+    directory: str
+        Каталог журнала испытания (создаётся).
+    session: dict
+        Описание испытания для восстановления (пишется в ``session.json``).
+    fsync_interval_s: float
+        Как часто принудительно сбрасывать журнал на диск, с.
+    flush_interval_s: float
+        Как часто записывать накопленные кадры в файл, с.
+    segment_frames: int
+        Кадров в одном сегменте.
+    """
+
+    def __init__(self, directory, session, fsync_interval_s=FSYNC_INTERVAL_S,
+                 flush_interval_s=0.2, segment_frames=SEGMENT_FRAMES):
+        self.directory = directory
+        self.session = dict(session)
+        self.fsync_interval_s = float(fsync_interval_s)
+        self.flush_interval_s = min(float(flush_interval_s), self.fsync_interval_s)
+        self.segment_frames = int(segment_frames)
+        self.frames_written = 0
+        self._segment = 0
+        self._segment_count = 0
+        self._last_fsync = 0.0
+        self._queue = queue.SimpleQueue()
+        self._stop = threading.Event()
+        self._thread = None
+        self._file = None
+
+    def start(self):
+        """Создать каталог журнала, описание испытания и запустить поток записи."""
+        os.makedirs(self.directory, exist_ok=True)
+        manifest = os.path.join(self.directory, JOURNAL_MANIFEST)
+        with open(manifest + '.tmp', 'w', encoding='utf-8') as f:
+            json.dump(self.session, f)
+            _fsync_file(f)
+        os.replace(manifest + '.tmp', manifest)
+        self._open_segment()
+        self._last_fsync = time.monotonic()
+        self._stop.clear()
+        self._thread = threading.Thread(target=self._run, name='FrameJournal', daemon=True)
+        self._thread.start()
+        logger.info("Журнал испытания: %s", self.directory)
+
+    def record(self, registers, t_received):
+        """Поставить кадр в очередь журнала (вызывается из потока опроса)."""
+        self._queue.put((t_received, registers))
+
+    def stop(self, discard=True):
+        """Дописать очередь на диск и остановить поток.
+
+        ``discard`` - удалить журнал (испытание завершено, архив закрыт).
+        """
+        if self._thread is None:
+            return
+        self._stop.set()
+        self._thread.join()
+        self._thread = None
+        _fsync_file(self._file)
+        self._file.close()
+        self._file = None
+        if discard:
+            shutil.rmtree(self.directory, ignore_errors=True)
+        logger.info("Журнал испытания закрыт: %s, кадров %d", self.directory, self.frames_written)
+
+    def _open_segment(self):
+        self._segment += 1
+        self._segment_count = 0
+        path = os.path.join(self.directory, f'segment_{self._segment:04d}{JOURNAL_SUFFIX}')
+        self._file = create_frame_log(path)
+
+    def _run(self):
+        while not self._stop.is_set():
+            self._stop.wait(self.flush_interval_s)
+            self._drain()
+
+    def _drain(self):
+        """Записать накопленные кадры; fsync - по истечении fsync_interval_s."""
+        pending = []
+        while True:
+            try:
+                pending.append(self._queue.get_nowait())
+            except queue.Empty:
+                break
+        while pending:
+            if self._segment_count >= self.segment_frames:
+                _fsync_file(self._file)
+                self._file.close()
+                self._open_segment()
+            count = min(len(pending), self.segment_frames - self._segment_count)
+            frame_block(pending[:count]).tofile(self._file)
+            self._segment_count += count
+            self.frames_written += count
+            del pending[:count]
+        now = time.monotonic()
+        if now - self._last_fsync >= self.fsync_interval_s:
+            _fsync_file(self._file)
+            self._last_fsync = now
+
+
+def archive_session(archive_path, header, plc_cycle_s, monotonic_origin, keep, last_frame=None):
+    """Описание испытания для ``session.json``.
+
+    ``header`` - поля заголовка архива, ``last_frame`` - последний кадр
+    ``(registers, t_received, timebase_state)`` перед началом испытания.
+    """
+    session = {
+        'archive': os.path.abspath(archive_path),
+        'header': {name: np.asarray(value).tolist() for name, value in header.items()},
+        'plc_cycle_s': float(plc_cycle_s),
+        'monotonic_origin': float(monotonic_origin),
+        'keep': int(keep),
+    }
+    if last_frame is not None:
+        registers, t_received, timebase_state = last_frame
+        session['last_frame'] = {
+            't': float(t_received),
+            'words': [int(word) for word in registers],
+            'timebase': timebase_state,
+        }
+    return session
+
+
+def journal_frames(directory):
+    """Кадры журнала испытания по порядку (неполные записи сегментов отбрасываются)."""
+    blocks = []
+    for path in sorted(glob.glob(os.path.join(directory, '*' + JOURNAL_SUFFIX))):
+        try:
+            _, frames = read_frames(path)
+        except (OSError, ValueError):
+            logger.warning("Сегмент журнала пропущен: %s", path)
+            continue
+        blocks.append(np.array(frames))
+    if not blocks:
+        return np.zeros(0, dtype=FRAME_DTYPE)
+    return np.concatenate(blocks)
+
+
+def replay_session(session, frames):
+    """Записи архива (``ARCHIVE_DTYPE``), восстановленные по кадрам журнала."""
+    plc_cycle_s = session['plc_cycle_s']
+    origin = session['monotonic_origin']
+    keep = session['keep']
+    reader = PlcRingReader(plc_cycle_s)
+    timebase = SampleTimebase(plc_cycle_s)
+    last_frame = session.get('last_frame')
+    if last_frame is not None:
+        # Значения, полученные до начала испытания, в архив не входят
+        reader.read(RegisterFrame(last_frame['words']), last_frame['t'])
+        timebase.restore(last_frame['timebase'])
+    blocks = []
+    for t_received, words in zip(frames['t'], frames['words']):
+        t_received = float(t_received)
+        frame = RegisterFrame(words)
+        lost, new_values = reader.read(frame, t_received)
+        stamps = timebase.assign(lost + new_values.size, t_received, keep=keep)
+        if stamps.size == 0:
+            continue
+        block = np.empty(stamps.size, dtype=ARCHIVE_DTYPE)
+        block['t'] = stamps - origin
+        block['torque'] = GAP_MARKER
+        block['torque'][stamps.size - new_values.size:] = new_values
+        block['di'] = frame.di
+        block['angle'] = frame.angle
+        blocks.append(block)
+    if not blocks:
+        return np.zeros(0, dtype=ARCHIVE_DTYPE)
+    return np.concatenate(blocks)
+
+
+def recover_session(directory):
+    """Восстановить архив испытания по журналу ``directory``; вернуть имя файла архива.
+
+    Архив переписывается по журналу, если в журнале больше значений, чем в
+    файле; сводки строятся заново. Журнал удаляется.
+    """
+    with open(os.path.join(directory, JOURNAL_MANIFEST), encoding='utf-8') as f:
+        session = json.load(f)
+    path = session['archive']
+    records = replay_session(session, journal_frames(directory))
+    try:
+        existing_count = ArchiveReader(path).size
+    except (OSError, ValueError):
+        existing_count = -1
+    if records.size > existing_count:
+        header = session['header']
+        calibration = TorqueCalibration(
+            dict(zip(CALIBRATION_KEYS, header['calibration'][:-1])), header['calibration'][-1])
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        writer = ArchiveWriter(path, header, summaries=SummaryWriter(path, calibration, header['angle_scale']))
+        writer.start()
+        writer.append(records['t'], records['torque'], records['di'], records['angle'])
+        writer.stop()
+    else:
+        # Архив полон, но сводки могли не дойти до диска
+        for period in SUMMARY_PERIODS:
+            if os.path.exists(summary_path(path, period)):
+                os.remove(summary_path(path, period))
+        build_summaries(path)
+    shutil.rmtree(directory, ignore_errors=True)
+    logger.warning("Испытание восстановлено по журналу: %s, значений %d",
+                   path, max(records.size, existing_count))
+    return path
+
+
+def recover_journals(directory):
+    """Восстановить все прерванные испытания из каталога журналов; вернуть имена архивов."""
+    recovered = []
+    for manifest in sorted(glob.glob(os.path.join(directory, '*', JOURNAL_MANIFEST))):
+        session_dir = os.path.dirname(manifest)
+        try:
+            recovered.append(recover_session(session_dir))
+        except (OSError, ValueError, KeyError) as e:
+            logger.error("Не удалось восстановить испытание по журналу %s: %s", session_dir, e)
+    return recovered
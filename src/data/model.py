@@ -18,6 +18,33 @@ from src.command_handler import CommandHandler
 from src.data.realtime_data import RealTimeData, Dyno
 
 
+def default_write_registers(calib_coeff=None):
+    """Начальные значения регистров для записи в ПЛК.
+
+    Коэффициенты модели датчика момента берутся из ``calib_coeff``
+    (раздел ``calibration`` конфигурации), без него - линейная модель 1:1.
+    """
+    if calib_coeff is not None:
+        cc_lo = [calib_coeff["A1"], calib_coeff["B1"], calib_coeff["C1"]]
+        cc_hi = [calib_coeff["A2"], calib_coeff["B2"]]
+    else:
+        cc_lo = [0.0, 1.0, 0.0]
+        cc_hi = [1.0, 0.0]
+    return {
+        'Modbus_CTRL':      0,          # Управление режимом стенда
+        'Modbus_TensionSV': 0,          # Задание момента на валу
+        'Modbus_VelocitySV':0,          # Задание скорости сервопривода
+        'Modbus_DQ_CTRL':   0,          # Прямое управление дискретными выходами
+        'Modbus_UZ_CTRL':   0,          # Прямое управление сервоприводом
+        'Modbus_KP':        1.0,        # PID Kp
+        'Modbus_KI':        0.01,       # PID Ki
+        'Modbus_KD':        0.0,        # PID Kd
+        'Modbus_CC_LO':     cc_lo,      # Коэффициенты модели аппроксимации датчика момента (нижний поддиапазон)
+        'Modbus_CC_HI':     cc_hi,      # Коэффициенты модели аппроксимации датчика момента (верхний поддиапазон)
+        'Modbus_AUX':       0,          # Резерв
+    }
+
+
 class Model(QObject):
     """Central application model managing Modbus registers and signals.
 
@@ -45,35 +72,19 @@ class Model(QObject):
         """
         super(Model, self).__init__(parent)
         self.config = config
-        # Данные которые (пишем в/получаем из) регистров Modbus ПЛК с частотой опроса
-        self.realtime_data = RealTimeData(self.config, self)
+        self.calib_coeff = self.config.cfg.get("calibration") or None
+        # Регистры для записи в ПЛК
+        self.modbus_write_regs = default_write_registers(self.calib_coeff)
+        self.cc_lo = self.modbus_write_regs['Modbus_CC_LO']
+        self.cc_hi = self.modbus_write_regs['Modbus_CC_HI']
+
+        # Данные которые (пишем в/получаем из) регистров Modbus ПЛК с частотой опроса;
+        # блок записи сразу заполняется начальными значениями регистров
+        self.realtime_data = RealTimeData(self.config, self, write_defaults=self.modbus_write_regs)
         self.dyno_data = Dyno(self.config)
         self.command_handler = CommandHandler(self)
         self.realtime_data.data_updated.connect(self.rt_data_changed)
 
-        self.calib_coeff = self.config.cfg.get("calibration") or None
-        if self.calib_coeff is not None:
-            self.cc_lo = [self.calib_coeff["A1"], self.calib_coeff["B1"], self.calib_coeff["C1"]]
-            self.cc_hi = [self.calib_coeff["A2"], self.calib_coeff["B2"]]
-        else:
-            self.cc_lo = [0.0, 1.0, 0.0]
-            self.cc_hi = [1.0, 0.0]
-
-        # Регистры для записи в ПЛК
-        self.modbus_write_regs = {
-            'Modbus_CTRL':      0,          # Управление режимом стенда
-            'Modbus_TensionSV': 0,          # Задание момента на валу
-            'Modbus_VelocitySV':0,          # Задание скорости сервопривода
-            'Modbus_DQ_CTRL':   0,          # Прямое управление дискретными выходами
-            'Modbus_UZ_CTRL':   0,          # Прямое управление сервоприводом
-            'Modbus_KP':        1.0,        # PID Kp
-            'Modbus_KI':        0.01,       # PID Ki
-            'Modbus_KD':        0.0,        # PID Kd
-            'Modbus_CC_LO':     self.cc_lo, # Коэффициенты модели аппроксимации датчика момента (нижний поддиапазон)
-            'Modbus_CC_HI':     self.cc_hi, # Коэффициенты модели аппроксимации датчика момента (верхний поддиапазон)
-            'Modbus_AUX':       0,          # Резерв
-        }
-
     @Slot(list)
     def rt_data_changed(self, registers):
         """Handle updates from real-time data polls.
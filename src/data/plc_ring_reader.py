@@ -0,0 +1,99 @@
+"""Чтение буфера значений момента ПЛК с контролем потерь.
+
+ПЛК записывает значение датчика момента каждые 4 мс в буфер из
+``BUFFER_LENGTH`` слов, упорядоченный по времени (последнее слово - самое
+свежее), и считает записанные значения по модулю ``BUFFER_LENGTH``.
+Смещение указателя между двумя опросами само по себе неоднозначно: при
+паузе опроса длиннее BUFFER_LENGTH * 4 мс буфер успевает обернуться, и часть
+значений перезаписывается. Число обёрток оценивается по времени между
+опросами; потерянные значения заменяются маркерами разрыва.
+
+Маркер разрыва - наименьшее значение int16 (-32768); чтобы он был
+однозначным, такое показание ПЛК (отрицательный предел шкалы) принимается
+как -32767.
+"""
+
+import logging
+
+import numpy as np
+
+from src.data.register_frame import BUFFER_LENGTH
+
+# Маркер разрыва в целочисленном канале момента (в float-каналах - NaN)
+GAP_MARKER = np.iinfo(np.int16).min
+
+logger = logging.getLogger(__name__)
+
+
+class PlcRingReader:
+    """Выделение новых значений из буфера ПЛК и учёт потерь.
+
+    Parameters
+    ----------
+    sample_period_s: float
+        Период записи значений в буфер ПЛК, с.
+    buffer_length: int
+        Размер буфера ПЛК.
+    """
+
+    def __init__(self, sample_period_s, buffer_length=BUFFER_LENGTH):
+        self.sample_period_s = float(sample_period_s)
+        self.buffer_length = int(buffer_length)
+        self.prev_index = None
+        self.prev_time = None
+        # Счётчики для контроля пропускной способности
+        self.samples_received = 0   # принято значений
+        self.samples_lost = 0       # потеряно значений (перезаписаны в ПЛК)
+        self.overrun_events = 0     # число переполнений буфера ПЛК
+
+    def read(self, frame, t):
+        """Обработать очередной кадр.
+
+        Parameters
+        ----------
+        frame: RegisterFrame
+            Декодированный блок регистров.
+        t: float
+            Время получения кадра (``time.monotonic()``), с.
+
+        Returns
+        -------
+        tuple[int, numpy.ndarray]
+            Количество потерянных значений перед новыми и новые значения
+            буфера в хронологическом порядке (представление, если среди них
+            нет значения ``GAP_MARKER``).
+        """
+        length = self.buffer_length
+        lost = 0
+        if self.prev_index is None:
+            # Первый кадр: весь буфер - уже накопленная история
+            produced = length
+        else:
+            offset = (frame.index - self.prev_index) % length
+            # Сколько значений ПЛК должен был записать за время между опросами
+            expected = (t - self.prev_time) / self.sample_period_s
+            if offset == 0 and expected < length:
+                # Указатель не сдвинулся, и на полный оборот буфера времени не
+                # хватило: ПЛК не пишет значения (STOP, задача датчика остановлена)
+                wraps = 0
+            else:
+                # Число полных обёрток буфера, наиболее согласующееся с этим временем
+                wraps = max(0, int(np.floor((expected - offset) / length + 0.5)))
+            produced = offset + wraps * length
+            if produced > length:
+                lost = produced - length
+                produced = length
+                self.samples_lost += lost
+                self.overrun_events += 1
+                logger.warning(
+                    "Переполнение буфера ПЛК: потеряно %d значений "
+                    "(интервал между опросами %.0f мс)",
+                    lost, (t - self.prev_time) * 1000.0,
+                )
+        self.prev_index = frame.index
+        self.prev_time = t
+        self.samples_received += produced
+        values = frame.torque[length - produced:]
+        if values.size and values.min() == GAP_MARKER:
+            values = np.maximum(values, GAP_MARKER + 1)
+        return lost, values
@@ -0,0 +1,181 @@
+"""Многоуровневое хранилище агрегатов потока (min/max/mean) для длинной истории.
+
+Сырые значения хранятся в кольцевом буфере ограниченной длины (минуты).
+Рядом с ним ``MinMaxPyramid`` держит агрегаты того же потока с прореживанием
+x16, x256 и x4096: для каждой группы отсчётов - минимум, максимум, среднее,
+число действительных отсчётов и метку времени последнего отсчёта группы.
+Агрегаты обновляются по мере поступления значений: уровень x16 собирается из
+сырых значений, каждый следующий - из готовых групп предыдущего, незавершённая
+группа переносится между вызовами.
+
+Часы истории занимают единицы мегабайт, а выборка любого масштаба для графика
+стоит O(число точек): выбирается самый подробный уровень, у которого на
+запрошенный интервал приходится не больше заданного числа групп.
+
+Разрывы данных передаются как NaN и в агрегатах не учитываются; группа,
+целиком состоящая из разрыва, получает NaN.
+"""
+
+import math
+import threading
+
+import numpy as np
+
+from src.data.ring_buffer import RingBuffer
+
+PYRAMID_FACTORS = (16, 256, 4096)     # прореживание уровней относительно сырых значений
+
+
+def _search(segments, value):
+    """Индекс первого элемента ``>= value`` в отсортированной паре сегментов."""
+    older, newer = segments
+    if older.size and older[-1] >= value:
+        return int(np.searchsorted(older, value, side='left'))
+    return older.size + int(np.searchsorted(newer, value, side='left'))
+
+
+def _take(segments, start, end):
+    """Копия элементов ``[start, end)`` пары сегментов в хронологическом порядке."""
+    older, newer = segments
+    split = older.size
+    return np.concatenate((older[start:end], newer[max(0, start - split):max(0, end - split)]))
+
+
+class _Level:
+    """Один уровень агрегатов: кольцевые буферы групп и незавершённая группа."""
+
+    def __init__(self, factor, ratio, capacity):
+        self.factor = factor        # сырых отсчётов в группе
+        self.ratio = ratio          # групп предыдущего уровня (или отсчётов) в группе
+        self.t = RingBuffer(capacity, np.float64, fill=np.nan)
+        self.min = RingBuffer(capacity, np.float32, fill=np.nan)
+        self.max = RingBuffer(capacity, np.float32, fill=np.nan)
+        self.mean = RingBuffer(capacity, np.float32, fill=np.nan)
+        self.count = RingBuffer(capacity, np.uint16)
+        self._pending = None        # элементы незавершённой группы
+
+    def push(self, t, vmin, vmax, vsum, count):
+        """Добавить элементы источника; вернуть завершённые группы (или ``None``)."""
+        if self._pending is not None:
+            t, vmin, vmax, vsum, count = (
+                np.concatenate((p, a)) for p, a in zip(self._pending, (t, vmin, vmax, vsum, count))
+            )
+            self._pending = None
+        ratio = self.ratio
+        groups = t.size // ratio
+        end = groups * ratio
+        if end < t.size:
+            self._pending = tuple(a[end:].copy() for a in (t, vmin, vmax, vsum, count))
+        if not groups:
+            return None
+        shape = (groups, ratio)
+        g_t = t[ratio - 1:end:ratio]
+        g_min = np.fmin.reduce(vmin[:end].reshape(shape), axis=1)
+        g_max = np.fmax.reduce(vmax[:end].reshape(shape), axis=1)
+        g_sum = vsum[:end].reshape(shape).sum(axis=1)
+        g_count = count[:end].reshape(shape).sum(axis=1)
+        g_mean = np.full(groups, np.nan)
+        np.divide(g_sum, g_count, out=g_mean, where=g_count > 0)
+        self.t.extend(g_t)
+        self.min.extend(g_min)
+        self.max.extend(g_max)
+        self.mean.extend(g_mean)
+        self.count.extend(g_count)
+        return g_t, g_min, g_max, g_sum, g_count
+
+    def clear(self):
+        self.t.clear(np.nan)
+        self.min.clear(np.nan)
+        self.max.clear(np.nan)
+        self.mean.clear(np.nan)
+        self.count.clear()
+        self._pending = None
+
+
+class MinMaxPyramid:
+    """Агрегаты потока значений на нескольких уровнях прореживания.
+
+    Запись (``extend``) выполняется потоком обработки данных, чтение
+    (``fetch``) - потоком GUI, поэтому доступ защищён блокировкой;
+    ``fetch`` возвращает копии.
+
+    Parameters
+    ----------
+    sample_rate: float
+        Частота сырых значений, Гц.
+    history_s: float
+        Длительность хранимой истории, с (определяет ёмкость уровней).
+    factors: tuple[int, ...]
+        Прореживание уровней; каждый следующий - кратен предыдущему.
+    """
+
+    def __init__(self, sample_rate, history_s, factors=PYRAMID_FACTORS):
+        self.sample_rate = float(sample_rate)
+        self.history_s = float(history_s)
+        self.levels = []
+        previous = 1
+        for factor in factors:
+            if factor % previous:
+                raise ValueError(f"Прореживание {factor} не кратно {previous}")
+            capacity = max(1, math.ceil(self.history_s * self.sample_rate / factor))
+            self.levels.append(_Level(factor, factor // previous, capacity))
+            previous = factor
+        self._lock = threading.Lock()
+
+    @property
+    def factors(self):
+        return tuple(level.factor for level in self.levels)
+
+    def extend(self, times, values):
+        """Добавить сырые значения ``values`` (NaN - разрыв) с метками ``times``."""
+        values = np.asarray(values, dtype=np.float64)
+        times = np.asarray(times, dtype=np.float64)
+        if values.size == 0:
+            return
+        valid = ~np.isnan(values)
+        block = (times, values, values, np.where(valid, values, 0.0), valid.astype(np.int64))
+        with self._lock:
+            for level in self.levels:
+                block = level.push(*block)
+                if block is None:
+                    break
+
+    def fetch(self, t_from, t_to=None, max_buckets=None):
+        """Агрегаты за интервал ``[t_from, t_to)`` самого подробного подходящего уровня.
+
+        Выбирается первый уровень, у которого на интервал приходится не больше
+        ``max_buckets`` групп (если такого нет - самый грубый). Поиск границ -
+        двоичный, копируется только найденный участок.
+
+        Returns
+        -------
+        tuple[int, numpy.ndarray, ...] | None
+            ``(factor, t, min, max, mean)`` - прореживание уровня и копии
+            массивов групп, либо ``None``, если за интервал групп нет.
+        """
+        with self._lock:
+            chosen = None
+            for level in self.levels:
+                segments = level.t.segments()
+                if segments[0].size == 0:
+                    continue
+                start = _search(segments, t_from)
+                end = _search(segments, t_to) if t_to is not None else sum(a.size for a in segments)
+                chosen = (level, start, end)
+                if max_buckets is None or end - start <= max_buckets:
+                    break
+            if chosen is None:
+                return None
+            level, start, end = chosen
+            if end <= start:
+                return None
+            return (level.factor,) + tuple(
+                _take(buffer.segments(), start, end)
+                for buffer in (level.t, level.min, level.max, level.mean)
+            )
+
+    def clear(self):
+        """Удалить всю историю."""
+        with self._lock:
+            for level in self.levels:
+                level.clear()
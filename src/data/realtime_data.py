@@ -4,12 +4,15 @@
 # установленным в переменной poll_interval.
 # Обмен с ПЛК стенда происходит только в данном модуле.
 import logging
+import math
+import os
 import time
-from ctypes import c_short, c_int, c_uint
 
 import numpy as np
 from PyQt6.QtCore import (
     Qt,
+    QCoreApplication,
+    QMetaObject,
     QThread,
     QTimer,
     QObject,
@@ -17,37 +20,57 @@ from PyQt6.QtCore import (
     pyqtSlot as Slot,
 )
 import asyncio
-from pymodbus.client import ModbusTcpClient
 from pymodbus.client import AsyncModbusTcpClient
 from pymodbus.exceptions import ModbusException
+from src.data.archive import ArchiveWriter, archive_name
+from src.data.archive_index import SummaryWriter
 from src.data.dyno import SerialHandler
-from src.command_handler import float_to_words, words_to_float
-
-READ_BUFFER_SIZE = 110
-BUFFER_LENGTH = 50          # размер буфера данных от ПЛК
-DI_ADDRESS = 0
-ADC_ADDRESS = 1
-ANGLE_ADDRESS = 2
-DQ_ADDRESS = 4
-STATE_ADDRESS = 5
-BUFFER_ADDRESS = 10
-INDEX_ADDRESS = 60
-WRITE_BUFFER_ADDRESS = 111
-
-BUF_START = BUFFER_ADDRESS
-BUF_END = BUFFER_ADDRESS + BUFFER_LENGTH
+from src.data.frame_log import FrameRecorder
+from src.data.journal import FSYNC_INTERVAL_S, FrameJournal, archive_session, recover_journals
+from src.data.plc_ring_reader import GAP_MARKER, PlcRingReader
+from src.data.pyramid import MinMaxPyramid
+from src.data.channels import ChannelStore, realtime_channels
+from src.data.calibration import CALIBRATION_THRESHOLD, TorqueCalibration
+from src.data.derivative import IIR_TAU_S, SAVGOL_ORDER, SAVGOL_WINDOW, StreamingDerivative
+from src.data.timebase import SampleTimebase
+from src.data.snapshot import RealTimeSnapshot
+from src.data.write_registers import WriteRegisters
+from src.data.register_frame import (
+    READ_BUFFER_SIZE,
+    ANGLE_SCALE,
+    TORQUE_SCALE,
+    WRITE_BUFFER_ADDRESS,
+    RegisterFrame,
+)
 
 REALTIME_DATA_WINDOW = 1    # временное окно для хранения данных (мин)
+HISTORY_HOURS = 4           # длительность истории агрегатов момента (ч)
 PLC_POLLING_INTERVAL = 4    # интервал опроса датчиков контроллером (мс)
-DATA_STORAGE_LEN = REALTIME_DATA_WINDOW * 60 * 1000 / PLC_POLLING_INTERVAL
-DATA_STORAGE_END_INDX = DATA_STORAGE_LEN - BUFFER_LENGTH - 1 # Последний индекс, куда можно писать (с учетом размера буфера)
 
 class ModbusPoller(QObject):
     """Background worker handling Modbus communication.
     Фоновый рабочий объект, управляющий обменом по Modbus.
+
+    В режиме постоянного соединения (``modbus.persistent_connection``) клиент
+    Modbus и цикл событий asyncio создаются один раз и живут в потоке опроса
+    всё время работы; переподключение выполняется только после ошибки обмена.
+    Иначе на каждый тик создаётся новый цикл событий и новое соединение.
+
+    В ПЛК передаются только изменённые слова блока записи (минимальный
+    непрерывный участок); если изменений нет, выполняется обычное чтение.
+
+    Срочные команды (движение, останов, слово управления) принимает слот
+    ``send_urgent``: они записываются в ПЛК сразу, по уже открытому соединению,
+    между плановыми опросами. Задержка от выдачи команды до подтверждения
+    записи ПЛК публикуется сигналом ``command_latency``. Остальные изменения
+    принимает слот ``send_registers``; оба слота работают в потоке опроса, так
+    что изменения попадают в блок записи в порядке выдачи команд, а срочная
+    запись забирает и все изменённые до неё слова.
     """
-    data_received = Signal(list)
+    data_received = Signal(list, float)     # (регистры, время получения по time.monotonic())
     connection_status = Signal(bool)
+    cycle_time = Signal(float)      # время цикла запрос-ответ (RTT), мс
+    command_latency = Signal(float) # задержка срочной команды до подтверждения ПЛК, мс
 
     def __init__(self, data_set):
         """Initialize poller with a reference to the data set.
@@ -58,7 +81,14 @@ class ModbusPoller(QObject):
         self.data_set = data_set
         self.cfg = self.data_set.config
         self.client = None
-        self.poll_interval = self.cfg.get('modbus', 'poll_interval', 100)
+        self.loop = None
+        self.connected = False
+        self.persistent = self.cfg.get('modbus', 'persistent_connection', True)
+        self.poll_interval = self.cfg.get('modbus', 'poll_interval_ms', 100)
+        self.last_cycle_time = 0.0  # RTT последнего успешного обмена, мс
+        self.last_command_latency = 0.0     # задержка последней срочной команды, мс
+        self._urgent_issued = None          # время выдачи самой ранней неотправленной срочной команды
+        self._urgent_scheduled = False
         self.result = None
         self.read_holding_register_address = 0      # Начальный адрес регистра для чтения
         self.registers_number = READ_BUFFER_SIZE    # Количество регистров для чтения
@@ -79,20 +109,134 @@ class ModbusPoller(QObject):
         else:
             self.connection_status.emit(False)
 
+        span = self.data_set.write_registers.take_dirty_span()
         try:
-            response = await self.client.readwrite_registers(
-                read_address=self.read_holding_register_address,
-                read_count=self.registers_number,
-                write_address=WRITE_BUFFER_ADDRESS,
-                values= self.data_set.write_regs,
-            )
+            response = await self._exchange(span)
         except ModbusException as e:
             logging.error(f"Modbus error: {e}")
         finally:
-            if response is not None:
-                self.data_received.emit(response.registers)
+            if response is None or response.isError():
+                self._restore_span(span)
+            else:
+                self.data_received.emit(response.registers, time.monotonic())
             self.client.close()
 
+    async def poll_modbus_persistent(self):
+        """Один цикл обмена через постоянное соединение."""
+        if self.client is None:
+            self.init_modbus()
+        if not self.client.connected:
+            await self.client.connect()
+            self._set_connected(self.client.connected)
+            if not self.connected:
+                return
+            # После (пере)подключения состояние ПЛК неизвестно - передаём блок записи
+            # целиком: начальные значения регистров с учётом всех изменений
+            self.data_set.write_registers.reset()
+
+        span = self.data_set.write_registers.take_dirty_span()
+        t_start = time.perf_counter()
+        try:
+            response = await self._exchange(span)
+        except ModbusException as e:
+            logging.error(f"Modbus error: {e}")
+            # Соединение считаем потерянным: на следующем тике подключаемся заново
+            self.client.close()
+            self._set_connected(False)
+            self._restore_span(span)
+            return
+        if response.isError():
+            logging.error(f"Modbus error response: {response}")
+            self._restore_span(span)
+            return
+
+        t_received = time.monotonic()
+        self.last_cycle_time = (time.perf_counter() - t_start) * 1000.0
+        self.cycle_time.emit(self.last_cycle_time)
+        self.data_received.emit(response.registers, t_received)
+
+    async def _exchange(self, span):
+        """Прочитать блок регистров, записав участок изменённых слов (если есть)."""
+        if span is None:
+            return await self.client.read_holding_registers(
+                self.read_holding_register_address,
+                count=self.registers_number,
+            )
+        offset, values = span
+        return await self.client.readwrite_registers(
+            read_address=self.read_holding_register_address,
+            read_count=self.registers_number,
+            write_address=WRITE_BUFFER_ADDRESS + offset,
+            values=values,
+        )
+
+    def _restore_span(self, span):
+        """Вернуть неотправленный участок для передачи в следующем цикле."""
+        if span is not None:
+            offset, values = span
+            self.data_set.write_registers.mark_dirty(offset, len(values))
+
+    async def write_urgent(self, t_issued):
+        """Записать в ПЛК изменённые слова вне цикла опроса."""
+        span = self.data_set.write_registers.take_dirty_span()
+        if span is None:
+            return
+        offset, values = span
+        try:
+            response = await self.client.write_registers(WRITE_BUFFER_ADDRESS + offset, values)
+        except ModbusException as e:
+            logging.error(f"Modbus error: {e}")
+            self.client.close()
+            self._set_connected(False)
+            self._restore_span(span)
+            return
+        if response.isError():
+            logging.error(f"Modbus error response: {response}")
+            self._restore_span(span)
+            return
+        self.last_command_latency = (time.perf_counter() - t_issued) * 1000.0
+        logging.debug(f"Срочная команда записана в ПЛК за {self.last_command_latency:.1f} мс")
+        self.command_latency.emit(self.last_command_latency)
+
+    @Slot(dict)
+    def send_registers(self, regs):
+        """Принять изменённые регистры ``{имя: значение}`` для передачи со следующим опросом."""
+        self.data_set.write_registers.update(regs)
+
+    @Slot(dict, float)
+    def send_urgent(self, regs, t_issued):
+        """Принять срочную команду.
+
+        Parameters
+        ----------
+        regs: dict
+            Изменённые регистры ``{имя: значение}``.
+        t_issued: float
+            Время выдачи команды (``time.perf_counter()``).
+        """
+        # Участок записи охватывает и ожидающие передачи изменения предыдущих
+        # команд: ПЛК получает их одной записью, не позже этой команды
+        self.data_set.write_registers.update(regs)
+        if self._urgent_issued is None:
+            self._urgent_issued = t_issued
+        # Команды, пришедшие подряд (например, останов и сброс скорости),
+        # отправляются одной записью
+        if not self._urgent_scheduled:
+            self._urgent_scheduled = True
+            QTimer.singleShot(0, self.flush_urgent)
+
+    @Slot()
+    def flush_urgent(self):
+        """Отправить накопленные срочные команды."""
+        self._urgent_scheduled = False
+        t_issued, self._urgent_issued = self._urgent_issued, None
+        if t_issued is None:
+            return
+        # Без открытого соединения команды уйдут в ПЛК со следующим опросом
+        if not self.persistent or not self.connected or self.loop is None:
+            return
+        self.loop.run_until_complete(self.write_urgent(t_issued))
+
     def init_modbus(self):
         # Настройка Modbus клиента на основе конфигурации
         host = self.cfg.get('modbus', 'host', '127.0.0.1')
@@ -100,20 +244,106 @@ class ModbusPoller(QObject):
         timeout = self.cfg.get('modbus', 'timeout', 1.0)
         self.client = AsyncModbusTcpClient(host, port=port, timeout=timeout)
 
+    def _set_connected(self, connected):
+        """Зафиксировать состояние соединения, сообщая только об изменениях."""
+        if connected != self.connected:
+            self.connected = connected
+            self.connection_status.emit(connected)
+
+    @Slot()
+    def reset_connection(self):
+        """Закрыть постоянное соединение (например, после смены настроек).
+
+        Новый клиент с актуальными параметрами будет создан на следующем тике.
+        """
+        if self.client is not None:
+            self.client.close()
+            self.client = None
+        self._set_connected(False)
+
     @Slot()
     # Обработчик таймера опроса
     def on_timer(self):
-        asyncio.run(self.poll_modbus())
+        if not self.persistent:
+            asyncio.run(self.poll_modbus())
+            return
+        # Цикл событий создаётся один раз в потоке опроса и далее переиспользуется
+        if self.loop is None:
+            self.loop = asyncio.new_event_loop()
+        self.loop.run_until_complete(self.poll_modbus_persistent())
+
+
+class ReplayPoller(QObject):
+    """Воспроизведение записанных кадров вместо опроса ПЛК.
+
+    Кадры из ``ReplayDataSource`` передаются в ``RealTimeData.update`` тем же
+    путём, что и от ``ModbusPoller``. Соединение блокирующее: при
+    воспроизведении без ограничения скорости источник не опережает обработку.
+    """
+    data_received = Signal(list, float)
+    finished = Signal()
+
+    def __init__(self, data_set, source):
+        QObject.__init__(self)
+        self.data_set = data_set
+        self.source = source
+        self.frames_played = 0
+        self._running = False
+        self.data_received.connect(
+            self.data_set.update, Qt.ConnectionType.BlockingQueuedConnection
+        )
+
+    @Slot()
+    def run(self):
+        """Воспроизвести запись целиком (выполняется в потоке воспроизведения)."""
+        self._running = self.source.connect()
+        t_start = time.perf_counter()
+        while self._running:
+            frame = self.source.read_data()
+            if not frame:
+                break
+            self.data_received.emit(frame['registers'], frame['t'])
+            self.frames_played += 1
+        elapsed = time.perf_counter() - t_start
+        logging.info(
+            f"Воспроизведение завершено: кадров {self.frames_played} за {elapsed:.2f} с"
+            f" ({self.frames_played / max(elapsed, 1e-9):.0f} кадров/с)"
+        )
+        self.source.disconnect()
+        self._running = False
+        self.finished.emit()
+
+    def stop(self):
+        """Прервать воспроизведение (можно вызывать из любого потока)."""
+        self._running = False
 
 
 class RealTimeData(QObject):
-    """Хранение и обработка данных, получаемых по Modbus."""
+    """Хранение и обработка данных, получаемых по Modbus.
+
+    Объект работает в собственном потоке обработки (``processing_thread``):
+    декодирование, запись в буферы и расчёты не конкурируют с отрисовкой GUI.
+    Интерфейс получает неизменяемые снимки ``RealTimeSnapshot`` не чаще, чем
+    раз в ``ui.poll_interval_ms``: через сигнал ``snapshot_ready`` или
+    атрибут ``snapshot``.
+    """
 
     data_updated = Signal(list)
+    snapshot_ready = Signal(object)
+    connection_settings_changed = Signal()
+    archive_start_requested = Signal(str)   # имя файла архива ('' - по умолчанию)
+    archive_stop_requested = Signal()
+    journal_recovery_requested = Signal()
+    journals_recovered = Signal(list)       # имена архивов, восстановленных по журналу
     prev_time = 0
 
-    def __init__(self, config, parent=None):
-        """Инициализация параметров и запуск рабочего потока."""
+    def __init__(self, config, parent=None, write_defaults=None):
+        """Инициализация параметров и запуск рабочего потока.
+
+        ``write_defaults`` - начальные значения регистров записи в ПЛК
+        ``{имя: значение}`` (``Model.modbus_write_regs``): они передаются
+        первой же записью и после каждого переподключения.
+        """
         QObject.__init__(self)
         self.config = config
 
@@ -121,37 +351,58 @@ class RealTimeData(QObject):
         self.poll_interval = self.config.get('modbus', 'poll_interval_ms', 100)
         # период опроса в секундах
         self.poll_interval_s = float(self.poll_interval) / 1000.0
-        # Длина массива данных с учётом интервала опроса датчиков
-        self.data_window_length = int(DATA_STORAGE_LEN)
+        # период публикации снимков данных для интерфейса, в секундах
+        self.snapshot_interval_s = self.config.get('ui', 'poll_interval_ms', 100) / 1000.0
 
         # Слово состояния дискретных сигналов от ПЛК
         self.in_status = 0x00
 
-        # данные от датчика угла поворота, в градусах
-        self.angle_data = np.zeros(self.data_window_length, dtype=np.int32)
-
-        # Данные от датчика угла поворота (преобразованные, в градусах)
-        self.angle_data_c = np.zeros(self.data_window_length, dtype=np.float16)
-
-        # данные от датчика крутящего момента, RAW АЦП
-        self.torque_data = np.zeros(self.data_window_length, dtype=np.int16)
-
-        # данные от датчика крутящего момента, масштабированные 500:1 (25000 = 50 Нм)
-        self.torque_data_scaled = np.zeros(self.data_window_length, dtype=np.int16)
-
-        # Данные от датчика крутящего момента (преобразованные к Нм)
-        self.torque_data_c = np.zeros(self.data_window_length, dtype=np.float32)
-
-        # Скорость нарастания момента (моментальные значения в Нм/с)
-        self.velocity_data = np.zeros(self.data_window_length, dtype=np.float16)
-
-        # временные метки для потока данных, в мс
-        self.times = np.zeros(self.data_window_length, dtype=np.int64)
-        self.ptr = 0  # Указатель текущей позиции данных
-        self.curr_index = 0
-        self.prev_index = 0
-        self.index_offset = 0
-        self.head = 0
+        # Период цикла ПЛК (для имитатора с ускорением - период в реальном времени)
+        self.plc_cycle_s = self.config.get('modbus', 'plc_cycle_ms', PLC_POLLING_INTERVAL) / 1000.0
+
+        # Каналы реального времени (см. src.data.channels): буферы на окно
+        # REALTIME_DATA_WINDOW выделяются по реестру с типами хранения каналов:
+        # torque - момент ПЛК int16 (500:1), torque_time - метки значений момента, с,
+        # torque_rate - скорость нарастания момента, Нм/с (NaN - разрыв или разгон фильтра);
+        # по опросам: poll_time - время получения кадра, tension - момент, Нм,
+        # angle - угол int32 (768:1)
+        self.channels = ChannelStore(
+            realtime_channels(1.0 / self.plc_cycle_s, 1.0 / self.poll_interval_s),
+            REALTIME_DATA_WINDOW * 60.0,
+        )
+        logging.info("Каналы реального времени, %.1f МБ:\n  %s",
+                     self.channels.nbytes / 2**20, "\n  ".join(self.channels.describe()))
+
+        # Калибровка значений момента (таблица int16 -> Нм по коэффициентам calibration.*)
+        self.calibration = TorqueCalibration(
+            self.config.cfg.get('calibration'),
+            self.config.get('calibration', 'threshold', CALIBRATION_THRESHOLD),
+        )
+
+        # Чтение буфера значений момента ПЛК с контролем потерь
+        self.ring_reader = PlcRingReader(self.plc_cycle_s)
+
+        # Временная шкала потока момента: метка каждого значения канала torque, с
+        # (от начала датасета, по time.monotonic()); восстанавливается по номеру
+        # значения и циклу ПЛК с подстройкой под часы ПК
+        self.timebase = SampleTimebase(self.plc_cycle_s)
+
+        # Длинная история момента (Нм): агрегаты min/max/mean с прореживанием
+        # x16, x256, x4096 - часы данных в ограниченной памяти
+        history_hours = self.config.get('history', 'hours', HISTORY_HOURS)
+        self.torque_history = MinMaxPyramid(1.0 / self.plc_cycle_s, history_hours * 3600.0)
+
+        # Расчёт скорости нарастания момента по потоку значений (фильтр - velocity.*)
+        self.velocity_filter = StreamingDerivative(
+            1.0 / self.plc_cycle_s,
+            kind=self.config.get('velocity', 'filter', 'savgol'),
+            window=self.config.get('velocity', 'window', SAVGOL_WINDOW),
+            order=self.config.get('velocity', 'order', SAVGOL_ORDER),
+            tau_s=self.config.get('velocity', 'tau_ms', IIR_TAU_S * 1000.0) / 1000.0,
+        )
+
+        self.time_origin = time.time()              # Начальная временная метка для датасета
+        self.monotonic_origin = time.monotonic()    # То же в шкале time.monotonic()
 
         # Текущие значения датчиков (данные ПЛК)
         self.tension_adc = 0        # Данные АЦП датчика момента
@@ -160,7 +411,20 @@ class RealTimeData(QObject):
         self.angle = 0              # Угол поворота в градусах нескорректированный
         self.velocity = 0           # Скорость нарастания момента
 
-        self.write_regs = [0x00] * 30 # 30 регистров для записи в ПЛК
+        # 30 регистров для записи в ПЛК (передаются только изменённые);
+        # заполняются до запуска опроса, чтобы первая запись не несла нули
+        self.write_registers = WriteRegisters(defaults=write_defaults)
+
+        # Снимок данных для интерфейса
+        self.registers = []
+        self.snapshot_seq = 0
+        self.snapshot = self._make_snapshot()
+        self._last_snapshot_time = 0.0
+
+        # Обработка данных выполняется в отдельном потоке, а не в потоке GUI
+        self.processing_thread = QThread()
+        self.moveToThread(self.processing_thread)
+        self.processing_thread.start()
 
         # Для обмена по Modbus создаем отдельный поток
         # переносим в отдельный поток
@@ -168,79 +432,139 @@ class RealTimeData(QObject):
         self.poller = ModbusPoller(self)
         self.poller_thread = QThread()
         self.poller.moveToThread(self.poller_thread)
+        self.connection_settings_changed.connect(self.poller.reset_connection)
         self.poller_thread.start()
 
-        self.time_origin = time.time()  # Начальная временная метка для датасета
+        # Испытания, прерванные сбоем, восстанавливаются в архив по журналу в потоке
+        # обработки, когда запустится цикл событий GUI: к этому времени подключены
+        # все получатели journals_recovered, а команды start_archive встанут в
+        # очередь после восстановления
+        self.recovered_archives = []
+        self.journal_recovery_requested.connect(self.recover_interrupted_tests, Qt.ConnectionType.QueuedConnection)
+        QTimer.singleShot(0, self.journal_recovery_requested.emit)
+
+        # Архив текущего испытания и его журнал (см. start_archive). В них пишутся
+        # кадры в потоке обработки, поэтому и создаются/закрываются они только
+        # там: команды из потока GUI передаются через очередь событий
+        self.archive = None
+        self.journal = None
+        self._last_frame = None     # последний кадр: (registers, t_received, состояние timebase)
+        self.archive_start_requested.connect(self.start_archive, Qt.ConnectionType.QueuedConnection)
+        self.archive_stop_requested.connect(self.stop_archive, Qt.ConnectionType.QueuedConnection)
+        app = QCoreApplication.instance()
+        if app is not None:
+            # При выходе поток GUI ждёт, пока архив будет закрыт в потоке обработки
+            # (invokeMethod на время ожидания отпускает GIL, нужный слоту)
+            app.aboutToQuit.connect(lambda: QMetaObject.invokeMethod(
+                self, 'stop_archive', Qt.ConnectionType.BlockingQueuedConnection))
+
+        # Запись «сырых» кадров регистров и воспроизведение записи вместо опроса ПЛК
+        self.recorder = None
+        self.replay = None
+        self.replay_thread = None
+        if self.config.get('recorder', 'enabled', False):
+            self.start_recording()
+        replay_file = self.config.get('replay', 'file')
+        if replay_file:
+            self.start_replay(replay_file, self.config.get('replay', 'speed', 1.0))
+
         self.prev_time = time.time()
 
     # Слот вызывается из ModbusPoller когда завершено получение новых данных от PLC
-    @Slot(list)
-    def update(self, registers):
+    @Slot(list, float)
+    def update(self, registers, t_received):
         """ Обновление данных по полученным регистрам."""
-        self._write_torque_buffer(registers)
-
-        self.times[self.ptr] = round((time.time() - self.time_origin) * 1000)
-        self.torque_data_c[self.ptr] = self.tension
-        self.angle_data_c[self.ptr] = self.get_real_angle(registers)
-        self.velocity_data[self.ptr] = 0 #self.get_real_velocity()
-        self.ptr += 1
-
-        # Если массив заполнен, сдвигаем данные
-        if self.ptr >= self.data_window_length:
-            self.times[:-1] = self.times[1:]
-            self.torque_data_c[:-1] = self.torque_data_c[1:]
-            self.angle_data_c[:-1] = self.angle_data_c[1:]
-            self.velocity_data[:-1] = self.velocity_data[1:]
-            self.ptr = self.data_window_length - 1
+        # Блок регистров декодируется один раз, далее используются типизированные поля
+        frame = RegisterFrame(registers)
+        self._write_torque_buffer(frame, t_received)
+
+        self.channels['poll_time'].append(round((t_received - self.monotonic_origin) * 1000))
+        self.channels['tension'].append(self.tension)
+        self.channels['angle'].append(np.uint32(frame.angle).astype(np.int32))
 
         # Фиксируем текущие данные от датчика момента
-        self.tension_adc = c_short(registers[1]).value
+        self.tension_adc = frame.adc
         self.tension_nc = self.get_real_tension_nc(self.tension_adc)
         self.tension = self.get_real_tension(self.tension_nc)
 
         # Фиксируем текущие данные от датчика угла
-        self.angle = self.get_real_angle(registers)
+        self.angle = self.get_real_angle(frame)
 
         # Фиксируем текущую скорость нарастания момента
-        self.velocity =  self.get_real_velocity() #self.velocity_data[self.ptr-1]
+        self.velocity = self.get_real_velocity()
 
         # Считываем состояние регистров
-        self.in_status = c_short(registers[0]).value
-        self.data_updated.emit(registers)
-
-    def _write_torque_buffer(self, registers):
-        """ Контроллер читает данные с датчика момента с периодом своего цикла 4 мс в кольцевой буфер размером BUFFER_LENGTH = 50
+        self.in_status = frame.di
+        self.registers = registers
+        self._last_frame = (registers, t_received, self.timebase.state())
+
+        # Интерфейсу передаём снимки с ограниченной частотой
+        # (допуск 10% - чтобы джиттер таймера опроса не пропускал снимки)
+        now = time.monotonic()
+        if now - self._last_snapshot_time >= 0.9 * self.snapshot_interval_s:
+            self._last_snapshot_time = now
+            self._publish_snapshot()
+
+    def _make_snapshot(self):
+        """Сформировать неизменяемый снимок текущего состояния."""
+        return RealTimeSnapshot(
+            seq=self.snapshot_seq,
+            registers=tuple(self.registers),
+            tension=self.tension,
+            tension_nc=self.tension_nc,
+            angle=self.angle,
+            velocity=float(self.velocity),
+            in_status=self.in_status,
+            torque_total=self.channels['torque'].total,
+            samples_received=self.ring_reader.samples_received,
+            samples_lost=self.ring_reader.samples_lost,
+            overrun_events=self.ring_reader.overrun_events,
+            sample_rate=self.timebase.sample_rate,
+        )
+
+    def _publish_snapshot(self):
+        """Опубликовать новый снимок для потока GUI."""
+        self.snapshot_seq += 1
+        self.snapshot = self._make_snapshot()
+        self.snapshot_ready.emit(self.snapshot)
+        self.data_updated.emit(self.registers)
+
+    def _write_torque_buffer(self, frame, t_received):
+        """ Контроллер читает данные с датчика момента с периодом своего цикла 4 мс в буфер размером BUFFER_LENGTH = 50
             АРМ читает ВЕСЬ буфер с периодом примерно 100 мс. Этот период в Windows плавает в пределах 50%
             поэтому буфер взят с запасом (50 значений, хотя всего за период 4 мс в среднем мы получаем 25 значений)
-            текущее смещение которое мы вычисляем каждый раз когда читаем буфер позволяет записывать значения
-            последовательно без пропусков и дублирования в локальный массив большого размера
+            В кольцевое хранилище дописываются только новые значения (см. PlcRingReader). Если между
+            опросами буфер ПЛК успел переполниться, перед новыми значениями записываются маркеры
+            разрыва GAP_MARKER по числу потерянных значений, чтобы сохранить временную шкалу.
+            Метки времени всех записанных значений (включая маркеры) пишутся в канал torque_time,
+            скорость нарастания момента по новым значениям - в torque_rate.
+            Во время испытания все значения (с маркерами разрыва) ставятся в очередь архива
         """
-
-        self.prev_index = self.curr_index  # Сохраняем предыдущий полученный указатель от ПЛК
-        self.curr_index = registers[INDEX_ADDRESS]  # Получаем новый указатель от ПЛК
-        if self.prev_index < self.curr_index:
-            # Находим смещение указателя (то есть фактически количество
-            # новых значений которые были записаны в буфер за время прошедшее между двумя опросами
-            self.index_offset = self.curr_index - self.prev_index
-        else:
-            self.index_offset = BUFFER_LENGTH + self.curr_index - self.prev_index
-        buffer = [c_short(i).value for i in registers[BUF_START:BUF_END]]  # читаем буфер и приводим его к типу INT
-
-        if self.head > DATA_STORAGE_END_INDX:
-            # Если указатель достиг конца хранилища данных сдвигаем данные в хранилище на размер буфера:
-            self.torque_data_scaled[:-BUFFER_LENGTH] = self.torque_data_scaled[BUFFER_LENGTH:]
-            self.head -= BUFFER_LENGTH
-        self.torque_data_scaled[self.head:self.head+BUFFER_LENGTH] = buffer
-
-        # новый индекс смещаем на фактическое количество новых записей в буфере
-        self.head += self.index_offset
-
-    # def _write_torque_buffer(self, buf: list, index):
-    #     if index > (self.data_window_length - BUFFER_LENGTH - 1):
-    #         self.torque_data_scaled[:-BUFFER_LENGTH] = self.torque_data_scaled[BUFFER_LENGTH:]
-    #         index = self.data_window_length - BUFFER_LENGTH
-    #     self.torque_data_scaled[index:index+BUFFER_LENGTH] = buf[:]
-
+        lost, new_values = self.ring_reader.read(frame, t_received)
+        torque = self.channels['torque']
+        capacity = torque.capacity
+        gap = min(lost, capacity)
+        if gap:
+            torque.extend(np.full(gap, GAP_MARKER, dtype=np.int16))
+        torque.extend(new_values)
+        torque_nm = self.calibration.apply(new_values)
+        # Разрыв сбрасывает фильтр производной: скорость не считается через пропуск
+        if lost:
+            self.velocity_filter.reset()
+            self.channels['torque_rate'].extend(np.full(gap, np.nan, dtype=np.float32))
+        self.channels['torque_rate'].extend(self.velocity_filter.process(torque_nm))
+        stamps = self.timebase.assign(lost + new_values.size, t_received, keep=capacity)
+        stamps -= self.monotonic_origin
+        self.channels['torque_time'].extend(stamps)
+        # В историю - откалиброванные значения в Нм, разрыв - NaN
+        values = np.full(stamps.size, np.nan)
+        values[stamps.size - new_values.size:] = torque_nm
+        self.torque_history.extend(stamps, values)
+        archive = self.archive
+        if archive is not None:
+            values = np.full(stamps.size, GAP_MARKER, dtype=np.int16)
+            values[stamps.size - new_values.size:] = new_values
+            archive.append(stamps, values, frame.di, frame.angle)
 
     def get_real_tension_nc(self, torque_adc):
         """Преобразование регистров в значение крутящего момента (нескорректированного)"""
@@ -251,93 +575,225 @@ class RealTimeData(QObject):
 
     def get_real_tension(self, torque_nc):
         """Преобразование регистров в значение крутящего момента (корректированного в соответствии с калибровочной моделью)"""
-        tension = torque_nc * 1.0 + 0
+        tension = self.calibration.convert(torque_nc)
         # client = self.poller.client
         # tension = client.convert_from_registers(registers[8:10], client.DATATYPE.FLOAT32)
         # tension = client.convert_from_registers(registers[10:11], client.DATATYPE.INT16)
         return tension
 
-    def get_real_angle(self, registers):
-        """Преобразование регистров в значение угла."""
-        _angle = c_uint((registers[3] << 16) | registers[2]).value
-        angle = float(_angle)/768.0
-        return angle
+    def set_calibration(self, coeffs=None):
+        """Сменить калибровочные коэффициенты (``None`` - взять из раздела ``calibration`` конфигурации).
+
+        Таблица перестраивается, только если коэффициенты изменились; вызывать
+        можно из потока GUI. Новые значения момента, история и скорость
+        нарастания считаются по новой таблице.
+        """
+        if coeffs is None:
+            coeffs = self.config.cfg.get('calibration')
+        threshold = self.config.get('calibration', 'threshold', CALIBRATION_THRESHOLD)
+        if self.calibration.set_coefficients(coeffs, threshold):
+            logging.info("Калибровка момента: %s", self.calibration.coefficients)
+
+    def get_real_angle(self, frame):
+        """Преобразование двойного слова датчика угла в значение угла (со знаком), градусы."""
+        return float(self.channels.channel('angle').decode(np.uint32(frame.angle).astype(np.int32)))
 
     def get_real_velocity(self):
-        """Расчёт скорости нарастания момента."""
-        velocity = 0.0
-        if self.ptr > 0:
-            velocity = (
-                self.torque_data_c[self.ptr] - self.torque_data_c[self.ptr - 1]
-            ) / self.poll_interval
-        return velocity
+        """Скорость нарастания момента, Нм/с - по последнему значению момента (0 при разрыве)."""
+        velocity = self.velocity_filter.value
+        return 0.0 if math.isnan(velocity) else velocity
 
     def _get_dataset_by_name(self, dataset_name):
-        """Возврат массива данных по имени."""
+        """Возврат массива данных по имени (в хронологическом порядке, в единицах канала)."""
         match dataset_name:
             case 'tension_data_c':
-                return self.torque_data_c
+                return self.channels.values('tension')
             case 'angle_data_c':
-                return self.angle_data_c
+                return self.channels.values('angle')
             case 'velocity_data':
-                return self.velocity_data
+                return self.channels.values('torque_rate')
+            case 'torque_times':
+                return self.channels.values('torque_time')
         return None
 
     def get_visible_chunk(self):
-        ds = self.torque_data_scaled
+        """Последние ``ui.max_graph_points`` значений момента."""
         points = self.config.get('ui', 'max_graph_points', 1000)
-        max_buffer_index = self.data_window_length - points
-        if self.curr_index <= max_buffer_index:
-            return ds[self.curr_index-points:self.curr_index]
+        return self.channels['torque'].last(points)
+
+    def get_acquisition_stats(self):
+        """Счётчики приёма значений момента: принято, потеряно, переполнений."""
+        snapshot = self.snapshot
+        return {
+            'samples_received': snapshot.samples_received,
+            'samples_lost': snapshot.samples_lost,
+            'overrun_events': snapshot.overrun_events,
+        }
+
+    def get_snapshot(self):
+        """Последний опубликованный снимок данных (для чтения из GUI)."""
+        return self.snapshot
+
+    def read_stream(self, total, n, *names):
+        """Последние ``n`` значений потоковых каналов ``names`` до номера ``total``.
+
+        ``total`` - ``RealTimeSnapshot.torque_total``; копируются только
+        запрошенные значения (обычно - пришедшие с прошлого обновления графика).
+        Безопасно вызывать из потока GUI: значения, уже перезаписанные в
+        кольцевом буфере, отбрасываются, массивы всех каналов - одной длины.
+        """
+        first = max(0, total - n)
+        values = [self.channels[name].read(first, total) for name in names]
+        size = min(v.size for v in values)
+        return tuple(v[v.size - size:] for v in values)
+
+    def get_torque_history(self, t_from, t_to=None, max_buckets=None):
+        """Агрегаты истории момента за интервал (см. ``MinMaxPyramid.fetch``).
+
+        Метки времени - секунды от начала датасета, как в канале ``torque_time``.
+        Безопасно вызывать из потока GUI.
+        """
+        return self.torque_history.fetch(t_from, t_to, max_buckets)
+
+    @property
+    def sample_rate(self):
+        """Номинальная частота значений момента, Гц (по циклу ПЛК)."""
+        return 1.0 / self.plc_cycle_s
 
     def get_torque(self):
-        return self.tension
+        return self.snapshot.tension
 
     def get_velocity(self):
-        return self.velocity
+        return self.snapshot.velocity
 
     def get_angle(self):
-        return self.angle
+        return self.snapshot.angle
 
-    @Slot(dict)
-    def modbus_registers_to_PLC_update(self, regs):
-        """Обновление регистров Modbus для записи в ПЛК."""
-        for key, reg in regs.items():
-            match key:
-                case 'Modbus_CTRL':
-                    self.write_regs[0] = reg
-                case 'Modbus_TensionSV':
-                    self.write_regs[1] = reg
-                case 'Modbus_VelocitySV':
-                    self.write_regs[2] = reg
-                case 'Modbus_DQ_CTRL':
-                    self.write_regs[3] = reg
-                case 'Modbus_UZ_CTRL':
-                    self.write_regs[4] = reg
-                case 'Modbus_KP':
-                    _kp = float_to_words(reg)
-                    self.write_regs[5] = _kp[0]
-                    self.write_regs[6] = _kp[1]
-                case 'Modbus_KI':
-                    _ki = float_to_words(reg)
-                    self.write_regs[7] = _ki[0]
-                    self.write_regs[8] = _ki[1]
-                case 'Modbus_KD':
-                    _kd = float_to_words(reg)
-                    self.write_regs[9] = _kd[0]
-                    self.write_regs[10] = _kd[1]
-                case 'Modbus_CC_LO':
-                    cc_lo = list(map(float_to_words, reg))
-                    for i in range(len(cc_lo)):
-                        self.write_regs[17 + i * 2] = cc_lo[i][0]
-                        self.write_regs[18 + i * 2] = cc_lo[i][1]
-                case 'Modbus_CC_HI':
-                    cc_hi = list(map(float_to_words, reg))
-                    for i in range(len(cc_hi)):
-                        self.write_regs[23 + i * 2] = cc_hi[i][0]
-                        self.write_regs[24 + i * 2] = cc_hi[i][1]
-                case 'Modbus_AUX':
-                    self.write_regs[11] = reg
+    def start_recording(self, path=None):
+        """Начать запись всех кадров регистров, получаемых от ПЛК.
+
+        По умолчанию файл создаётся в каталоге ``recorder.directory``.
+        """
+        self.stop_recording()
+        if path is None:
+            directory = self.config.get('recorder', 'directory', 'records')
+            os.makedirs(directory, exist_ok=True)
+            path = os.path.join(directory, time.strftime('frames_%Y%m%d_%H%M%S.bin'))
+        self.recorder = FrameRecorder(path)
+        self.recorder.start()
+        # Кадр ставится в очередь прямо в потоке опроса, запись - в фоновом потоке
+        self.poller.data_received.connect(self.recorder.record)
+        app = QCoreApplication.instance()
+        if app is not None:
+            app.aboutToQuit.connect(self.recorder.stop)
+        return path
+
+    def stop_recording(self):
+        """Остановить запись кадров."""
+        if self.recorder is None:
+            return
+        self.poller.data_received.disconnect(self.recorder.record)
+        self.recorder.stop()
+        self.recorder = None
+
+    @Slot()
+    def recover_interrupted_tests(self):
+        """Восстановить испытания, прерванные сбоем, по их журналам (в потоке обработки).
+
+        Имена восстановленных архивов сохраняются в ``recovered_archives`` и
+        публикуются сигналом ``journals_recovered``.
+        """
+        recovered = recover_journals(self.config.get('journal', 'directory', 'journal'))
+        if recovered:
+            self.recovered_archives = recovered
+            self.journals_recovered.emit(recovered)
+
+    def request_archive_start(self, path=None):
+        """Начать архив испытания (из любого потока); см. ``start_archive``."""
+        self.archive_start_requested.emit(path or '')
+
+    def request_archive_stop(self):
+        """Завершить архив испытания (из любого потока); см. ``stop_archive``."""
+        self.archive_stop_requested.emit()
+
+    @Slot(str)
+    def start_archive(self, path=None):
+        """Начать архив испытания: все значения момента, угол и дискретные входы - в файл,
+        сводки по секундам и минутам - в файлы рядом (см. ``archive_index``).
+
+        Выполняется в потоке обработки (из других потоков - ``request_archive_start``).
+        По умолчанию файл создаётся в каталоге ``archive.directory``.
+        Возвращает имя файла.
+        """
+        self.stop_archive()
+        if not path:
+            directory = self.config.get('archive', 'directory', 'archive')
+            os.makedirs(directory, exist_ok=True)
+            path = archive_name(directory)
+        # Сводки считаются по калибровке на начало испытания (она же - в заголовке)
+        calibration = TorqueCalibration(self.calibration.coefficients, self.calibration.threshold)
+        header = {
+            'created': time.time(),
+            'time_origin': self.time_origin,
+            'sample_rate': self.sample_rate,
+            'torque_scale': TORQUE_SCALE,
+            'angle_scale': ANGLE_SCALE,
+            'calibration': list(calibration.coefficients.values()) + [calibration.threshold],
+        }
+        archive = ArchiveWriter(path, header, summaries=SummaryWriter(path, calibration, ANGLE_SCALE))
+        # Журнал кадров (WAL): по нему архив восстанавливается после сбоя
+        if self.config.get('journal', 'enabled', True):
+            directory = self.config.get('journal', 'directory', 'journal')
+            session = archive_session(path, header, self.plc_cycle_s, self.monotonic_origin,
+                                      self.channels['torque'].capacity, self._last_frame)
+            self.journal = FrameJournal(
+                os.path.join(directory, os.path.splitext(os.path.basename(path))[0]),
+                session,
+                fsync_interval_s=self.config.get('journal', 'fsync_interval_ms', FSYNC_INTERVAL_S * 1000.0) / 1000.0,
+            )
+            self.journal.start()
+            # Кадр ставится в очередь прямо в потоке опроса
+            self.poller.data_received.connect(self.journal.record, Qt.ConnectionType.DirectConnection)
+        archive.start()
+        self.archive = archive
+        return path
+
+    @Slot()
+    def stop_archive(self):
+        """Завершить архив испытания: очередь дописывается на диск, журнал удаляется.
+
+        Выполняется в потоке обработки (из других потоков - ``request_archive_stop``).
+        """
+        archive, self.archive = self.archive, None
+        journal, self.journal = self.journal, None
+        if journal is not None:
+            self.poller.data_received.disconnect(journal.record)
+        if archive is not None:
+            archive.stop()
+        if journal is not None:
+            journal.stop(discard=True)
+
+    def start_replay(self, path, speed=1.0):
+        """Воспроизводить запись кадров вместо опроса ПЛК.
+
+        Parameters
+        ----------
+        path: str
+            Файл, записанный ``start_recording``.
+        speed: float
+            Скорость воспроизведения (1 - реальное время, 0 - без ограничения).
+        """
+        # Модуль источников данных при импорте настраивает файловый журнал -
+        # загружается только при воспроизведении
+        from src.models.modeldata import ReplayDataSource
+
+        self.poller.timer.stop()
+        self.replay = ReplayPoller(self, ReplayDataSource(path, speed))
+        self.replay_thread = QThread()
+        self.replay.moveToThread(self.replay_thread)
+        self.replay_thread.started.connect(self.replay.run)
+        self.replay.finished.connect(self.replay_thread.quit)
+        self.replay_thread.start()
 
     @Slot()
     def update_connection_settings(self):
@@ -346,7 +802,8 @@ class RealTimeData(QObject):
         self.poll_interval_s = float(self.poll_interval) / 1000.0
         if self.poller.timer:
             self.poller.timer.setInterval(self.poll_interval)
-        # self.poller.init_modbus()
+        # Постоянное соединение пересоздаётся с новыми параметрами в потоке опроса
+        self.connection_settings_changed.emit()
 
 class Dyno(QObject):
     def __init__(self, config):
@@ -0,0 +1,65 @@
+"""Декодирование блока регистров, прочитанного из ПЛК.
+
+Блок регистров один раз преобразуется в массив numpy ``uint16``, после чего
+типизированные поля читаются через представления (view) без копирования:
+знаковые слова - ``int16``, двойные слова - ``uint32`` (младшее слово первым),
+числа с плавающей точкой в порядке слов CDAB - ``float32``.
+"""
+
+import numpy as np
+
+READ_BUFFER_SIZE = 110
+BUFFER_LENGTH = 50          # размер буфера данных от ПЛК
+DI_ADDRESS = 0
+ADC_ADDRESS = 1
+ANGLE_ADDRESS = 2
+DQ_ADDRESS = 4
+STATE_ADDRESS = 5
+BUFFER_ADDRESS = 10
+INDEX_ADDRESS = 60
+WRITE_BUFFER_ADDRESS = 111
+TORQUE_SCALE = 500.0        # масштаб значений буфера момента, единиц на Нм
+ANGLE_SCALE = 768.0         # масштаб угла поворота, единиц на градус
+
+BUF_START = BUFFER_ADDRESS
+BUF_END = BUFFER_ADDRESS + BUFFER_LENGTH
+
+# Регистры Modbus - 16-битные слова; порядок байт задаём явно,
+# чтобы представления не зависели от платформы
+WORD = np.dtype('<u2')
+INT16 = np.dtype('<i2')
+DWORD = np.dtype('<u4')
+FLOAT_CDAB = np.dtype('<f4')    # младшее слово первым (порядок CDAB)
+
+
+def words_to_floats(words):
+    """Преобразовать последовательность слов (пары CDAB) в массив float32."""
+    return np.ascontiguousarray(words, dtype=WORD).view(FLOAT_CDAB)
+
+
+def floats_to_words(values):
+    """Преобразовать одно или несколько чисел float в слова (порядок CDAB)."""
+    return np.atleast_1d(np.asarray(values, dtype=FLOAT_CDAB)).view(WORD)
+
+
+class RegisterFrame:
+    """Один прочитанный из ПЛК блок регистров с типизированными полями.
+
+    Все массивные поля - представления одного массива ``words`` без копирования.
+    """
+
+    __slots__ = ('words', 'di', 'adc', 'angle', 'torque', 'index')
+
+    def __init__(self, registers):
+        words = np.asarray(registers, dtype=WORD)
+        self.words = words
+        # Слово состояния дискретных входов
+        self.di = int(words[DI_ADDRESS])
+        # Данные АЦП датчика момента (знаковое слово)
+        self.adc = int(words[ADC_ADDRESS:ADC_ADDRESS + 1].view(INT16)[0])
+        # Угол поворота: двойное слово, младшее слово первым
+        self.angle = int(words[ANGLE_ADDRESS:ANGLE_ADDRESS + 2].view(DWORD)[0])
+        # Буфер значений датчика момента (масштаб 500:1), знаковые слова
+        self.torque = words[BUF_START:BUF_END].view(INT16)
+        # Указатель буфера ПЛК
+        self.index = int(words[INDEX_ADDRESS])
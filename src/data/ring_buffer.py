@@ -0,0 +1,133 @@
+"""Кольцевой буфер фиксированной ёмкости для потоковых данных.
+
+Запись новых отсчётов стоит O(k) от их количества и не зависит от ёмкости
+буфера: вместо сдвига всего массива перемещается курсор записи.
+
+Отсчёт с номером ``k`` (с начала записи) всегда лежит в слоте
+``k % capacity``, поэтому другой поток может читать уже записанные отсчёты
+по номерам (``read``), не останавливая запись.
+"""
+
+import numpy as np
+
+
+class RingBuffer:
+    """Кольцевой буфер на базе numpy-массива с курсором записи.
+
+    Буфер предвыделяется целиком и заполняется значением ``fill``; до
+    заполнения «старые» слоты содержат это значение, как и прежние
+    предвыделенные массивы ``RealTimeData``.
+
+    Parameters
+    ----------
+    capacity: int
+        Ёмкость буфера (число отсчётов).
+    dtype:
+        Тип элементов numpy.
+    fill:
+        Начальное значение слотов.
+    """
+
+    def __init__(self, capacity, dtype, fill=0):
+        self.capacity = int(capacity)
+        self.dtype = np.dtype(dtype)
+        self._data = np.full(self.capacity, fill, dtype=self.dtype)
+        self._cursor = 0    # слот для следующей записи
+        self.total = 0      # общее число записанных отсчётов с момента создания
+
+    def __len__(self):
+        """Количество реально записанных (не начальных) отсчётов."""
+        return min(self.total, self.capacity)
+
+    def append(self, value):
+        """Добавить один отсчёт."""
+        self._data[self._cursor] = value
+        self._cursor += 1
+        if self._cursor == self.capacity:
+            self._cursor = 0
+        self.total += 1
+
+    def extend(self, values):
+        """Добавить блок отсчётов (с переходом через конец буфера)."""
+        values = np.asarray(values)
+        n = values.size
+        if n == 0:
+            return
+        if n >= self.capacity:
+            # Блок длиннее буфера: остаются только последние capacity отсчётов
+            # (по своим слотам k % capacity)
+            self._cursor = (self.total + n) % self.capacity
+            self._data[:] = np.roll(values[n - self.capacity:], self._cursor)
+        else:
+            end = self._cursor + n
+            if end <= self.capacity:
+                self._data[self._cursor:end] = values
+            else:
+                first = self.capacity - self._cursor
+                self._data[self._cursor:] = values[:first]
+                self._data[:n - first] = values[first:]
+            self._cursor = end % self.capacity
+        self.total += n
+
+    def last(self, n=None):
+        """Вернуть последние ``n`` отсчётов в хронологическом порядке.
+
+        Если отсчёты лежат в памяти непрерывно, возвращается представление
+        (view) только для чтения; копия создаётся лишь когда запрошенный
+        участок переходит через конец буфера.
+        """
+        n = self.capacity if n is None else max(0, min(int(n), self.capacity))
+        start = self._cursor - n
+        if start >= 0:
+            view = self._data[start:self._cursor]
+        elif self._cursor == 0:
+            view = self._data[self.capacity - n:]
+        else:
+            return np.concatenate((self._data[start:], self._data[:self._cursor]))
+        view.flags.writeable = False
+        return view
+
+    def read(self, first, end):
+        """Копия отсчётов с номерами ``[first, end)`` (``end`` - не больше ``total``).
+
+        Безопасно вызывать из другого потока во время записи: отсчёты,
+        перезаписанные до или во время копирования, отбрасываются с начала
+        результата, так что он может оказаться короче запрошенного.
+        """
+        first = max(int(first), int(end) - self.capacity, 0)
+        n = int(end) - first
+        if n <= 0:
+            return np.zeros(0, dtype=self.dtype)
+        start = first % self.capacity
+        stop = start + n
+        if stop <= self.capacity:
+            values = self._data[start:stop].copy()
+        else:
+            values = np.concatenate((self._data[start:], self._data[:stop - self.capacity]))
+        # Всё, что запись успела перезаписать за время копирования, - старше total - capacity
+        lost = self.total - self.capacity - first
+        return values[lost:] if lost > 0 else values
+
+    def segments(self):
+        """Записанные отсчёты как два представления: более старые и более новые.
+
+        Хронологический порядок - ``older`` и следом ``newer``; в отличие от
+        ``last()`` копия не создаётся никогда.
+        """
+        if self.total < self.capacity:
+            older, newer = self._data[:self._cursor], self._data[:0]
+        else:
+            older, newer = self._data[self._cursor:], self._data[:self._cursor]
+        older.flags.writeable = False
+        newer.flags.writeable = False
+        return older, newer
+
+    def latest(self):
+        """Последний записанный отсчёт."""
+        return self._data[self._cursor - 1]
+
+    def clear(self, fill=0):
+        """Сбросить содержимое буфера и счётчики."""
+        self._data.fill(fill)
+        self._cursor = 0
+        self.total = 0
@@ -0,0 +1,30 @@
+"""Снимок данных реального времени для интерфейса.
+
+Снимок формируется в потоке обработки данных и передаётся в поток GUI.
+После создания он не изменяется, поэтому виджеты могут читать его без
+блокировок, пока поток обработки продолжает заполнять кольцевые буферы.
+
+Потоки значений момента в снимок не копируются: он содержит только их
+счётчик ``torque_total``, а графики дописывают новые значения, читая из
+буферов лишь недостающие (``RealTimeData.read_stream``).
+"""
+
+from dataclasses import dataclass
+
+
+@dataclass(frozen=True)
+class RealTimeSnapshot:
+    """Неизменяемое состояние ``RealTimeData`` на момент публикации."""
+
+    seq: int = 0                    # порядковый номер снимка
+    registers: tuple = ()           # последний прочитанный блок регистров
+    tension: float = 0.0            # момент скорректированный, Нм
+    tension_nc: float = 0.0         # момент нескорректированный, Нм
+    angle: float = 0.0              # угол поворота, градусы
+    velocity: float = 0.0           # скорость нарастания момента, Нм/с
+    in_status: int = 0              # слово состояния дискретных входов
+    torque_total: int = 0           # всего записано значений момента (с маркерами разрыва)
+    samples_received: int = 0       # принято значений момента от ПЛК
+    samples_lost: int = 0           # потеряно значений при переполнении буфера ПЛК
+    overrun_events: int = 0         # число переполнений буфера ПЛК
+    sample_rate: float = 250.0      # оценка фактической частоты значений момента, Гц
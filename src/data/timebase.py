@@ -0,0 +1,113 @@
+"""Временная шкала отсчётов потока момента.
+
+ПЛК записывает значения с постоянным периодом (4 мс), поэтому время
+каждого отсчёта восстанавливается по его номеру: ``t = t0 + k * period``.
+Часы ПЛК и ПК расходятся, а номинальный период неточен, поэтому шкала
+подстраивается под ``time.monotonic()`` ПК по времени получения кадров:
+период уточняется по длинной базе, а фаза плавно доворачивается
+(без скачков назад - метки остаются монотонными).
+"""
+
+import numpy as np
+
+
+class SampleTimebase:
+    """Восстановление монотонных меток времени для отсчётов потока.
+
+    Parameters
+    ----------
+    period_s: float
+        Номинальный период отсчётов, с.
+    phase_gain: float
+        Доля рассогласования фазы, компенсируемая за один кадр.
+    period_tolerance: float
+        Допустимое относительное отклонение уточнённого периода от номинала.
+    min_baseline_s: float
+        Минимальная база времени для уточнения периода, с.
+    """
+
+    def __init__(self, period_s, phase_gain=0.02, period_tolerance=0.01, min_baseline_s=10.0):
+        self.nominal_period_s = float(period_s)
+        self.period_s = float(period_s)
+        self.phase_gain = float(phase_gain)
+        self.period_tolerance = float(period_tolerance)
+        self.min_baseline_s = float(min_baseline_s)
+        self.origin = None          # время отсчёта с номером 0, с (по time.monotonic())
+        self.next_sample = 0        # номер следующего отсчёта
+        self.last_time = None       # метка последнего отсчёта
+        self._first_time = None     # опорная точка для уточнения периода
+        self._first_sample = 0
+
+    def state(self):
+        """Состояние шкалы (словарь чисел) - для продолжения с того же места."""
+        return {
+            'period_s': self.period_s,
+            'origin': self.origin,
+            'next_sample': self.next_sample,
+            'last_time': self.last_time,
+            'first_time': self._first_time,
+            'first_sample': self._first_sample,
+        }
+
+    def restore(self, state):
+        """Продолжить шкалу с состояния, полученного ``state()``."""
+        self.period_s = state['period_s']
+        self.origin = state['origin']
+        self.next_sample = state['next_sample']
+        self.last_time = state['last_time']
+        self._first_time = state['first_time']
+        self._first_sample = state['first_sample']
+
+    @property
+    def sample_rate(self):
+        """Оценка фактической частоты отсчётов, Гц."""
+        return 1.0 / self.period_s
+
+    def assign(self, count, t_received, keep=None):
+        """Выдать метки времени для ``count`` очередных отсчётов.
+
+        Parameters
+        ----------
+        count: int
+            Количество новых отсчётов (включая маркеры разрыва).
+        t_received: float
+            Время получения кадра, в котором последний из них - самый свежий.
+        keep: int, optional
+            Вернуть метки только ``keep`` последних отсчётов (остальные,
+            например не поместившиеся в хранилище, лишь продвигают счётчик).
+
+        Returns
+        -------
+        numpy.ndarray
+            Метки времени (float64, с) в шкале ``time.monotonic()``.
+        """
+        last_sample = self.next_sample + count - 1
+        if self.origin is None:
+            # Первый кадр: последний отсчёт сделан примерно в момент получения
+            self.origin = t_received - last_sample * self.period_s
+            self._first_time = t_received
+            self._first_sample = last_sample
+        else:
+            # Уточняем период по длинной базе (джиттер опроса усредняется)
+            baseline = t_received - self._first_time
+            if baseline >= self.min_baseline_s and last_sample > self._first_sample:
+                estimate = baseline / (last_sample - self._first_sample)
+                low = self.nominal_period_s * (1.0 - self.period_tolerance)
+                high = self.nominal_period_s * (1.0 + self.period_tolerance)
+                new_period = min(max(estimate, low), high)
+                # Перенос начала шкалы сохраняет время уже выданных отсчётов
+                self.origin += self.next_sample * (self.period_s - new_period)
+                self.period_s = new_period
+            # Плавная подстройка фазы; сдвиг ограничен, чтобы метки не шли назад
+            error = t_received - (self.origin + last_sample * self.period_s)
+            max_step = 0.5 * count * self.period_s
+            self.origin += min(max(self.phase_gain * error, -max_step), max_step)
+
+        first = self.next_sample if keep is None else max(self.next_sample, last_sample + 1 - keep)
+        times = self.origin + self.period_s * np.arange(first, last_sample + 1, dtype=np.float64)
+        if self.last_time is not None and times.size and times[0] <= self.last_time:
+            times += self.last_time + 0.5 * self.period_s - times[0]
+        self.next_sample = last_sample + 1
+        if times.size:
+            self.last_time = times[-1]
+        return times
@@ -0,0 +1,144 @@
+"""Блок регистров для записи в ПЛК с отслеживанием изменений.
+
+Значения параметров кодируются в слова один раз - при изменении; для каждого
+слова хранится признак «изменено» (dirty). Поток опроса забирает только
+непрерывный участок изменённых слов и передаёт его в ПЛК; если изменений нет,
+выполняется обычное чтение без записи.
+
+Изменения команд вносятся в потоке опроса (слоты ``ModbusPoller.send_registers``
+и ``send_urgent`` - единственный путь записи в ПЛК), начальные значения - при
+создании ``RealTimeData`` в потоке GUI; доступ к состоянию защищён блокировкой.
+"""
+
+import threading
+
+import numpy as np
+
+from src.data.register_frame import WORD, floats_to_words
+
+WRITE_REGISTERS_COUNT = 30      # размер блока записи в ПЛК, слов
+
+# Размещение параметров в блоке записи: имя -> (смещение, число значений, тип)
+# 'word' - одно слово, 'float' - float32 в порядке слов CDAB (по 2 слова на значение)
+REGISTER_MAP = {
+    'Modbus_CTRL':          (0, 1, 'word'),
+    'Modbus_TensionSV':     (1, 1, 'word'),
+    'Modbus_VelocitySV':    (2, 1, 'word'),
+    'Modbus_DQ_CTRL':       (3, 1, 'word'),
+    'Modbus_UZ_CTRL':       (4, 1, 'word'),
+    'Modbus_KP':            (5, 1, 'float'),
+    'Modbus_KI':            (7, 1, 'float'),
+    'Modbus_KD':            (9, 1, 'float'),
+    'Modbus_AUX':           (11, 1, 'word'),
+    'Modbus_CC_LO':         (17, 3, 'float'),
+    'Modbus_CC_HI':         (23, 2, 'float'),
+}
+
+
+def _encode(value, count, kind):
+    """Слова параметра по его размещению в блоке записи."""
+    if kind == 'float':
+        return floats_to_words(value)[:2 * count]
+    return np.array([int(value) & 0xFFFF], dtype=WORD)
+
+
+class WriteRegisters:
+    """Слова для записи в ПЛК с признаками изменения по каждому слову.
+
+    До первой передачи все слова считаются изменёнными, чтобы ПЛК получил
+    полное начальное состояние. Начальные значения параметров (``defaults``,
+    например ``Model.modbus_write_regs``) кодируются в слова сразу, поэтому
+    первая запись несёт их, а не нули.
+    """
+
+    def __init__(self, count=WRITE_REGISTERS_COUNT, defaults=None):
+        self.words = np.zeros(count, dtype=WORD)
+        self.dirty = np.ones(count, dtype=bool)
+        self._values = {}       # последние принятые значения параметров (по имени)
+        self._lock = threading.Lock()
+        if defaults:
+            self.update(defaults)
+
+    def set(self, name, value):
+        """Задать значение параметра.
+
+        Значение кодируется только если оно отличается от предыдущего; словами,
+        требующими передачи, помечаются лишь реально изменившиеся.
+
+        Returns
+        -------
+        bool
+            ``True``, если изменилось хотя бы одно слово.
+        """
+        layout = REGISTER_MAP.get(name)
+        if layout is None:
+            return False
+        key = tuple(value) if isinstance(value, (list, tuple)) else value
+        offset, count, kind = layout
+        with self._lock:
+            if self._values.get(name) == key:
+                return False
+            self._values[name] = key
+            encoded = _encode(key, count, kind)
+            end = offset + encoded.size
+            changed = self.words[offset:end] != encoded
+            if not changed.any():
+                return False
+            self.words[offset:end] = encoded
+            self.dirty[offset:end] |= changed
+        return True
+
+    def update(self, regs):
+        """Задать несколько параметров из словаря ``{имя: значение}``."""
+        changed = False
+        for name, value in regs.items():
+            changed |= self.set(name, value)
+        return changed
+
+    def has_dirty(self):
+        """Есть ли слова, ожидающие передачи в ПЛК."""
+        return bool(self.dirty.any())
+
+    def take_dirty_span(self):
+        """Забрать минимальный непрерывный участок изменённых слов.
+
+        Признаки изменения участка сбрасываются; если запись не удалась,
+        участок нужно вернуть через ``mark_dirty``.
+
+        Returns
+        -------
+        tuple[int, list[int]] | None
+            Смещение участка в блоке записи и значения слов, либо ``None``,
+            если изменений нет.
+        """
+        with self._lock:
+            indexes = np.flatnonzero(self.dirty)
+            if indexes.size == 0:
+                return None
+            start, end = int(indexes[0]), int(indexes[-1]) + 1
+            self.dirty[start:end] = False
+            return start, self.words[start:end].tolist()
+
+    def reset(self):
+        """Заново закодировать все параметры и пометить блок для передачи целиком.
+
+        Вызывается после (пере)подключения: состояние ПЛК неизвестно, и он
+        должен получить начальные значения с учётом всех последующих изменений.
+        """
+        with self._lock:
+            for name, value in self._values.items():
+                offset, count, kind = REGISTER_MAP[name]
+                encoded = _encode(value, count, kind)
+                self.words[offset:offset + encoded.size] = encoded
+            self.dirty[:] = True
+
+    def mark_dirty(self, start=0, count=None):
+        """Пометить слова для повторной передачи (по умолчанию - все)."""
+        end = self.words.size if count is None else start + count
+        with self._lock:
+            self.dirty[start:end] = True
+
+    def values(self):
+        """Текущее содержимое блока записи (список слов)."""
+        with self._lock:
+            return self.words.tolist()
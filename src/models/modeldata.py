@@ -1,6 +1,9 @@
 from abc import ABC, abstractmethod
 from typing import Any
 import logging
+import time
+
+from src.data.frame_log import read_frames
 
 
 logger = logging.getLogger(__name__)
@@ -162,6 +165,73 @@ class FileDataSource(DataSource):
         return self._connected
 
 
+# Воспроизведение записанных кадров регистров
+class ReplayDataSource(DataSource):
+    """Data source replaying raw register frames recorded by ``FrameRecorder``.
+
+    Кадры выдаются с исходными интервалами времени, поделёнными на ``speed``;
+    при ``speed = 0`` - без задержек. Метки времени кадров переносятся в
+    текущую шкалу ``time.monotonic()`` с сохранением записанных интервалов,
+    поэтому обработка кадров не зависит от скорости воспроизведения.
+    """
+
+    def __init__(self, filename: str, speed: float = 1.0):
+        self.filename = filename
+        self.speed = float(speed)
+        self.frames = None
+        self.position = 0
+        self._t_first = 0.0         # время первого кадра в записи
+        self._t_origin = 0.0        # time.monotonic() начала воспроизведения
+        self._connected = False
+
+    def connect(self) -> bool:
+        try:
+            _, self.frames = read_frames(self.filename)
+        except (OSError, ValueError) as e:
+            logger.error("Не удалось открыть запись кадров %s: %s", self.filename, e)
+            return False
+        logger.info("Воспроизведение %s: кадров %d, скорость %s",
+                    self.filename, len(self.frames), self.speed or "без ограничения")
+        self.position = 0
+        self._t_first = float(self.frames[0]['t']) if len(self.frames) else 0.0
+        self._t_origin = time.monotonic()
+        self._connected = True
+        return True
+
+    def disconnect(self) -> None:
+        self.frames = None
+        self._connected = False
+
+    def read_data(self) -> dict[str, Any]:
+        """Следующий кадр: ``{"t": время, "registers": список слов}``.
+
+        По окончании записи возвращает пустой словарь и закрывает источник.
+        """
+        if not self._connected:
+            raise ConnectionError("Запись кадров не открыта")
+        if self.position >= len(self.frames):
+            self.disconnect()
+            return {}
+        frame = self.frames[self.position]
+        self.position += 1
+        elapsed = float(frame['t']) - self._t_first
+        if self.speed > 0:
+            delay = self._t_origin + elapsed / self.speed - time.monotonic()
+            if delay > 0:
+                time.sleep(delay)
+        return {
+            "t": self._t_origin + elapsed,
+            "registers": frame['words'].tolist(),
+        }
+
+    def write_data(self, data: dict[str, Any]) -> None:
+        """Commands are not applicable to a recording; they are only logged."""
+        logger.debug("Replay: запись в ПЛК пропущена: %s", data)
+
+    def is_connected(self) -> bool:
+        return self._connected
+
+
 # Использование
 def process_data(data_source: DataSource):
     """Функция работает с любым источником данных"""
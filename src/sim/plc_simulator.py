@@ -0,0 +1,264 @@
+"""Имитатор ПЛК стенда для работы без оборудования.
+
+Modbus TCP сервер (pymodbus) с той же картой регистров, что читает
+``RealTimeData``:
+
+- 0      - слово дискретных входов;
+- 1      - АЦП датчика момента (знаковое, 16384 = 50 Нм);
+- 2..3   - угол поворота (двойное слово, младшее слово первым, 1/768 градуса);
+- 10..59 - буфер значений момента (масштаб 500:1) в хронологическом порядке;
+- 60     - счётчик записанных значений по модулю 50;
+- 111..  - блок записи из 30 регистров (слово управления, уставки, коэффициенты).
+
+Значения момента «записываются» в буфер с периодом цикла ПЛК (4 мс).
+Модель продвигается по времени при каждом обращении клиента, поэтому её
+можно ускорить (``--speedup``): при ускорении опрос не успевает за буфером,
+что позволяет воспроизвести переполнения и измерить пропускную способность.
+Приложению при этом нужно сообщить фактический период цикла:
+``modbus.plc_cycle_ms = period_ms / speedup``.
+
+При включённой модели сервопривода (``--servo``) момент при удержании
+отслеживает уставку ``Modbus_TensionSV`` с инерционностью первого порядка,
+а jog вращает вал со скоростью ``Modbus_VelocitySV``.
+
+Запуск::
+
+    python -m src.sim.plc_simulator --port 5020 --speedup 1
+"""
+
+import argparse
+import asyncio
+import logging
+import math
+import time
+
+import numpy as np
+from pymodbus.server import ModbusTcpServer
+from pymodbus.simulator import DataType, SimData, SimDevice
+
+from src.data.register_frame import (
+    ADC_ADDRESS,
+    ANGLE_ADDRESS,
+    ANGLE_SCALE,
+    BUF_END,
+    BUF_START,
+    BUFFER_LENGTH,
+    DI_ADDRESS,
+    DWORD,
+    INDEX_ADDRESS,
+    INT16,
+    TORQUE_SCALE,
+    WORD,
+    WRITE_BUFFER_ADDRESS,
+)
+from src.data.write_registers import REGISTER_MAP, WRITE_REGISTERS_COUNT
+
+logger = logging.getLogger(__name__)
+
+REGISTERS_COUNT = WRITE_BUFFER_ADDRESS + WRITE_REGISTERS_COUNT
+ADC_SCALE = 16384.0 / 50.0      # единиц АЦП на Нм
+VELOCITY_SCALE = 1000.0         # единиц Modbus_VelocitySV на градус/с
+
+# Команды в слове управления (биты 1..3), см. CommandHandler
+CMD_MASK = 0b111 << 1
+CMD_JOG_CW = 0b001 << 1
+CMD_JOG_CCW = 0b010 << 1
+CMD_TORQUE_HOLD = 0b011 << 1
+POWER_ON_BIT = 1 << 0
+
+
+def _signed(word):
+    """Слово Modbus как знаковое 16-битное число."""
+    return word - 0x10000 if word & 0x8000 else word
+
+
+class PlcModel:
+    """Модель ПЛК: буфер значений момента, угол и блок записи.
+
+    Parameters
+    ----------
+    sample_period_s: float
+        Период записи значений момента в буфер, с.
+    speedup: float
+        Ускорение модельного времени относительно реального.
+    servo: bool
+        Моделировать отклик сервопривода на уставки.
+    tau_s: float
+        Постоянная времени отклика момента на уставку, с.
+    amplitude: float
+        Амплитуда тестового синусоидального сигнала (без модели сервопривода), Нм.
+    noise: float
+        СКО шума датчика момента, Нм.
+    """
+
+    def __init__(self, sample_period_s=0.004, speedup=1.0, servo=False,
+                 tau_s=0.2, amplitude=10.0, noise=0.02):
+        self.sample_period_s = float(sample_period_s)
+        self.speedup = float(speedup)
+        self.servo = servo
+        self.tau_s = float(tau_s)
+        self.amplitude = float(amplitude)
+        self.noise = float(noise)
+        self.registers = np.zeros(REGISTERS_COUNT, dtype=WORD)
+        self.buffer = self.registers[BUF_START:BUF_END].view(INT16)
+        self.samples = 0            # всего записано значений момента
+        self.torque = 0.0           # текущий момент, Нм
+        self.angle = 0.0            # текущий угол, градусы
+        self.requests = 0           # число обращений клиента
+        self._rng = np.random.default_rng()
+        self._t0 = time.monotonic()
+
+    def model_time(self):
+        """Модельное время от запуска, с."""
+        return (time.monotonic() - self._t0) * self.speedup
+
+    def write(self, address, values):
+        """Принять запись регистров от клиента."""
+        self.advance()
+        start = address - WRITE_BUFFER_ADDRESS
+        if start < 0 or start + len(values) > WRITE_REGISTERS_COUNT:
+            return
+        self.registers[address:address + len(values)] = values
+
+    def _word(self, name):
+        """Значение слова блока записи по имени регистра."""
+        offset = REGISTER_MAP[name][0]
+        return int(self.registers[WRITE_BUFFER_ADDRESS + offset])
+
+    def advance(self):
+        """Записать в буфер значения, «накопленные» к текущему модельному времени."""
+        due = int(self.model_time() / self.sample_period_s) - self.samples
+        if due <= 0:
+            return
+        # При отставании опроса больше буфера значения всё равно вычисляются
+        # только для последних BUFFER_LENGTH - остальные перезаписаны бы в ПЛК
+        keep = min(due, BUFFER_LENGTH)
+        k = np.arange(self.samples + due - keep + 1, self.samples + due + 1)
+        t = k * self.sample_period_s
+        torque = self._torque(t, due, keep)
+        self._advance_angle(due * self.sample_period_s)
+
+        values = np.clip(np.round(torque * TORQUE_SCALE), -32767, 32767).astype(INT16)
+        self.buffer[:BUFFER_LENGTH - keep] = self.buffer[keep:]
+        self.buffer[BUFFER_LENGTH - keep:] = values
+        self.samples += due
+        self.registers[INDEX_ADDRESS] = self.samples % BUFFER_LENGTH
+        self.registers[ADC_ADDRESS:ADC_ADDRESS + 1].view(INT16)[0] = int(
+            np.clip(round(self.torque * ADC_SCALE), -32767, 32767)
+        )
+        angle = int(round(self.angle * ANGLE_SCALE)) % (1 << 32)
+        self.registers[ANGLE_ADDRESS:ANGLE_ADDRESS + 2].view(DWORD)[0] = angle
+        self.registers[DI_ADDRESS] = self._word('Modbus_CTRL') & POWER_ON_BIT
+
+    def _torque(self, t, due, keep):
+        """Значения момента в моменты ``t`` (последние ``keep`` из ``due`` новых)."""
+        ctrl = self._word('Modbus_CTRL')
+        if self.servo:
+            if ctrl & POWER_ON_BIT and ctrl & CMD_MASK == CMD_TORQUE_HOLD:
+                setpoint = _signed(self._word('Modbus_TensionSV')) / TORQUE_SCALE
+            else:
+                setpoint = 0.0
+            # Отклик первого порядка: y_k = sp + (y_0 - sp) * a^k
+            a = math.exp(-self.sample_period_s / self.tau_s)
+            steps = np.arange(due - keep + 1, due + 1)
+            torque = setpoint + (self.torque - setpoint) * a ** steps
+        else:
+            torque = self.amplitude * np.sin(2.0 * np.pi * 0.5 * t)
+        self.torque = float(torque[-1])
+        if self.noise:
+            torque = torque + self._rng.normal(0.0, self.noise, torque.size)
+        return torque
+
+    def _advance_angle(self, dt):
+        """Поворот вала при jog (только с моделью сервопривода)."""
+        if not self.servo:
+            return
+        ctrl = self._word('Modbus_CTRL')
+        if not ctrl & POWER_ON_BIT:
+            return
+        velocity = abs(_signed(self._word('Modbus_VelocitySV'))) / VELOCITY_SCALE
+        command = ctrl & CMD_MASK
+        if command == CMD_JOG_CW:
+            self.angle += velocity * dt
+        elif command == CMD_JOG_CCW:
+            self.angle -= velocity * dt
+
+    async def on_access(self, func_code, start_address, address, count, registers, values):
+        """Обработчик обращений сервера pymodbus к регистрам устройства."""
+        self.requests += 1
+        if values:
+            self.write(address, values)
+            return None
+        self.advance()
+        end = address + count
+        registers[address - start_address:end - start_address] = self.registers[address:end].tolist()
+        return None
+
+
+async def report(model, interval_s):
+    """Периодически выводить статистику имитатора."""
+    prev_requests, prev_samples = model.requests, model.samples
+    while True:
+        await asyncio.sleep(interval_s)
+        model.advance()
+        logger.info(
+            "Запросов: %.1f/с, значений момента: %.0f/с (модельное время %.1f с)",
+            (model.requests - prev_requests) / interval_s,
+            (model.samples - prev_samples) / interval_s,
+            model.model_time(),
+        )
+        prev_requests, prev_samples = model.requests, model.samples
+
+
+async def serve(model, host, port, report_interval_s=5.0):
+    """Запустить Modbus TCP сервер имитатора."""
+    device = SimDevice(
+        id=0,
+        simdata=[SimData(address=0, count=REGISTERS_COUNT, values=0, datatype=DataType.REGISTERS)],
+        action=model.on_access,
+    )
+    server = ModbusTcpServer(device, address=(host, port))
+    logger.info("Имитатор ПЛК: %s:%d, период %.1f мс, ускорение x%g",
+                host, port, model.sample_period_s * 1000.0, model.speedup)
+    reporter = asyncio.create_task(report(model, report_interval_s))
+    try:
+        await server.serve_forever()
+    finally:
+        reporter.cancel()
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Имитатор ПЛК стенда (Modbus TCP)")
+    parser.add_argument('--host', default='127.0.0.1')
+    parser.add_argument('--port', type=int, default=5020)
+    parser.add_argument('--period-ms', type=float, default=4.0,
+                        help="период записи значений момента, мс")
+    parser.add_argument('--speedup', type=float, default=1.0,
+                        help="ускорение модельного времени")
+    parser.add_argument('--servo', action='store_true',
+                        help="моделировать отклик сервопривода на уставки")
+    parser.add_argument('--tau', type=float, default=0.2,
+                        help="постоянная времени отклика момента, с")
+    parser.add_argument('--amplitude', type=float, default=10.0,
+                        help="амплитуда тестового сигнала без модели сервопривода, Нм")
+    parser.add_argument('--noise', type=float, default=0.02,
+                        help="СКО шума датчика момента, Нм")
+    args = parser.parse_args(argv)
+
+    logging.basicConfig(level=logging.INFO, format="%(asctime)s %(levelname)s %(message)s")
+    model = PlcModel(
+        sample_period_s=args.period_ms / 1000.0,
+        speedup=args.speedup,
+        servo=args.servo,
+        tau_s=args.tau,
+        amplitude=args.amplitude,
+        noise=args.noise,
+    )
+    try:
+        asyncio.run(serve(model, args.host, args.port))
+    except KeyboardInterrupt:
+        pass
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,37 @@
+# Form implementation generated from reading ui file 'about_dialog.ui'
+#
+# Created by: PyQt6 UI code generator 6.11.0
+#
+# WARNING: Any manual changes made to this file will be lost when pyuic6 is
+# run again.  Do not edit this file unless you know what you are doing.
+
+
+from PyQt6 import QtCore, QtGui, QtWidgets
+
+
+class Ui_AboutDialog(object):
+    def setupUi(self, AboutDialog):
+        AboutDialog.setObjectName("AboutDialog")
+        self.vertical_layout = QtWidgets.QVBoxLayout(AboutDialog)
+        self.vertical_layout.setObjectName("vertical_layout")
+        self.label = QtWidgets.QLabel(parent=AboutDialog)
+        self.label.setWordWrap(True)
+        self.label.setObjectName("label")
+        self.vertical_layout.addWidget(self.label)
+        self.button_box = QtWidgets.QDialogButtonBox(parent=AboutDialog)
+        self.button_box.setOrientation(QtCore.Qt.Orientation.Horizontal)
+        self.button_box.setStandardButtons(QtWidgets.QDialogButtonBox.StandardButton.Ok)
+        self.button_box.setObjectName("button_box")
+        self.vertical_layout.addWidget(self.button_box)
+
+        self.retranslateUi(AboutDialog)
+        self.button_box.accepted.connect(AboutDialog.accept) # type: ignore
+        QtCore.QMetaObject.connectSlotsByName(AboutDialog)
+
+    def retranslateUi(self, AboutDialog):
+        _translate = QtCore.QCoreApplication.translate
+        AboutDialog.setWindowTitle(_translate("AboutDialog", "О программе"))
+        self.label.setText(_translate("AboutDialog", "Шаблон интерфейса стенда крутильных статических испытаний. PyQt6 + pyqtgraph + Modbus TCP."))
+
+
+UI_SOURCE_SHA1 = 'eb1e9224bbf17f926db41981e28ddac677ef3330'
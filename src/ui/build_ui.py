@@ -0,0 +1,52 @@
+"""Компиляция форм Qt Designer в модули Python.
+
+Для каждого файла ``src/ui/<имя>.ui`` создаётся модуль ``src/ui/<имя>_ui.py``
+(как ``calibration_model_coeffs_ui.py``). ``designer_loader.load_ui`` берёт
+готовый модуль вместо разбора XML при каждом запуске; в модуль записывается
+контрольная сумма исходной формы, и устаревший модуль не используется.
+
+После изменения любой формы в Qt Designer запустите::
+
+    python -m src.ui.build_ui
+"""
+
+import argparse
+import io
+from pathlib import Path
+
+from PyQt6 import uic
+
+from src.ui.designer_loader import UI_DIR, compiled_path, ui_digest
+
+
+def compile_form(ui_path):
+    """Скомпилировать одну форму; вернуть путь к созданному модулю."""
+    ui_path = Path(ui_path).resolve()
+    code = io.StringIO()
+    uic.compileUi(str(ui_path), code)
+    target = compiled_path(ui_path)
+    # В заголовок модуля - только имя формы, без локального пути
+    source = code.getvalue().replace(str(ui_path), ui_path.name, 1)
+    target.write_text(
+        source + f"\n\nUI_SOURCE_SHA1 = '{ui_digest(ui_path)}'\n",
+        encoding='utf-8',
+    )
+    return target
+
+
+def compile_all(ui_dir=UI_DIR):
+    """Скомпилировать все формы каталога."""
+    return [compile_form(path) for path in sorted(Path(ui_dir).glob('*.ui'))]
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Компиляция форм .ui в модули Python")
+    parser.add_argument('forms', nargs='*', help="файлы .ui (по умолчанию - все в src/ui)")
+    args = parser.parse_args(argv)
+    targets = [compile_form(path) for path in args.forms] if args.forms else compile_all()
+    for target in targets:
+        print(target)
+
+
+if __name__ == '__main__':
+    main()
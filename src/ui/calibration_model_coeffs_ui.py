@@ -1,6 +1,6 @@
 # Form implementation generated from reading ui file 'calibration_model_coeffs.ui'
 #
-# Created by: PyQt6 UI code generator 6.9.1
+# Created by: PyQt6 UI code generator 6.11.0
 #
 # WARNING: Any manual changes made to this file will be lost when pyuic6 is
 # run again.  Do not edit this file unless you know what you are doing.
@@ -187,11 +187,4 @@ class Ui_coeffs_header(object):
         self.btn_write_to_PLC.setText(_translate("coeffs_header", ">>"))
 
 
-if __name__ == "__main__":
-    import sys
-    app = QtWidgets.QApplication(sys.argv)
-    coeffs_header = QtWidgets.QFrame()
-    ui = Ui_coeffs_header()
-    ui.setupUi(coeffs_header)
-    coeffs_header.show()
-    sys.exit(app.exec())
+UI_SOURCE_SHA1 = '6a5544335e50fcdfd263f480e6820b9740bed9ff'
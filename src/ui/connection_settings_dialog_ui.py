@@ -0,0 +1,63 @@
+# Form implementation generated from reading ui file 'connection_settings_dialog.ui'
+#
+# Created by: PyQt6 UI code generator 6.11.0
+#
+# WARNING: Any manual changes made to this file will be lost when pyuic6 is
+# run again.  Do not edit this file unless you know what you are doing.
+
+
+from PyQt6 import QtCore, QtGui, QtWidgets
+
+
+class Ui_ConnectionSettingsDialog(object):
+    def setupUi(self, ConnectionSettingsDialog):
+        ConnectionSettingsDialog.setObjectName("ConnectionSettingsDialog")
+        self.form_layout = QtWidgets.QFormLayout(ConnectionSettingsDialog)
+        self.form_layout.setObjectName("form_layout")
+        self.label_host = QtWidgets.QLabel(parent=ConnectionSettingsDialog)
+        self.label_host.setObjectName("label_host")
+        self.form_layout.setWidget(0, QtWidgets.QFormLayout.ItemRole.LabelRole, self.label_host)
+        self.ed_host = QtWidgets.QLineEdit(parent=ConnectionSettingsDialog)
+        self.ed_host.setObjectName("ed_host")
+        self.form_layout.setWidget(0, QtWidgets.QFormLayout.ItemRole.FieldRole, self.ed_host)
+        self.label_port = QtWidgets.QLabel(parent=ConnectionSettingsDialog)
+        self.label_port.setObjectName("label_port")
+        self.form_layout.setWidget(1, QtWidgets.QFormLayout.ItemRole.LabelRole, self.label_port)
+        self.ed_port = QtWidgets.QLineEdit(parent=ConnectionSettingsDialog)
+        self.ed_port.setObjectName("ed_port")
+        self.form_layout.setWidget(1, QtWidgets.QFormLayout.ItemRole.FieldRole, self.ed_port)
+        self.label_timeout = QtWidgets.QLabel(parent=ConnectionSettingsDialog)
+        self.label_timeout.setObjectName("label_timeout")
+        self.form_layout.setWidget(2, QtWidgets.QFormLayout.ItemRole.LabelRole, self.label_timeout)
+        self.ed_timeout = QtWidgets.QLineEdit(parent=ConnectionSettingsDialog)
+        self.ed_timeout.setObjectName("ed_timeout")
+        self.form_layout.setWidget(2, QtWidgets.QFormLayout.ItemRole.FieldRole, self.ed_timeout)
+        self.label_poll = QtWidgets.QLabel(parent=ConnectionSettingsDialog)
+        self.label_poll.setObjectName("label_poll")
+        self.form_layout.setWidget(3, QtWidgets.QFormLayout.ItemRole.LabelRole, self.label_poll)
+        self.ed_poll = QtWidgets.QLineEdit(parent=ConnectionSettingsDialog)
+        self.ed_poll.setObjectName("ed_poll")
+        self.form_layout.setWidget(3, QtWidgets.QFormLayout.ItemRole.FieldRole, self.ed_poll)
+        self.button_box = QtWidgets.QDialogButtonBox(parent=ConnectionSettingsDialog)
+        self.button_box.setOrientation(QtCore.Qt.Orientation.Horizontal)
+        self.button_box.setStandardButtons(QtWidgets.QDialogButtonBox.StandardButton.Cancel|QtWidgets.QDialogButtonBox.StandardButton.Ok)
+        self.button_box.setObjectName("button_box")
+        self.form_layout.setWidget(4, QtWidgets.QFormLayout.ItemRole.SpanningRole, self.button_box)
+
+        self.retranslateUi(ConnectionSettingsDialog)
+        self.button_box.accepted.connect(ConnectionSettingsDialog.accept) # type: ignore
+        self.button_box.rejected.connect(ConnectionSettingsDialog.reject) # type: ignore
+        QtCore.QMetaObject.connectSlotsByName(ConnectionSettingsDialog)
+
+    def retranslateUi(self, ConnectionSettingsDialog):
+        _translate = QtCore.QCoreApplication.translate
+        ConnectionSettingsDialog.setWindowTitle(_translate("ConnectionSettingsDialog", "Параметры соединения"))
+        self.label_host.setText(_translate("ConnectionSettingsDialog", "IP-адрес ПЛК:"))
+        self.ed_host.setPlaceholderText(_translate("ConnectionSettingsDialog", "например, 192.168.0.1"))
+        self.label_port.setText(_translate("ConnectionSettingsDialog", "Порт:"))
+        self.ed_port.setPlaceholderText(_translate("ConnectionSettingsDialog", "например, 502"))
+        self.label_timeout.setText(_translate("ConnectionSettingsDialog", "Таймаут (с):"))
+        self.label_poll.setText(_translate("ConnectionSettingsDialog", "Период опроса (мс):"))
+
+
+UI_SOURCE_SHA1 = '37db99c7680e3b0ea2abc302fee318fff11dc75e'
@@ -1,9 +1,16 @@
-"""Утилиты для загрузки форм Qt Designer во время выполнения."""
+"""Утилиты для загрузки форм Qt Designer во время выполнения.
 
+Формы, скомпилированные ``python -m src.ui.build_ui`` в модули ``<имя>_ui.py``,
+создаются готовым кодом без разбора XML; если модуля нет или он устарел
+(форму правили после компиляции), форма загружается из ``.ui`` через ``uic``.
+"""
+
+import hashlib
+import importlib
+import logging
 from pathlib import Path
 from typing import Union
 
-from PyQt6 import uic
 from PyQt6.QtWidgets import QWidget
 
 # Импортируем пользовательские виджеты, чтобы ``uic`` смог сопоставить их по
@@ -13,10 +20,39 @@ from src.ui.widgets.graph_widget import GraphWidget  # noqa: F401
 from src.ui.widgets.hand_right_panel import LedDashboardPanel  # noqa: F401
 from src.ui.widgets.hand_top_panel import DashboardPanel  # noqa: F401
 from src.utils.spin_box_int_to_float import AppSpinBox  # noqa: F401
-from src.ui.widgets.calibration_widget import ServoCalibrationWidget
 
+logger = logging.getLogger(__name__)
 
 UI_DIR = Path(__file__).resolve().parent
+COMPILED_SUFFIX = '_ui'
+
+
+def ui_digest(ui_path: Union[str, Path]) -> str:
+    """Контрольная сумма файла формы (SHA-1).
+
+    Концы строк приводятся к LF: форма, извлечённая git с ``core.autocrlf``
+    (CRLF на Windows), не считается изменённой.
+    """
+    return hashlib.sha1(Path(ui_path).read_bytes().replace(b'\r\n', b'\n')).hexdigest()
+
+
+def compiled_path(ui_path: Union[str, Path]) -> Path:
+    """Имя модуля, в который компилируется форма."""
+    ui_path = Path(ui_path)
+    return ui_path.with_name(ui_path.stem + COMPILED_SUFFIX + '.py')
+
+
+def _compiled_form(ui_path: Path):
+    """Класс ``Ui_*`` скомпилированной формы или ``None``, если модуль устарел."""
+    if not compiled_path(ui_path).exists():
+        return None
+    module = importlib.import_module(f"{__package__}.{ui_path.stem}{COMPILED_SUFFIX}")
+    if getattr(module, 'UI_SOURCE_SHA1', None) != ui_digest(ui_path):
+        return None
+    for name, value in vars(module).items():
+        if name.startswith('Ui_') and isinstance(value, type):
+            return value
+    return None
 
 
 def load_ui(base: QWidget, ui_filename: Union[str, Path]) -> None:
@@ -33,5 +69,18 @@ def load_ui(base: QWidget, ui_filename: Union[str, Path]) -> None:
     ui_path = UI_DIR / ui_filename
     if not ui_path.exists():
         raise FileNotFoundError(f"Не найден файл интерфейса: {ui_path}")
-    uic.loadUi(ui_path, base)
+    form = _compiled_form(ui_path)
+    if form is None:
+        from PyQt6 import uic
 
+        logger.warning(
+            "Форма %s не скомпилирована или изменена, загрузка из .ui "
+            "(python -m src.ui.build_ui)", ui_path.name
+        )
+        uic.loadUi(ui_path, base)
+        return
+    ui = form()
+    ui.setupUi(base)
+    # Как и uic.loadUi: дочерние виджеты и компоновки - атрибуты base
+    for name, value in vars(ui).items():
+        setattr(base, name, value)
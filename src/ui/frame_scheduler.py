@@ -0,0 +1,81 @@
+"""Единый планировщик обновления интерфейса.
+
+Вместо отдельных таймеров в каждом виджете один таймер раз в кадр обходит
+зарегистрированных клиентов и вызывает обновление только у тех, что видны
+на экране (страница ``pager`` активна, окно не свёрнуто) и для которых
+появились новые данные с момента прошлой отрисовки.
+"""
+
+from dataclasses import dataclass
+from typing import Callable, Hashable, List, Optional
+
+from PyQt6.QtCore import QObject, QTimer, pyqtSlot as Slot
+from PyQt6.QtWidgets import QWidget
+
+FRAME_INTERVAL_MS = 100     # период кадра по умолчанию, мс
+
+
+@dataclass
+class _Client:
+    widget: QWidget
+    callback: Callable[[], None]
+    source: Optional[Callable[[], Hashable]]
+    last_token: Optional[Hashable] = None
+
+
+class FrameScheduler(QObject):
+    """Вызывает обновление видимых виджетов раз в кадр.
+
+    Parameters
+    ----------
+    interval_ms: int
+        Период кадра, мс.
+    """
+
+    def __init__(self, interval_ms: int = FRAME_INTERVAL_MS, parent: Optional[QObject] = None):
+        super().__init__(parent)
+        self._clients: List[_Client] = []
+        self._timer = QTimer(self)
+        self._timer.setInterval(int(interval_ms))
+        self._timer.timeout.connect(self.tick)
+
+    def register(
+        self,
+        widget: QWidget,
+        callback: Callable[[], None],
+        source: Optional[Callable[[], Hashable]] = None,
+    ) -> None:
+        """Добавить клиента.
+
+        ``callback`` вызывается, только пока ``widget`` виден. ``source`` -
+        функция, возвращающая признак версии данных (например, номер снимка
+        ``RealTimeSnapshot.seq``); если признак не изменился с прошлого вызова,
+        клиент пропускается. Без ``source`` клиент обновляется каждый кадр.
+        """
+        self._clients.append(_Client(widget, callback, source))
+
+    def start(self) -> None:
+        self._timer.start()
+
+    def stop(self) -> None:
+        self._timer.stop()
+
+    def set_interval(self, interval_ms: int) -> None:
+        self._timer.setInterval(int(interval_ms))
+
+    @Slot()
+    def tick(self) -> None:
+        """Один кадр: обновить видимых клиентов с новыми данными."""
+        tokens = {}     # признак версии читается один раз за кадр на источник
+        for client in self._clients:
+            widget = client.widget
+            if not widget.isVisible() or widget.window().isMinimized():
+                continue
+            if client.source is not None:
+                if client.source not in tokens:
+                    tokens[client.source] = client.source()
+                token = tokens[client.source]
+                if token == client.last_token:
+                    continue
+                client.last_token = token
+            client.callback()
@@ -0,0 +1,111 @@
+# Form implementation generated from reading ui file 'general_settings_dialog.ui'
+#
+# Created by: PyQt6 UI code generator 6.11.0
+#
+# WARNING: Any manual changes made to this file will be lost when pyuic6 is
+# run again.  Do not edit this file unless you know what you are doing.
+
+
+from PyQt6 import QtCore, QtGui, QtWidgets
+
+
+class Ui_GeneralSettingsDialog(object):
+    def setupUi(self, GeneralSettingsDialog):
+        GeneralSettingsDialog.setObjectName("GeneralSettingsDialog")
+        self.main_layout = QtWidgets.QVBoxLayout(GeneralSettingsDialog)
+        self.main_layout.setObjectName("main_layout")
+        self.splitter = QtWidgets.QSplitter(parent=GeneralSettingsDialog)
+        self.splitter.setOrientation(QtCore.Qt.Orientation.Horizontal)
+        self.splitter.setObjectName("splitter")
+        self.category_list = QtWidgets.QListWidget(parent=self.splitter)
+        self.category_list.setObjectName("category_list")
+        item = QtWidgets.QListWidgetItem()
+        self.category_list.addItem(item)
+        item = QtWidgets.QListWidgetItem()
+        self.category_list.addItem(item)
+        item = QtWidgets.QListWidgetItem()
+        self.category_list.addItem(item)
+        item = QtWidgets.QListWidgetItem()
+        self.category_list.addItem(item)
+        item = QtWidgets.QListWidgetItem()
+        self.category_list.addItem(item)
+        self.pages_stack = QtWidgets.QStackedWidget(parent=self.splitter)
+        self.pages_stack.setObjectName("pages_stack")
+        self.page_system = QtWidgets.QWidget()
+        self.page_system.setObjectName("page_system")
+        self.pages_stack.addWidget(self.page_system)
+        self.page_general = QtWidgets.QWidget()
+        self.page_general.setObjectName("page_general")
+        self.general_layout = QtWidgets.QGridLayout(self.page_general)
+        self.general_layout.setObjectName("general_layout")
+        self.label_lab_address = QtWidgets.QLabel(parent=self.page_general)
+        self.label_lab_address.setObjectName("label_lab_address")
+        self.general_layout.addWidget(self.label_lab_address, 0, 0, 1, 1)
+        self.line_lab_address = QtWidgets.QLineEdit(parent=self.page_general)
+        self.line_lab_address.setObjectName("line_lab_address")
+        self.general_layout.addWidget(self.line_lab_address, 0, 1, 1, 1)
+        self.label_stand_model = QtWidgets.QLabel(parent=self.page_general)
+        self.label_stand_model.setObjectName("label_stand_model")
+        self.general_layout.addWidget(self.label_stand_model, 1, 0, 1, 1)
+        self.line_stand_model = QtWidgets.QLineEdit(parent=self.page_general)
+        self.line_stand_model.setObjectName("line_stand_model")
+        self.general_layout.addWidget(self.line_stand_model, 1, 1, 1, 1)
+        self.label_serial_number = QtWidgets.QLabel(parent=self.page_general)
+        self.label_serial_number.setObjectName("label_serial_number")
+        self.general_layout.addWidget(self.label_serial_number, 2, 0, 1, 1)
+        self.line_serial_number = QtWidgets.QLineEdit(parent=self.page_general)
+        self.line_serial_number.setObjectName("line_serial_number")
+        self.general_layout.addWidget(self.line_serial_number, 2, 1, 1, 1)
+        self.label_certification_date = QtWidgets.QLabel(parent=self.page_general)
+        self.label_certification_date.setObjectName("label_certification_date")
+        self.general_layout.addWidget(self.label_certification_date, 3, 0, 1, 1)
+        self.line_certification_date = QtWidgets.QLineEdit(parent=self.page_general)
+        self.line_certification_date.setObjectName("line_certification_date")
+        self.general_layout.addWidget(self.line_certification_date, 3, 1, 1, 1)
+        spacerItem = QtWidgets.QSpacerItem(20, 40, QtWidgets.QSizePolicy.Policy.Minimum, QtWidgets.QSizePolicy.Policy.Expanding)
+        self.general_layout.addItem(spacerItem, 4, 0, 1, 1)
+        self.pages_stack.addWidget(self.page_general)
+        self.page_connection = QtWidgets.QWidget()
+        self.page_connection.setObjectName("page_connection")
+        self.pages_stack.addWidget(self.page_connection)
+        self.page_reports = QtWidgets.QWidget()
+        self.page_reports.setObjectName("page_reports")
+        self.pages_stack.addWidget(self.page_reports)
+        self.page_archive = QtWidgets.QWidget()
+        self.page_archive.setObjectName("page_archive")
+        self.pages_stack.addWidget(self.page_archive)
+        self.main_layout.addWidget(self.splitter)
+        self.button_box = QtWidgets.QDialogButtonBox(parent=GeneralSettingsDialog)
+        self.button_box.setOrientation(QtCore.Qt.Orientation.Horizontal)
+        self.button_box.setStandardButtons(QtWidgets.QDialogButtonBox.StandardButton.Cancel|QtWidgets.QDialogButtonBox.StandardButton.Ok)
+        self.button_box.setObjectName("button_box")
+        self.main_layout.addWidget(self.button_box)
+
+        self.retranslateUi(GeneralSettingsDialog)
+        self.button_box.accepted.connect(GeneralSettingsDialog.accept) # type: ignore
+        self.button_box.rejected.connect(GeneralSettingsDialog.reject) # type: ignore
+        QtCore.QMetaObject.connectSlotsByName(GeneralSettingsDialog)
+
+    def retranslateUi(self, GeneralSettingsDialog):
+        _translate = QtCore.QCoreApplication.translate
+        GeneralSettingsDialog.setWindowTitle(_translate("GeneralSettingsDialog", "Общие настройки системы"))
+        __sortingEnabled = self.category_list.isSortingEnabled()
+        self.category_list.setSortingEnabled(False)
+        item = self.category_list.item(0)
+        item.setText(_translate("GeneralSettingsDialog", "Система"))
+        item = self.category_list.item(1)
+        item.setText(_translate("GeneralSettingsDialog", "Общие данные стенда"))
+        item = self.category_list.item(2)
+        item.setText(_translate("GeneralSettingsDialog", "Соединение"))
+        item = self.category_list.item(3)
+        item.setText(_translate("GeneralSettingsDialog", "Отчеты"))
+        item = self.category_list.item(4)
+        item.setText(_translate("GeneralSettingsDialog", "Архив"))
+        self.category_list.setSortingEnabled(__sortingEnabled)
+        self.label_lab_address.setText(_translate("GeneralSettingsDialog", "Адрес лаборатории:"))
+        self.label_stand_model.setText(_translate("GeneralSettingsDialog", "Марка и модель стенда:"))
+        self.label_serial_number.setText(_translate("GeneralSettingsDialog", "Серийный номер стенда:"))
+        self.label_certification_date.setText(_translate("GeneralSettingsDialog", "Дата аттестации стенда:"))
+
+
+UI_SOURCE_SHA1 = '87b4130daeebec48c996c95c5bcb836729c60e29'
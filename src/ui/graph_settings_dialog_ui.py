@@ -0,0 +1,44 @@
+# Form implementation generated from reading ui file 'graph_settings_dialog.ui'
+#
+# Created by: PyQt6 UI code generator 6.11.0
+#
+# WARNING: Any manual changes made to this file will be lost when pyuic6 is
+# run again.  Do not edit this file unless you know what you are doing.
+
+
+from PyQt6 import QtCore, QtGui, QtWidgets
+
+
+class Ui_GraphSettingsDialog(object):
+    def setupUi(self, GraphSettingsDialog):
+        GraphSettingsDialog.setObjectName("GraphSettingsDialog")
+        self.main_layout = QtWidgets.QVBoxLayout(GraphSettingsDialog)
+        self.main_layout.setObjectName("main_layout")
+        self.scroll_area = QtWidgets.QScrollArea(parent=GraphSettingsDialog)
+        self.scroll_area.setWidgetResizable(True)
+        self.scroll_area.setObjectName("scroll_area")
+        self.scroll_area_widget = QtWidgets.QWidget()
+        self.scroll_area_widget.setObjectName("scroll_area_widget")
+        self.graphs_layout = QtWidgets.QVBoxLayout(self.scroll_area_widget)
+        self.graphs_layout.setObjectName("graphs_layout")
+        spacerItem = QtWidgets.QSpacerItem(20, 40, QtWidgets.QSizePolicy.Policy.Minimum, QtWidgets.QSizePolicy.Policy.Expanding)
+        self.graphs_layout.addItem(spacerItem)
+        self.scroll_area.setWidget(self.scroll_area_widget)
+        self.main_layout.addWidget(self.scroll_area)
+        self.button_box = QtWidgets.QDialogButtonBox(parent=GraphSettingsDialog)
+        self.button_box.setOrientation(QtCore.Qt.Orientation.Horizontal)
+        self.button_box.setStandardButtons(QtWidgets.QDialogButtonBox.StandardButton.Cancel|QtWidgets.QDialogButtonBox.StandardButton.Ok)
+        self.button_box.setObjectName("button_box")
+        self.main_layout.addWidget(self.button_box)
+
+        self.retranslateUi(GraphSettingsDialog)
+        self.button_box.accepted.connect(GraphSettingsDialog.accept) # type: ignore
+        self.button_box.rejected.connect(GraphSettingsDialog.reject) # type: ignore
+        QtCore.QMetaObject.connectSlotsByName(GraphSettingsDialog)
+
+    def retranslateUi(self, GraphSettingsDialog):
+        _translate = QtCore.QCoreApplication.translate
+        GraphSettingsDialog.setWindowTitle(_translate("GraphSettingsDialog", "Настройки графиков"))
+
+
+UI_SOURCE_SHA1 = 'ef0d4c419e0e357669fde68124d7c262113afb92'
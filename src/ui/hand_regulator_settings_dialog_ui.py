@@ -0,0 +1,63 @@
+# Form implementation generated from reading ui file 'hand_regulator_settings_dialog.ui'
+#
+# Created by: PyQt6 UI code generator 6.11.0
+#
+# WARNING: Any manual changes made to this file will be lost when pyuic6 is
+# run again.  Do not edit this file unless you know what you are doing.
+
+
+from PyQt6 import QtCore, QtGui, QtWidgets
+
+
+class Ui_HandRegulatorSettingsDialog(object):
+    def setupUi(self, HandRegulatorSettingsDialog):
+        HandRegulatorSettingsDialog.setObjectName("HandRegulatorSettingsDialog")
+        self.main_layout = QtWidgets.QVBoxLayout(HandRegulatorSettingsDialog)
+        self.main_layout.setObjectName("main_layout")
+        self.group_box = QtWidgets.QGroupBox(parent=HandRegulatorSettingsDialog)
+        self.group_box.setObjectName("group_box")
+        self.form_layout = QtWidgets.QFormLayout(self.group_box)
+        self.form_layout.setObjectName("form_layout")
+        self.label_kp = QtWidgets.QLabel(parent=self.group_box)
+        self.label_kp.setObjectName("label_kp")
+        self.form_layout.setWidget(0, QtWidgets.QFormLayout.ItemRole.LabelRole, self.label_kp)
+        self.input_kp = QtWidgets.QLineEdit(parent=self.group_box)
+        self.input_kp.setMinimumSize(QtCore.QSize(0, 28))
+        self.input_kp.setObjectName("input_kp")
+        self.form_layout.setWidget(0, QtWidgets.QFormLayout.ItemRole.FieldRole, self.input_kp)
+        self.label_ki = QtWidgets.QLabel(parent=self.group_box)
+        self.label_ki.setObjectName("label_ki")
+        self.form_layout.setWidget(1, QtWidgets.QFormLayout.ItemRole.LabelRole, self.label_ki)
+        self.input_ki = QtWidgets.QLineEdit(parent=self.group_box)
+        self.input_ki.setMinimumSize(QtCore.QSize(0, 28))
+        self.input_ki.setObjectName("input_ki")
+        self.form_layout.setWidget(1, QtWidgets.QFormLayout.ItemRole.FieldRole, self.input_ki)
+        self.label_kd = QtWidgets.QLabel(parent=self.group_box)
+        self.label_kd.setObjectName("label_kd")
+        self.form_layout.setWidget(2, QtWidgets.QFormLayout.ItemRole.LabelRole, self.label_kd)
+        self.input_kd = QtWidgets.QLineEdit(parent=self.group_box)
+        self.input_kd.setMinimumSize(QtCore.QSize(0, 28))
+        self.input_kd.setObjectName("input_kd")
+        self.form_layout.setWidget(2, QtWidgets.QFormLayout.ItemRole.FieldRole, self.input_kd)
+        self.main_layout.addWidget(self.group_box)
+        self.button_box = QtWidgets.QDialogButtonBox(parent=HandRegulatorSettingsDialog)
+        self.button_box.setOrientation(QtCore.Qt.Orientation.Horizontal)
+        self.button_box.setStandardButtons(QtWidgets.QDialogButtonBox.StandardButton.Cancel|QtWidgets.QDialogButtonBox.StandardButton.Ok)
+        self.button_box.setObjectName("button_box")
+        self.main_layout.addWidget(self.button_box)
+
+        self.retranslateUi(HandRegulatorSettingsDialog)
+        self.button_box.accepted.connect(HandRegulatorSettingsDialog.accept) # type: ignore
+        self.button_box.rejected.connect(HandRegulatorSettingsDialog.reject) # type: ignore
+        QtCore.QMetaObject.connectSlotsByName(HandRegulatorSettingsDialog)
+
+    def retranslateUi(self, HandRegulatorSettingsDialog):
+        _translate = QtCore.QCoreApplication.translate
+        HandRegulatorSettingsDialog.setWindowTitle(_translate("HandRegulatorSettingsDialog", "Настройки ПИД-регулятора момента"))
+        self.group_box.setTitle(_translate("HandRegulatorSettingsDialog", "Настройки ПИД-регулятора"))
+        self.label_kp.setText(_translate("HandRegulatorSettingsDialog", "Kp"))
+        self.label_ki.setText(_translate("HandRegulatorSettingsDialog", "Ki"))
+        self.label_kd.setText(_translate("HandRegulatorSettingsDialog", "Kd"))
+
+
+UI_SOURCE_SHA1 = '4e4d0e3d01bd34f97ac7b5551f98f537c82d5ec4'
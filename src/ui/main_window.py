@@ -5,7 +5,7 @@ from __future__ import annotations
 import logging
 from dataclasses import dataclass
 
-from PyQt6.QtCore import Qt, pyqtSlot as Slot, QTimer
+from PyQt6.QtCore import Qt, pyqtSlot as Slot
 from PyQt6.QtWidgets import (
     QApplication,
     QMainWindow,
@@ -31,6 +31,7 @@ from src.data.model import Model
 from src.data.realtime_data import RealTimeData
 from  src.models.modeldata import ModbusDataSource
 from src.ui.designer_loader import load_ui
+from src.ui.frame_scheduler import FrameScheduler
 from src.ui.dialogs import (
     AboutDialog,
     ConnectionSettingsDialog,
@@ -39,6 +40,8 @@ from src.ui.dialogs import (
     HandRegulatorSettingsDialog,
 )
 from src.ui.widgets import dashboards, connection_control_widget as cw
+from src.ui.widgets.archive_panel import ArchivePanel
+from src.ui.widgets.calibration_widget import ServoCalibrationWidget
 from src.utils.config import Config
 
 logger = logging.getLogger(__name__)
@@ -137,15 +140,15 @@ class MainWindow(QMainWindow):
         )
         self.control_buttons.setup()
 
+        # Страницы калибровки и архива создаются при первом переходе на них
+        self.frCalibration: ServoCalibrationWidget | None = None
+        self.frArchive: ArchivePanel | None = None
+
         self._configure_hand_screen()
-        self._configure_calibration_screen()
         self._configure_service_screen()
         self._configure_status_bar()
         self._connect_signals()
-
-        self.base_timer = QTimer()
-        self.base_timer.timeout.connect(self.on_timer)
-        self.base_timer.start(100)
+        self._configure_frame_scheduler()
 
     # ------------------------------------------------------------------
     # Настройка меню и основных разделов
@@ -181,8 +184,40 @@ class MainWindow(QMainWindow):
         self.pageHand_control.config(model=self.model)
 
     def _configure_calibration_screen(self) -> None:
+        """Создать страницу калибровки (при первом открытии)."""
+
+        if self.frCalibration is not None:
+            return
+        self.frCalibration = ServoCalibrationWidget(self.pageCalibration)
+        self.frCalibration.setObjectName("frCalibration")
+        self.horizontalLayout_18.addWidget(self.frCalibration)
         self.frCalibration._set_model(self.model)
         self.frCalibration._set_config(self.config)
+        snapshot_seq = self._snapshot_seq
+        self.frame_scheduler.register(
+            self.frCalibration, self.frCalibration.update_torque_value, snapshot_seq
+        )
+        self.frame_scheduler.register(
+            self.frCalibration, self.frCalibration.update_plots, snapshot_seq
+        )
+        self.frame_scheduler.register(self.frCalibration, self.frCalibration.update_dyno_value)
+
+    def _configure_archive_screen(self) -> None:
+        """Создать страницу архива (при первом открытии) и обновить список испытаний."""
+
+        if self.frArchive is None:
+            self.frArchive = ArchivePanel(self.pageArchive)
+            self.frArchive.setObjectName("frArchive")
+            self.horizontalLayout_archive.addWidget(self.frArchive)
+        self.frArchive.config(self.config.get("archive", "directory", "archive"))
+
+    @Slot(list)
+    def on_journals_recovered(self, paths: list) -> None:
+        """Сообщить о восстановленных по журналу архивах и обновить список испытаний."""
+
+        self.statusbar.showMessage(f"Восстановлено по журналу испытаний: {len(paths)}", 10000)
+        if self.frArchive is not None:
+            self.frArchive.refresh()
 
     def _configure_service_screen(self) -> None:
         kp = self.config.get("pid", "kp", 1.0)
@@ -200,6 +235,37 @@ class MainWindow(QMainWindow):
         self.model.realtime_data.poller.connection_status.connect(
             self.connection_ctrl.set_status
         )
+        self.model.realtime_data.poller.cycle_time.connect(
+            self.connection_ctrl.set_cycle_time
+        )
+        self.model.realtime_data.poller.command_latency.connect(
+            self.connection_ctrl.set_command_latency
+        )
+
+    def _configure_frame_scheduler(self) -> None:
+        """Обновлять графики и панели значений одним таймером кадра.
+
+        Обновляются только виджеты видимой страницы и только при появлении
+        нового снимка данных. Страницы, создаваемые при первом открытии,
+        регистрируются при создании.
+        """
+
+        self.frame_scheduler = FrameScheduler(
+            self.config.get("ui", "poll_interval_ms", 100), self
+        )
+        snapshot_seq = self._snapshot_seq
+        self.frame_scheduler.register(
+            self.pageHand_pnlGraph, self.pageHand_pnlGraph.update_plots, snapshot_seq
+        )
+        self.frame_scheduler.register(
+            self.pageHand_pnlTopDashboard, self.pageHand_pnlTopDashboard.on_timer, snapshot_seq
+        )
+        self.frame_scheduler.start()
+
+    def _snapshot_seq(self) -> int:
+        """Номер последнего опубликованного снимка данных."""
+
+        return self.realtime_data.get_snapshot().seq
 
     def _connect_signals(self) -> None:
         """Подключить сигналы интерфейса к обработчикам."""
@@ -223,6 +289,9 @@ class MainWindow(QMainWindow):
         self.btnEmergencyReset.pressed.connect(self.on_btn_emergency_stop_pressed)
         self.btnEmergencyReset.released.connect(self.on_btn_emergency_stop_released)
 
+        # Архивы, восстановленные по журналу после сбоя, - в список испытаний
+        self.realtime_data.journals_recovered.connect(self.on_journals_recovered)
+
     # ------------------------------------------------------------------
     # Диалоги
     # ------------------------------------------------------------------
@@ -326,6 +395,7 @@ class MainWindow(QMainWindow):
     @Slot()
     def on_btn_calibration_click(self) -> None:
         """Открыть экран калибровки датчиков."""
+        self._configure_calibration_screen()
         self.command_handler.set_plc_mode("hand_calibration")
         self.command_handler.servo_power_on()
         self.pager.setCurrentIndex(4)
@@ -340,6 +410,7 @@ class MainWindow(QMainWindow):
     def on_btn_archive_click(self) -> None:
         """Открыть экран архива."""
 
+        self._configure_archive_screen()
         self.pager.setCurrentIndex(6)
 
     # ------------------------------------------------------------------
@@ -403,9 +474,9 @@ class MainWindow(QMainWindow):
     # Заглушки для команд управления
     # ------------------------------------------------------------------
     def handle_start_command(self) -> None:
-        """Заглушка обработчика команды запуска."""
+        """Начать испытание: значения момента, угол и входы пишутся в архив."""
 
-        pass
+        self.realtime_data.request_archive_start()
 
     def handle_pause_command(self, is_paused: bool) -> None:
         """Заглушка обработчика команды паузы или продолжения."""
@@ -414,12 +485,9 @@ class MainWindow(QMainWindow):
         pass
 
     def handle_stop_command(self) -> None:
-        """Заглушка обработчика команды остановки."""
+        """Завершить испытание и его архив."""
 
-        pass
+        self.realtime_data.request_archive_stop()
 
     def handle_emergency_reset_command(self) -> None:
         self.model.command_handler.alarm_reset()
-
-    def on_timer(self):
-        self.pageHand_pnlGraph.update_plots()
\ No newline at end of file
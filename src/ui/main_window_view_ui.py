@@ -0,0 +1,385 @@
+# Form implementation generated from reading ui file 'main_window_view.ui'
+#
+# Created by: PyQt6 UI code generator 6.11.0
+#
+# WARNING: Any manual changes made to this file will be lost when pyuic6 is
+# run again.  Do not edit this file unless you know what you are doing.
+
+
+from PyQt6 import QtCore, QtGui, QtWidgets
+
+
+class Ui_MainWindow(object):
+    def setupUi(self, MainWindow):
+        MainWindow.setObjectName("MainWindow")
+        MainWindow.setWindowModality(QtCore.Qt.WindowModality.NonModal)
+        MainWindow.resize(1743, 999)
+        MainWindow.setToolButtonStyle(QtCore.Qt.ToolButtonStyle.ToolButtonTextBesideIcon)
+        self.centralwidget = QtWidgets.QWidget(parent=MainWindow)
+        self.centralwidget.setStyleSheet("background-color: rgb(254, 254, 250);")
+        self.centralwidget.setObjectName("centralwidget")
+        self.verticalLayout = QtWidgets.QVBoxLayout(self.centralwidget)
+        self.verticalLayout.setContentsMargins(4, 4, 4, 4)
+        self.verticalLayout.setSpacing(4)
+        self.verticalLayout.setObjectName("verticalLayout")
+        self.horizontalLayout = QtWidgets.QHBoxLayout()
+        self.horizontalLayout.setContentsMargins(10, 10, 10, 10)
+        self.horizontalLayout.setSpacing(10)
+        self.horizontalLayout.setObjectName("horizontalLayout")
+        self.left_panel = QtWidgets.QFrame(parent=self.centralwidget)
+        self.left_panel.setMinimumSize(QtCore.QSize(220, 0))
+        self.left_panel.setObjectName("left_panel")
+        self.verticalLayout_3 = QtWidgets.QVBoxLayout(self.left_panel)
+        self.verticalLayout_3.setContentsMargins(0, 0, 0, 0)
+        self.verticalLayout_3.setSpacing(4)
+        self.verticalLayout_3.setObjectName("verticalLayout_3")
+        self.verticalLayout_2 = QtWidgets.QVBoxLayout()
+        self.verticalLayout_2.setContentsMargins(10, 10, 10, 10)
+        self.verticalLayout_2.setSpacing(10)
+        self.verticalLayout_2.setObjectName("verticalLayout_2")
+        self.btnInit = QtWidgets.QPushButton(parent=self.left_panel)
+        self.btnInit.setMinimumSize(QtCore.QSize(0, 42))
+        font = QtGui.QFont()
+        font.setPointSize(10)
+        self.btnInit.setFont(font)
+        self.btnInit.setObjectName("btnInit")
+        self.verticalLayout_2.addWidget(self.btnInit)
+        self.btnStatic1 = QtWidgets.QPushButton(parent=self.left_panel)
+        self.btnStatic1.setMinimumSize(QtCore.QSize(0, 42))
+        font = QtGui.QFont()
+        font.setPointSize(10)
+        self.btnStatic1.setFont(font)
+        self.btnStatic1.setObjectName("btnStatic1")
+        self.verticalLayout_2.addWidget(self.btnStatic1)
+        self.btnStatic2 = QtWidgets.QPushButton(parent=self.left_panel)
+        self.btnStatic2.setMinimumSize(QtCore.QSize(0, 42))
+        font = QtGui.QFont()
+        font.setPointSize(10)
+        self.btnStatic2.setFont(font)
+        self.btnStatic2.setObjectName("btnStatic2")
+        self.verticalLayout_2.addWidget(self.btnStatic2)
+        self.btnHand = QtWidgets.QPushButton(parent=self.left_panel)
+        self.btnHand.setMinimumSize(QtCore.QSize(0, 42))
+        font = QtGui.QFont()
+        font.setPointSize(10)
+        self.btnHand.setFont(font)
+        self.btnHand.setObjectName("btnHand")
+        self.verticalLayout_2.addWidget(self.btnHand)
+        self.btnCalibration = QtWidgets.QPushButton(parent=self.left_panel)
+        self.btnCalibration.setMinimumSize(QtCore.QSize(0, 42))
+        font = QtGui.QFont()
+        font.setPointSize(10)
+        self.btnCalibration.setFont(font)
+        self.btnCalibration.setObjectName("btnCalibration")
+        self.verticalLayout_2.addWidget(self.btnCalibration)
+        self.btnProtocol = QtWidgets.QPushButton(parent=self.left_panel)
+        self.btnProtocol.setMinimumSize(QtCore.QSize(0, 42))
+        font = QtGui.QFont()
+        font.setPointSize(10)
+        self.btnProtocol.setFont(font)
+        self.btnProtocol.setObjectName("btnProtocol")
+        self.verticalLayout_2.addWidget(self.btnProtocol)
+        self.btnArchive = QtWidgets.QPushButton(parent=self.left_panel)
+        self.btnArchive.setMinimumSize(QtCore.QSize(0, 42))
+        font = QtGui.QFont()
+        font.setPointSize(10)
+        self.btnArchive.setFont(font)
+        self.btnArchive.setObjectName("btnArchive")
+        self.verticalLayout_2.addWidget(self.btnArchive)
+        self.btnService = QtWidgets.QPushButton(parent=self.left_panel)
+        self.btnService.setMinimumSize(QtCore.QSize(0, 42))
+        font = QtGui.QFont()
+        font.setPointSize(10)
+        self.btnService.setFont(font)
+        self.btnService.setObjectName("btnService")
+        self.verticalLayout_2.addWidget(self.btnService)
+        spacerItem = QtWidgets.QSpacerItem(20, 40, QtWidgets.QSizePolicy.Policy.Minimum, QtWidgets.QSizePolicy.Policy.Expanding)
+        self.verticalLayout_2.addItem(spacerItem)
+        self.btnStart = QtWidgets.QPushButton(parent=self.left_panel)
+        self.btnStart.setMinimumSize(QtCore.QSize(0, 42))
+        font = QtGui.QFont()
+        font.setPointSize(10)
+        self.btnStart.setFont(font)
+        self.btnStart.setObjectName("btnStart")
+        self.verticalLayout_2.addWidget(self.btnStart)
+        self.btnPause = QtWidgets.QPushButton(parent=self.left_panel)
+        self.btnPause.setMinimumSize(QtCore.QSize(0, 42))
+        font = QtGui.QFont()
+        font.setPointSize(10)
+        self.btnPause.setFont(font)
+        self.btnPause.setObjectName("btnPause")
+        self.verticalLayout_2.addWidget(self.btnPause)
+        self.btnStop = QtWidgets.QPushButton(parent=self.left_panel)
+        self.btnStop.setMinimumSize(QtCore.QSize(0, 42))
+        font = QtGui.QFont()
+        font.setPointSize(10)
+        self.btnStop.setFont(font)
+        self.btnStop.setObjectName("btnStop")
+        self.verticalLayout_2.addWidget(self.btnStop)
+        self.btnEmergencyReset = QtWidgets.QPushButton(parent=self.left_panel)
+        self.btnEmergencyReset.setMinimumSize(QtCore.QSize(0, 42))
+        font = QtGui.QFont()
+        font.setPointSize(10)
+        self.btnEmergencyReset.setFont(font)
+        self.btnEmergencyReset.setObjectName("btnEmergencyReset")
+        self.verticalLayout_2.addWidget(self.btnEmergencyReset)
+        self.verticalLayout_3.addLayout(self.verticalLayout_2)
+        self.horizontalLayout.addWidget(self.left_panel)
+        self.horizontalLayout_2 = QtWidgets.QHBoxLayout()
+        self.horizontalLayout_2.setContentsMargins(0, 0, 0, 0)
+        self.horizontalLayout_2.setSpacing(4)
+        self.horizontalLayout_2.setObjectName("horizontalLayout_2")
+        self.pager = QtWidgets.QStackedWidget(parent=self.centralwidget)
+        self.pager.setFrameShape(QtWidgets.QFrame.Shape.StyledPanel)
+        self.pager.setLineWidth(1)
+        self.pager.setObjectName("pager")
+        self.pageHand = QtWidgets.QWidget()
+        self.pageHand.setObjectName("pageHand")
+        self.verticalLayout_19 = QtWidgets.QVBoxLayout(self.pageHand)
+        self.verticalLayout_19.setObjectName("verticalLayout_19")
+        self.horizontalLayout_8 = QtWidgets.QHBoxLayout()
+        self.horizontalLayout_8.setObjectName("horizontalLayout_8")
+        self.verticalLayout_5 = QtWidgets.QVBoxLayout()
+        self.verticalLayout_5.setObjectName("verticalLayout_5")
+        self.pageHand_pnlTopDashboard = DashboardPanel(parent=self.pageHand)
+        self.pageHand_pnlTopDashboard.setObjectName("pageHand_pnlTopDashboard")
+        self.horizontalLayout_10 = QtWidgets.QHBoxLayout(self.pageHand_pnlTopDashboard)
+        self.horizontalLayout_10.setContentsMargins(9, 9, 9, 9)
+        self.horizontalLayout_10.setSpacing(6)
+        self.horizontalLayout_10.setObjectName("horizontalLayout_10")
+        self.verticalLayout_5.addWidget(self.pageHand_pnlTopDashboard)
+        self.horizontalLayout_9 = QtWidgets.QHBoxLayout()
+        self.horizontalLayout_9.setObjectName("horizontalLayout_9")
+        self.pageHand_pnlGraph = PlotPanel(parent=self.pageHand)
+        self.pageHand_pnlGraph.setFrameShape(QtWidgets.QFrame.Shape.NoFrame)
+        self.pageHand_pnlGraph.setObjectName("pageHand_pnlGraph")
+        self.verticalLayout_7 = QtWidgets.QVBoxLayout(self.pageHand_pnlGraph)
+        self.verticalLayout_7.setContentsMargins(0, 0, 0, 0)
+        self.verticalLayout_7.setSpacing(4)
+        self.verticalLayout_7.setObjectName("verticalLayout_7")
+        self.horizontalLayout_9.addWidget(self.pageHand_pnlGraph)
+        self.pageHand_control = HandControlPanel(parent=self.pageHand)
+        self.pageHand_control.setFrameShape(QtWidgets.QFrame.Shape.StyledPanel)
+        self.pageHand_control.setFrameShadow(QtWidgets.QFrame.Shadow.Raised)
+        self.pageHand_control.setObjectName("pageHand_control")
+        self.horizontalLayout_9.addWidget(self.pageHand_control)
+        self.horizontalLayout_9.setStretch(0, 12)
+        self.horizontalLayout_9.setStretch(1, 3)
+        self.verticalLayout_5.addLayout(self.horizontalLayout_9)
+        self.verticalLayout_5.setStretch(0, 1)
+        self.verticalLayout_5.setStretch(1, 10)
+        self.horizontalLayout_8.addLayout(self.verticalLayout_5)
+        self.pageHand_pnlRight = LedDashboardPanel(parent=self.pageHand)
+        self.pageHand_pnlRight.setObjectName("pageHand_pnlRight")
+        self.horizontalLayout_8.addWidget(self.pageHand_pnlRight)
+        self.horizontalLayout_8.setStretch(0, 20)
+        self.horizontalLayout_8.setStretch(1, 5)
+        self.verticalLayout_19.addLayout(self.horizontalLayout_8)
+        self.pager.addWidget(self.pageHand)
+        self.pageInit = QtWidgets.QWidget()
+        self.pageInit.setObjectName("pageInit")
+        self.verticalLayout_13 = QtWidgets.QVBoxLayout(self.pageInit)
+        self.verticalLayout_13.setContentsMargins(0, 0, 0, 0)
+        self.verticalLayout_13.setSpacing(0)
+        self.verticalLayout_13.setObjectName("verticalLayout_13")
+        self.label = QtWidgets.QLabel(parent=self.pageInit)
+        font = QtGui.QFont()
+        font.setPointSize(24)
+        self.label.setFont(font)
+        self.label.setAlignment(QtCore.Qt.AlignmentFlag.AlignCenter)
+        self.label.setWordWrap(False)
+        self.label.setObjectName("label")
+        self.verticalLayout_13.addWidget(self.label)
+        self.pager.addWidget(self.pageInit)
+        self.pageStatic1 = QtWidgets.QWidget()
+        self.pageStatic1.setObjectName("pageStatic1")
+        self.horizontalLayout_5 = QtWidgets.QHBoxLayout(self.pageStatic1)
+        self.horizontalLayout_5.setContentsMargins(0, 0, 0, 0)
+        self.horizontalLayout_5.setObjectName("horizontalLayout_5")
+        self.label_3 = QtWidgets.QLabel(parent=self.pageStatic1)
+        font = QtGui.QFont()
+        font.setPointSize(24)
+        self.label_3.setFont(font)
+        self.label_3.setAlignment(QtCore.Qt.AlignmentFlag.AlignCenter)
+        self.label_3.setObjectName("label_3")
+        self.horizontalLayout_5.addWidget(self.label_3)
+        self.pager.addWidget(self.pageStatic1)
+        self.pageStatic2 = QtWidgets.QWidget()
+        self.pageStatic2.setObjectName("pageStatic2")
+        self.horizontalLayout_6 = QtWidgets.QHBoxLayout(self.pageStatic2)
+        self.horizontalLayout_6.setContentsMargins(0, 0, 0, 0)
+        self.horizontalLayout_6.setObjectName("horizontalLayout_6")
+        self.label_4 = QtWidgets.QLabel(parent=self.pageStatic2)
+        font = QtGui.QFont()
+        font.setPointSize(24)
+        self.label_4.setFont(font)
+        self.label_4.setAlignment(QtCore.Qt.AlignmentFlag.AlignCenter)
+        self.label_4.setObjectName("label_4")
+        self.horizontalLayout_6.addWidget(self.label_4)
+        self.pager.addWidget(self.pageStatic2)
+        self.pageCalibration = QtWidgets.QWidget()
+        self.pageCalibration.setObjectName("pageCalibration")
+        self.horizontalLayout_18 = QtWidgets.QHBoxLayout(self.pageCalibration)
+        self.horizontalLayout_18.setObjectName("horizontalLayout_18")
+        self.pager.addWidget(self.pageCalibration)
+        self.pageProtocol = QtWidgets.QWidget()
+        self.pageProtocol.setObjectName("pageProtocol")
+        self.horizontalLayout_protocol = QtWidgets.QHBoxLayout(self.pageProtocol)
+        self.horizontalLayout_protocol.setContentsMargins(0, 0, 0, 0)
+        self.horizontalLayout_protocol.setObjectName("horizontalLayout_protocol")
+        self.label_protocol = QtWidgets.QLabel(parent=self.pageProtocol)
+        font = QtGui.QFont()
+        font.setPointSize(24)
+        self.label_protocol.setFont(font)
+        self.label_protocol.setAlignment(QtCore.Qt.AlignmentFlag.AlignCenter)
+        self.label_protocol.setObjectName("label_protocol")
+        self.horizontalLayout_protocol.addWidget(self.label_protocol)
+        self.pager.addWidget(self.pageProtocol)
+        self.pageArchive = QtWidgets.QWidget()
+        self.pageArchive.setObjectName("pageArchive")
+        self.horizontalLayout_archive = QtWidgets.QHBoxLayout(self.pageArchive)
+        self.horizontalLayout_archive.setContentsMargins(0, 0, 0, 0)
+        self.horizontalLayout_archive.setObjectName("horizontalLayout_archive")
+        self.pager.addWidget(self.pageArchive)
+        self.pageService = QtWidgets.QWidget()
+        self.pageService.setObjectName("pageService")
+        self.groupBox = QtWidgets.QGroupBox(parent=self.pageService)
+        self.groupBox.setGeometry(QtCore.QRect(30, 90, 201, 181))
+        self.groupBox.setObjectName("groupBox")
+        self.layoutWidget = QtWidgets.QWidget(parent=self.groupBox)
+        self.layoutWidget.setGeometry(QtCore.QRect(10, 30, 171, 91))
+        self.layoutWidget.setObjectName("layoutWidget")
+        self.formLayout_4 = QtWidgets.QFormLayout(self.layoutWidget)
+        self.formLayout_4.setContentsMargins(0, 0, 0, 0)
+        self.formLayout_4.setObjectName("formLayout_4")
+        self.dsbKP = QtWidgets.QDoubleSpinBox(parent=self.layoutWidget)
+        sizePolicy = QtWidgets.QSizePolicy(QtWidgets.QSizePolicy.Policy.Fixed, QtWidgets.QSizePolicy.Policy.Fixed)
+        sizePolicy.setHorizontalStretch(0)
+        sizePolicy.setVerticalStretch(0)
+        sizePolicy.setHeightForWidth(self.dsbKP.sizePolicy().hasHeightForWidth())
+        self.dsbKP.setSizePolicy(sizePolicy)
+        self.dsbKP.setMinimumSize(QtCore.QSize(90, 22))
+        font = QtGui.QFont()
+        font.setPointSize(10)
+        self.dsbKP.setFont(font)
+        self.dsbKP.setDecimals(4)
+        self.dsbKP.setSingleStep(0.0001)
+        self.dsbKP.setObjectName("dsbKP")
+        self.formLayout_4.setWidget(0, QtWidgets.QFormLayout.ItemRole.LabelRole, self.dsbKP)
+        self.label_5 = QtWidgets.QLabel(parent=self.layoutWidget)
+        self.label_5.setObjectName("label_5")
+        self.formLayout_4.setWidget(0, QtWidgets.QFormLayout.ItemRole.FieldRole, self.label_5)
+        self.dsbKI = QtWidgets.QDoubleSpinBox(parent=self.layoutWidget)
+        sizePolicy = QtWidgets.QSizePolicy(QtWidgets.QSizePolicy.Policy.Fixed, QtWidgets.QSizePolicy.Policy.Fixed)
+        sizePolicy.setHorizontalStretch(0)
+        sizePolicy.setVerticalStretch(0)
+        sizePolicy.setHeightForWidth(self.dsbKI.sizePolicy().hasHeightForWidth())
+        self.dsbKI.setSizePolicy(sizePolicy)
+        self.dsbKI.setMinimumSize(QtCore.QSize(90, 22))
+        font = QtGui.QFont()
+        font.setPointSize(10)
+        self.dsbKI.setFont(font)
+        self.dsbKI.setDecimals(4)
+        self.dsbKI.setSingleStep(0.0001)
+        self.dsbKI.setObjectName("dsbKI")
+        self.formLayout_4.setWidget(1, QtWidgets.QFormLayout.ItemRole.LabelRole, self.dsbKI)
+        self.label_6 = QtWidgets.QLabel(parent=self.layoutWidget)
+        self.label_6.setObjectName("label_6")
+        self.formLayout_4.setWidget(1, QtWidgets.QFormLayout.ItemRole.FieldRole, self.label_6)
+        self.dsbKD = QtWidgets.QDoubleSpinBox(parent=self.layoutWidget)
+        sizePolicy = QtWidgets.QSizePolicy(QtWidgets.QSizePolicy.Policy.Fixed, QtWidgets.QSizePolicy.Policy.Fixed)
+        sizePolicy.setHorizontalStretch(0)
+        sizePolicy.setVerticalStretch(0)
+        sizePolicy.setHeightForWidth(self.dsbKD.sizePolicy().hasHeightForWidth())
+        self.dsbKD.setSizePolicy(sizePolicy)
+        self.dsbKD.setMinimumSize(QtCore.QSize(90, 22))
+        font = QtGui.QFont()
+        font.setPointSize(10)
+        self.dsbKD.setFont(font)
+        self.dsbKD.setDecimals(4)
+        self.dsbKD.setSingleStep(0.0001)
+        self.dsbKD.setObjectName("dsbKD")
+        self.formLayout_4.setWidget(2, QtWidgets.QFormLayout.ItemRole.LabelRole, self.dsbKD)
+        self.label_7 = QtWidgets.QLabel(parent=self.layoutWidget)
+        self.label_7.setObjectName("label_7")
+        self.formLayout_4.setWidget(2, QtWidgets.QFormLayout.ItemRole.FieldRole, self.label_7)
+        self.btnSavePID = QtWidgets.QPushButton(parent=self.groupBox)
+        self.btnSavePID.setGeometry(QtCore.QRect(10, 130, 171, 42))
+        sizePolicy = QtWidgets.QSizePolicy(QtWidgets.QSizePolicy.Policy.Minimum, QtWidgets.QSizePolicy.Policy.Fixed)
+        sizePolicy.setHorizontalStretch(0)
+        sizePolicy.setVerticalStretch(0)
+        sizePolicy.setHeightForWidth(self.btnSavePID.sizePolicy().hasHeightForWidth())
+        self.btnSavePID.setSizePolicy(sizePolicy)
+        self.btnSavePID.setMinimumSize(QtCore.QSize(0, 42))
+        font = QtGui.QFont()
+        font.setPointSize(10)
+        self.btnSavePID.setFont(font)
+        self.btnSavePID.setObjectName("btnSavePID")
+        self.pager.addWidget(self.pageService)
+        self.horizontalLayout_2.addWidget(self.pager)
+        self.horizontalLayout.addLayout(self.horizontalLayout_2)
+        self.verticalLayout.addLayout(self.horizontalLayout)
+        MainWindow.setCentralWidget(self.centralwidget)
+        self.menubar = QtWidgets.QMenuBar(parent=MainWindow)
+        self.menubar.setGeometry(QtCore.QRect(0, 0, 1743, 22))
+        self.menubar.setObjectName("menubar")
+        self.menu = QtWidgets.QMenu(parent=self.menubar)
+        self.menu.setObjectName("menu")
+        self.menuExit = QtWidgets.QMenu(parent=self.menubar)
+        self.menuExit.setObjectName("menuExit")
+        self.menuAbout = QtWidgets.QMenu(parent=self.menubar)
+        self.menuAbout.setObjectName("menuAbout")
+        MainWindow.setMenuBar(self.menubar)
+        self.statusbar = QtWidgets.QStatusBar(parent=MainWindow)
+        self.statusbar.setObjectName("statusbar")
+        MainWindow.setStatusBar(self.statusbar)
+        self.actionAbout = QtGui.QAction(parent=MainWindow)
+        self.actionAbout.setObjectName("actionAbout")
+        self.menuAbout.addAction(self.actionAbout)
+        self.menubar.addAction(self.menuExit.menuAction())
+        self.menubar.addAction(self.menu.menuAction())
+        self.menubar.addAction(self.menuAbout.menuAction())
+
+        self.retranslateUi(MainWindow)
+        self.pager.setCurrentIndex(6)
+        QtCore.QMetaObject.connectSlotsByName(MainWindow)
+
+    def retranslateUi(self, MainWindow):
+        _translate = QtCore.QCoreApplication.translate
+        MainWindow.setWindowTitle(_translate("MainWindow", "Повортная статика"))
+        self.btnInit.setText(_translate("MainWindow", "Инициализация испытания"))
+        self.btnStatic1.setText(_translate("MainWindow", "Статика 1"))
+        self.btnStatic2.setText(_translate("MainWindow", "Статика 2"))
+        self.btnHand.setText(_translate("MainWindow", "Ручное управление"))
+        self.btnCalibration.setText(_translate("MainWindow", "Калибровка датчиков"))
+        self.btnProtocol.setText(_translate("MainWindow", "Протокол/Результаты"))
+        self.btnArchive.setText(_translate("MainWindow", "Архив"))
+        self.btnService.setText(_translate("MainWindow", "Сервис"))
+        self.btnStart.setText(_translate("MainWindow", "Запуск"))
+        self.btnPause.setText(_translate("MainWindow", "Пауза/Продолжить"))
+        self.btnStop.setText(_translate("MainWindow", "Стоп"))
+        self.btnEmergencyReset.setText(_translate("MainWindow", "Сброс аварии"))
+        self.label.setText(_translate("MainWindow", "Инициализация испытания\n"
+"В разработке..."))
+        self.label_3.setText(_translate("MainWindow", "Статика 1\n"
+"В разработке..."))
+        self.label_4.setText(_translate("MainWindow", "Статика 2\n"
+"В разработке..."))
+        self.label_protocol.setText(_translate("MainWindow", "Протокол/Результаты\n"
+"В разработке..."))
+        self.groupBox.setTitle(_translate("MainWindow", "Коэффициенты ПИД-регулятора"))
+        self.label_5.setText(_translate("MainWindow", "KP"))
+        self.label_6.setText(_translate("MainWindow", "KI"))
+        self.label_7.setText(_translate("MainWindow", "KD"))
+        self.btnSavePID.setText(_translate("MainWindow", "Сохранить"))
+        self.menu.setTitle(_translate("MainWindow", "Настройки"))
+        self.menuExit.setTitle(_translate("MainWindow", "Выход"))
+        self.menuAbout.setTitle(_translate("MainWindow", "О программе"))
+        self.actionAbout.setText(_translate("MainWindow", "О программе"))
+from src.ui.widgets.hand_control_panel import HandControlPanel
+from src.ui.widgets.hand_graph_panel import PlotPanel
+from src.ui.widgets.hand_right_panel import LedDashboardPanel
+from src.ui.widgets.hand_top_panel import DashboardPanel
+
+
+UI_SOURCE_SHA1 = '618344f3d3b5832b17ccb0c84aef15ea51476e3f'
@@ -0,0 +1,170 @@
+"""Экран «Архив»: список испытаний и график момента выбранного испытания."""
+from __future__ import annotations
+
+import os
+import time
+from typing import Optional
+
+import numpy as np
+import pyqtgraph as pg
+from PyQt6.QtCore import Qt, QTimer, pyqtSlot as Slot
+from PyQt6.QtWidgets import (
+    QFrame,
+    QHBoxLayout,
+    QLabel,
+    QListWidget,
+    QListWidgetItem,
+    QPushButton,
+    QVBoxLayout,
+)
+
+from src.data.archive import ArchiveReader, list_archives
+from src.data.archive_index import ArchiveIndex
+from src.ui.widgets.time_series_plot_widget import decimate_minmax
+
+REDRAW_DELAY_MS = 50    # задержка перерисовки после изменения масштаба, мс
+
+
+def _format_duration(seconds: float) -> str:
+    seconds = int(max(0.0, seconds))
+    return f"{seconds // 3600:d}:{seconds // 60 % 60:02d}:{seconds % 60:02d}"
+
+
+class ArchivePanel(QFrame):
+    """Список файлов архива и график момента выбранного испытания.
+
+    На график попадает только видимый интервал: в обзоре - пары (min, max)
+    из секундных или минутных сводок (``ArchiveIndex``), при увеличении -
+    значения архива из распакованных блоков, прореженные до пары на колонку
+    пикселей. Многочасовое испытание открывается и масштабируется
+    без загрузки в память.
+    """
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self.directory = 'archive'
+        self._index: Optional[ArchiveIndex] = None
+        self._title = ''
+
+        self.lst_tests = QListWidget(self)
+        self.btn_refresh = QPushButton("Обновить", self)
+        self.lbl_info = QLabel(self)
+        self.plot = pg.PlotWidget(self, background="w")
+        self._curve = self.plot.plot(pen=pg.mkPen("#0055ee", width=1.0))
+
+        self._redraw_timer = QTimer(self)
+        self._redraw_timer.setSingleShot(True)
+        self._redraw_timer.setInterval(REDRAW_DELAY_MS)
+        self._redraw_timer.timeout.connect(self._redraw)
+
+        self._setup_ui()
+
+    def _setup_ui(self):
+        left = QVBoxLayout()
+        left.addWidget(QLabel("Испытания", self))
+        left.addWidget(self.lst_tests)
+        left.addWidget(self.btn_refresh)
+        right = QVBoxLayout()
+        right.addWidget(self.lbl_info)
+        right.addWidget(self.plot)
+        hbox = QHBoxLayout(self)
+        hbox.addLayout(left, 1)
+        hbox.addLayout(right, 4)
+
+        self.lst_tests.setMinimumWidth(260)
+        self.plot.showGrid(x=True, y=True, alpha=0.3)
+        self.plot.setLabel("bottom", "Время, с")
+        self.plot.setLabel("left", "Крутящий момент, Нм")
+        self.plot.setMouseEnabled(x=True, y=False)
+
+        self.lst_tests.currentItemChanged.connect(self._on_test_selected)
+        self.btn_refresh.clicked.connect(self.refresh)
+        self.plot.sigXRangeChanged.connect(lambda *_: self._redraw_timer.start())
+
+    def config(self, directory: str) -> None:
+        """Задать каталог архива и обновить список."""
+        self.directory = directory
+        self.refresh()
+
+    @Slot()
+    def refresh(self) -> None:
+        """Перечитать список файлов архива."""
+        current = self.lst_tests.currentItem()
+        selected = current.data(Qt.ItemDataRole.UserRole) if current is not None else None
+        self.lst_tests.blockSignals(True)
+        self.lst_tests.clear()
+        for path in list_archives(self.directory):
+            try:
+                reader = ArchiveReader(path)
+            except (OSError, ValueError):
+                continue
+            duration = reader.t_last - reader.t_first
+            started = time.strftime('%d.%m.%Y %H:%M:%S', time.localtime(reader.header['created']))
+            item = QListWidgetItem(f"{started}   {_format_duration(duration)}")
+            item.setData(Qt.ItemDataRole.UserRole, path)
+            self.lst_tests.addItem(item)
+            if path == selected:
+                self.lst_tests.setCurrentItem(item)
+        self.lst_tests.blockSignals(False)
+
+    def open_archive(self, path: str) -> None:
+        """Показать испытание из файла ``path`` целиком."""
+        try:
+            index = ArchiveIndex(path)
+            title = (
+                f"{os.path.basename(path)}: значений {index.size}, "
+                f"{_format_duration(index.t_last - index.t_first)}, "
+                f"пиковый момент {index.peak_torque():.2f} Нм"
+            )
+        except (OSError, ValueError) as e:
+            # Повреждённый файл (ошибка CRC блока) или нельзя записать сводки
+            self._show_error(path, e)
+            return
+        self._index = index
+        self._title = title
+        self.lbl_info.setText(self._title)
+        if index.size:
+            self.plot.setXRange(index.t_first, index.t_last, padding=0.0)
+        self._redraw()
+
+    @Slot(QListWidgetItem, QListWidgetItem)
+    def _on_test_selected(self, current, _previous) -> None:
+        if current is not None:
+            self.open_archive(current.data(Qt.ItemDataRole.UserRole))
+
+    @Slot()
+    def _redraw(self) -> None:
+        """Перерисовать видимый интервал (с диска читаются только его блоки)."""
+        if self._index is None:
+            return
+        (t_from, t_to), _ = self.plot.viewRange()
+        columns = max(1, int(self.plot.width()))
+        try:
+            source, t, vmin, vmax = self._index.envelope(t_from, t_to, columns)
+            stats = self._index.stats(t_from, t_to)
+        except (OSError, ValueError) as e:
+            self._show_error(self._index.path, e)
+            return
+        if t.size == 0:
+            self._curve.setData([], [])
+            return
+        if source:
+            x = np.repeat(t, 2)
+            y = np.empty(2 * t.size, dtype=np.float32)
+            y[0::2] = vmin
+            y[1::2] = vmax
+        else:
+            x, y = decimate_minmax(t, vmin, columns)
+        self._curve.setData(x, y, connect='finite')
+        if stats is not None and stats['valid']:
+            self.lbl_info.setText(
+                f"{self._title}\nВ окне: {stats['torque_min']:.2f} ... {stats['torque_max']:.2f} Нм, "
+                f"среднее {stats['torque_mean']:.2f} Нм"
+            )
+
+    def _show_error(self, path: str, error: Exception) -> None:
+        """Сообщить об ошибке чтения испытания и очистить график."""
+        self._index = None
+        self._title = ''
+        self._curve.setData([], [])
+        self.lbl_info.setText(f"{os.path.basename(path)}: ошибка чтения архива ({error})")
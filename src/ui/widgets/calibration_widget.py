@@ -5,7 +5,7 @@ import typing as t
 from dataclasses import dataclass
 import numpy as np
 
-from PyQt6.QtCore import Qt, pyqtSignal as Signal, pyqtSlot as Slot, QTimer
+from PyQt6.QtCore import Qt, pyqtSignal as Signal, pyqtSlot as Slot
 from PyQt6.QtWidgets import (
     QApplication,
     QDoubleSpinBox,
@@ -23,6 +23,7 @@ from PyQt6.QtWidgets import (
 )
 import yaml  # PyYAML
 from src.ui.widgets.time_series_plot_widget import TimeSeriesPlotWidget
+from src.data.register_frame import TORQUE_SCALE
 from src.ui.calibration_model_coeffs_ui import Ui_coeffs_header
 from src.utils.utils import (
     int_to_word,
@@ -141,15 +142,19 @@ class ServoCalibrationWidget(QFrame):
         self.cg.setStyleSheet(STYLE_SHEET)
         self._load_yaml_if_exists()    # Перезаписать значениями из файла (если есть), НЕ блокируя элементы
         self._update_global_state()
-        self.timer = QTimer(self)
-        self.timer.timeout.connect(self._on_timer)
-        self.timer.start(100)
         self.coeffs_header.write_to_plc.connect(self._on_btn_write_to_plc_clicked)
         self.jog_speed_value = 100
 
     def _set_model(self, model):
         self.model = model
         self.data_source = self.model.realtime_data
+        self.plt_torque.set_stream(
+            self.data_source.sample_rate,
+            TORQUE_SCALE,
+            self.data_source.config.get('ui', 'max_graph_points'),
+        )
+        self.plt_torque.set_transform(self.data_source.calibration.apply)
+        self.plt_torque.set_history_source(self.data_source.get_torque_history)
 
     def _set_config(self, config: Config):
         self.config = config
@@ -180,9 +185,12 @@ class ServoCalibrationWidget(QFrame):
                 r["torque_val"].setText(f'{value:.2f}')
 
     def update_plots(self):
-        torque_data = self.data_source.torque_data_scaled
-        torque_data_indx = self.data_source.head
-        self.plt_torque.update(torque_data, torque_data_indx)
+        total = self.data_source.get_snapshot().torque_total
+        # Из буферов читаются и дописываются в график только значения,
+        # пришедшие с прошлого обновления
+        torque, times = self.data_source.read_stream(
+            total, self.plt_torque.live_missing(total), 'torque', 'torque_time')
+        self.plt_torque.update_live(torque, total, times)
 
     # ----------------------------- UI BUILD ---------------------------------
     def _build_ui(self):
@@ -567,6 +575,8 @@ class ServoCalibrationWidget(QFrame):
         self.config.cfg["calibration"]["B2"] = self.calib_coeff['B2']
         self._set_config(self.config)
         self.config.save()
+        if self.data_source is not None:
+            self.data_source.set_calibration(self.calib_coeff)
         self._save_yaml()
         QMessageBox.information(
             self,
@@ -669,11 +679,6 @@ class ServoCalibrationWidget(QFrame):
         y = np.array(y_list)
         return x, y, x[:6], y[:6], x[5:], y[5:]
 
-    def _on_timer(self):
-        self.update_dyno_value()
-        self.update_torque_value()
-        self.update_plots()
-
     @Slot(dict)
     def _on_btn_write_to_plc_clicked(self, coeffs: dict):
         self.model.command_handler.set_calibration_coefficients(coeffs)
@@ -14,9 +14,13 @@ class ConnectionControl(QWidget):
         self.status_text = ""
         self.control_led = AppLed()
         self.status = QLabel(self.status_text)
+        self.cycle_time = QLabel()
+        self.command_latency = QLabel()
         layout = QHBoxLayout(self)
         layout.addWidget(self.control_led)
         layout.addWidget(self.status)
+        layout.addWidget(self.cycle_time)
+        layout.addWidget(self.command_latency)
         self.setLayout(layout)
         self._setup_ui()
 
@@ -38,5 +42,16 @@ class ConnectionControl(QWidget):
         else:
             self.control_led.turn_off()
             self.status_text = "Соединение отсутствует"
+            self.cycle_time.clear()
+            self.command_latency.clear()
         self.status.setText(self.status_text)
 
+    @Slot(float)
+    def set_cycle_time(self, cycle_time_ms):
+        """Показать время цикла обмена с ПЛК (RTT) в миллисекундах."""
+        self.cycle_time.setText(f"Цикл: {cycle_time_ms:.1f} мс")
+
+    @Slot(float)
+    def set_command_latency(self, latency_ms):
+        """Показать задержку последней срочной команды до ПЛК в миллисекундах."""
+        self.command_latency.setText(f"Команда: {latency_ms:.1f} мс")
@@ -98,7 +98,7 @@ class GraphWidget(pg.PlotWidget):
             return
         ds = model.realtime_data._get_dataset_by_name(dataset_name)
         start_indx = max(
-            0, model.realtime_data.ptr - (self.parent.time_window * 40 + 100)
+            0, len(model.realtime_data.channels['poll_time']) - (self.parent.time_window * 40 + 100)
         )
         value_data = model.realtime_data.get_visible_chunk(dataset_name)
         time_data = [i for i in range(model.config.get('ui', 'max_graph_points', 1000))]
@@ -113,7 +113,7 @@ class GraphWidget(pg.PlotWidget):
 
         '''
         if (
-            model.realtime_data.times[model.realtime_data.ptr - 1]
+            model.realtime_data.channels['poll_time'].latest()
             > self.x_view_range_ms['end']
         ):
             poll_interval = model.realtime_data.poll_interval
@@ -7,6 +7,7 @@ from PyQt6.QtCore import pyqtSlot as Slot
 from src.ui.widgets.graph_widget import GraphWidget
 from src.ui.widgets.time_series_plot_widget import TimeSeriesPlotWidget
 from src.data.model import RealTimeData
+from src.data.register_frame import TORQUE_SCALE
 
 import logging
 
@@ -53,13 +54,29 @@ class PlotPanel(QFrame):
 
     def config(self, data_source: Optional[RealTimeData] = None):
         self.data_source = data_source
+        if data_source is None:
+            return
+        # Частота, масштаб и длина окна - из источника данных и конфигурации
+        config = data_source.config
+        x_range = config.get('graphs', 'x_view_range', {}) or {}
+        window = float(x_range.get('end', X_AXIS_RANGE)) - float(x_range.get('start', 0.0))
+        max_points = config.get('ui', 'max_graph_points')
+        self.plt_torque.set_stream(data_source.sample_rate, TORQUE_SCALE, max_points)
+        self.plt_torque.set_transform(data_source.calibration.apply)
+        self.plt_torque.set_history_source(data_source.get_torque_history)
+        self.plt_velocity.set_stream(data_source.sample_rate, 1.0, max_points)
+        for plot in self.plots:
+            plot.set_x_window(window if window > 0 else X_AXIS_RANGE)
 
     @Slot()
     def update_plots(self):
         if self.data_source is not None:
-            torque_data = self.data_source.torque_data_scaled
-            torque_data_indx = self.data_source.head
-            self.plt_torque.update(torque_data, torque_data_indx)
-            # self.plt_velocity.update()
+            total = self.data_source.get_snapshot().torque_total
+            # Из буферов читаются и дописываются в графики только значения,
+            # пришедшие с прошлого обновления
+            count = max(plot.live_missing(total) for plot in self.plots)
+            torque, rate, times = self.data_source.read_stream(total, count, 'torque', 'torque_rate', 'torque_time')
+            self.plt_torque.update_live(torque, total, times)
+            self.plt_velocity.update_live(rate, total, times)
         else:
             logger.info('Ошибка отображенния графиков: отсутствует источник данных')
\ No newline at end of file
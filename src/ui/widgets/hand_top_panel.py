@@ -1,25 +1,22 @@
 """Top dashboard panel displaying realtime values."""
-from PyQt6.QtCore import QObject, QTimer
+from PyQt6.QtCore import QObject
 from PyQt6.QtWidgets import QFrame, QHBoxLayout, QSpacerItem, QSizePolicy
 from src.ui.widgets.dashboard_value_widget import ValueDisplay
 
-UPDATE_TIME = 100 # Время обновления значений виджетов в мс
-
 class DashboardPanel(QFrame):
-    """Panel with value widgets for tension, velocity and angle."""
+    """Panel with value widgets for tension, velocity and angle.
+
+    Значения обновляет планировщик кадров главного окна (``on_timer``).
+    """
 
     def __init__(self, parent=None, model=None):
         super().__init__(parent)
         self.model              = None
-        self.update_time        = UPDATE_TIME # ms
         self.value_torque       = ValueDisplay(self)
         self.value_velocity     = ValueDisplay(self)
         self.value_angle        = ValueDisplay(self)
         self.value_time_elapsed = ValueDisplay(self)
         self._setup_ui()
-        self.timer              = QTimer()
-        self.timer.timeout.connect(self.on_timer)
-        self.timer.start(self.update_time)
 
     def _setup_ui(self):
         self.hbox = QHBoxLayout()
@@ -7,7 +7,14 @@ from pyqt_led import Led
 
 
 class AppLed(Led):
-    """Styled LED widget with predefined colors."""
+    """Styled LED widget with predefined colors.
+
+    Таблицы стилей состояний строятся один раз на сочетание (шаблон, радиус
+    скругления, цвет) и берутся из общего кэша; ``setStyleSheet`` вызывается,
+    только когда внешний вид действительно меняется.
+    """
+
+    _qss_cache = {}     # (шаблон, радиус, цвет RGB) -> QSS
 
     black = np.array([0x00, 0x00, 0x00], dtype=np.uint8)
     white = np.array([0xFF, 0xFF, 0xFF], dtype=np.uint8)
@@ -34,6 +41,36 @@ class AppLed(Led):
             "   ); "
             "}}"
         )
+        self._update_on_qss()
+        self._update_off_qss()
+        self.set_status(self._status)
+
+    def _cached_qss(self, color):
+        """QSS для цвета ``color`` при текущих шаблоне и форме (из кэша)."""
+        key = (self._qss, self._end_radius, bytes(color))
+        qss = self._qss_cache.get(key)
+        if qss is None:
+            color_hex, grad = self._get_gradient(color)
+            qss = self._qss.format(self._end_radius, grad, color_hex, color_hex)
+            self._qss_cache[key] = qss
+        return qss
+
+    def _update_on_qss(self):
+        self._on_qss = self._cached_qss(self._on_color)
+
+    def _update_off_qss(self):
+        self._off_qss = self._cached_qss(self._off_color)
+
+    def _apply_qss(self, qss):
+        if qss is not getattr(self, '_applied_qss', None):
+            self._applied_qss = qss
+            self.setStyleSheet(qss)
+
+    def _toggle_on(self):
+        self._apply_qss(self._on_qss)
+
+    def _toggle_off(self):
+        self._apply_qss(self._off_qss)
 
 
 class LedPanel(QWidget):
@@ -59,6 +96,8 @@ class LedPanel(QWidget):
         self._grid = QGridLayout()
         self._grid.setColumnStretch(1, 10)
 
+        self._word = None       # последнее отображённое слово состояния
+
         self.container = QGroupBox(self._title)
         self.leds_ = [AppLed() for _ in range(led_number)]
         self.labels_ = [QLabel() for _ in range(led_number)]
@@ -94,9 +133,21 @@ class LedPanel(QWidget):
         self.leds_[indx].set_off_color(off_color)
 
     def set_status(self, word, bits):
-        """Update LED statuses from bit masks."""
+        """Update LED statuses from bit masks.
+
+        Новое слово сравнивается с предыдущим (XOR): переключаются только
+        индикаторы, чьи биты изменились.
+        """
+        if self._word is None:
+            changed = ~0
+        else:
+            changed = word ^ self._word
+            if not changed:
+                return
+        self._word = word
         for i in range(self._led_number):
-            self.leds_[i].set_status(1 & (word >> bits[i]))
+            if 1 & (changed >> bits[i]):
+                self.leds_[i].set_status(1 & (word >> bits[i]))
 
     @Slot(int)
     def update_view(self, data, bits):
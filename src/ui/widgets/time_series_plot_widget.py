@@ -14,19 +14,61 @@ TimeSeriesPlotWidget (PyQt6 + pyqtgraph)
 Зависимости: PyQt6, pyqtgraph, numpy.
 """
 from __future__ import annotations
-from typing import Dict, Optional, Tuple, Union
+import math
+from typing import Callable, Dict, Optional, Tuple, Union
 
 import numpy as np
 
 from PyQt6 import QtCore, QtGui, QtWidgets
 import pyqtgraph as pg
 
+from src.data.plc_ring_reader import GAP_MARKER
+
 
 Number = Union[int, float]
 ColorLike = Union[str, Tuple[int, int, int], Tuple[int, int, int, int], pg.QtGui.QColor]
 
 NUMBERS_PER_SECONDS = 250
 
+# Длины окна, переключаемые из контекстного меню графика: (секунды, подпись)
+WINDOW_PRESETS = (
+    (5.0, "5 с"),
+    (30.0, "30 с"),
+    (300.0, "5 мин"),
+    (3600.0, "1 ч"),
+)
+
+
+def decimate_minmax(
+    x: np.ndarray,
+    y: np.ndarray,
+    columns: int,
+    out: Optional[Tuple[np.ndarray, np.ndarray]] = None,
+) -> Tuple[np.ndarray, np.ndarray]:
+    """Прореживание с сохранением пиков: по паре (min, max) на колонку пикселей.
+
+    Отсчёты делятся на ``columns`` равных групп (лишние самые старые отбрасываются),
+    для каждой группы берутся минимум и максимум. Разрыв (NaN) внутри группы
+    делает NaN и её пару - разрыв линии остаётся видимым. ``out`` - готовые
+    массивы (x, y) длиной не меньше ``2 * columns`` для результата без выделения памяти.
+    """
+    per_column = y.size // columns
+    if per_column < 2:
+        return x, y
+    n = per_column * columns
+    y_bins = y[y.size - n:].reshape(columns, per_column)
+    x_bins = x[x.size - n:].reshape(columns, per_column)
+    if out is None:
+        x_out = np.empty(2 * columns, dtype=x.dtype)
+        y_out = np.empty(2 * columns, dtype=y.dtype)
+    else:
+        x_out, y_out = out[0][:2 * columns], out[1][:2 * columns]
+    np.min(y_bins, axis=1, out=y_out[0::2])
+    np.max(y_bins, axis=1, out=y_out[1::2])
+    x_out[0::2] = x_bins[:, per_column // 2]
+    x_out[1::2] = x_out[0::2]
+    return x_out, y_out
+
 class _PanViewBox(pg.ViewBox):
     """Пользовательский ViewBox: вместо сдвига диапазонов осей меняем «курсор-срез».
 
@@ -79,8 +121,14 @@ class TimeSeriesPlotWidget(pg.PlotWidget):
     ---------
     x_window_seconds : float, default 30.0
         Длина окна по оси X (сек).
-    points_per_window : int, default 1200
-        Количество точек в окне.
+    sample_rate : float, default NUMBERS_PER_SECONDS
+        Частота отсчётов данных (Гц); вместе с длиной окна задаёт число отсчётов в окне.
+    y_scale : float, default 1.0
+        Масштаб данных: единиц данных на единицу оси Y.
+    max_points : int, optional
+        Наибольшее число точек кривой в режиме живого дописывания. Если отсчётов
+        в окне больше, они заранее сводятся в пары (min, max) по группам, так что
+        стоимость отрисовки не зависит от длины окна. ``None`` - без ограничения.
     y_range : (float, float), default (-1.0, 1.0)
         Фиксированный диапазон Y.
     background : str, default 'k'
@@ -92,10 +140,14 @@ class TimeSeriesPlotWidget(pg.PlotWidget):
     """
 
     dataUpdated = QtCore.pyqtSignal(int, int)  # (start_idx, end_idx)
+    windowChanged = QtCore.pyqtSignal(float)    # новая длина окна, с
 
     def __init__(
         self,
         x_window_seconds: float = 30.0,
+        sample_rate: float = NUMBERS_PER_SECONDS,
+        y_scale: float = 1.0,
+        max_points: Optional[int] = None,
         y_range: Tuple[Number, Number] = (-1.0, 1.0),
         background: str = "w",
         antialias: bool = True,
@@ -108,8 +160,10 @@ class TimeSeriesPlotWidget(pg.PlotWidget):
 
         # Хранение параметров окна
         self._x_window_seconds: float = float(x_window_seconds)
-        self._points_per_window: int = int(x_window_seconds * NUMBERS_PER_SECONDS)
-        self._dt: float = self._x_window_seconds / max(1, (self._points_per_window - 1))
+        self._sample_rate: float = float(sample_rate)
+        self._max_points: Optional[int] = max_points
+        self._points_per_window: int = int(round(self._x_window_seconds * self._sample_rate))
+        self._dt: float = 1.0 / self._sample_rate
         self._y_range: Tuple[Number, Number] = y_range
 
         # Внешний вид
@@ -135,7 +189,7 @@ class TimeSeriesPlotWidget(pg.PlotWidget):
         self._series: Dict[str, pg.PlotDataItem] = {}
 
         # Предвычислённый X-массив для окна [0..x_window_seconds]
-        self._x_window = np.linspace(0.0, self._x_window_seconds, self._points_per_window)
+        self._x_window = np.linspace(0.0, self._x_window_seconds, self._display_points())
 
         # Состояние курсора/среза
         self._last_slice: Tuple[int, int] = (0, self._points_per_window)
@@ -144,6 +198,21 @@ class TimeSeriesPlotWidget(pg.PlotWidget):
         # Хранилище данных (опционально; можно продолжать пользоваться update(data, cursor))
         self._data: Optional[np.ndarray] = None
 
+        # Прореживание min/max по колонкам пикселей (пики сохраняются)
+        self._decimate: bool = True
+        self._decimated: Tuple[np.ndarray, np.ndarray] = (np.empty(0), np.empty(0, dtype=np.float32))
+
+        # Масштаб значений данных (единиц на единицу оси Y)
+        self._y_scale: float = float(y_scale)
+        # Пересчёт значений данных в единицы оси Y вместо масштаба (см. set_transform)
+        self._transform: Optional[Callable] = None
+
+        # Источник агрегатов длинной истории для заполнения окна (см. set_history_source)
+        self._history: Optional[Callable] = None
+
+        # Режим живого дописывания (update_live): собственные предвыделенные буферы
+        self._init_live_buffers()
+
         # Стандартная серия по умолчанию
         self.add_series("Сигнал", color="#0055ee", width=1.0)
 
@@ -151,6 +220,38 @@ class TimeSeriesPlotWidget(pg.PlotWidget):
         self._vb.panRequested.connect(self._on_pan_seconds)
 
     # ------------- Публичная конфигурация -------------
+    @property
+    def points_per_window(self) -> int:
+        """Количество отсчётов, помещающихся в окно графика."""
+        return self._points_per_window
+
+    @property
+    def x_window_seconds(self) -> float:
+        """Длина окна по оси X, с."""
+        return self._x_window_seconds
+
+    def set_stream(self, sample_rate: float, y_scale: Optional[float] = None,
+                   max_points: Optional[int] = None) -> None:
+        """Задать параметры потока данных: частоту отсчётов, масштаб и предел точек.
+
+        Число отсчётов в окне пересчитывается, буферы живого дописывания
+        создаются заново.
+        """
+        self._sample_rate = float(sample_rate)
+        if y_scale is not None:
+            self._y_scale = float(y_scale)
+        self._max_points = max_points
+        self.set_x_window(self._x_window_seconds)
+
+    def set_transform(self, transform: Optional[Callable]) -> None:
+        """Задать пересчёт значений данных в единицы оси Y вместо деления на ``y_scale``.
+
+        ``transform(raw, out)`` записывает в массив float32 ``out`` значения
+        для ``raw`` (разрывы - NaN), например ``TorqueCalibration.apply``.
+        """
+        self._transform = transform
+        self._live_total = None
+
     def set_axis_labels(self, x_label: str = "Время, с", y_label: str = "Амплитуда") -> None:
         self.plotItem.setLabel("bottom", x_label)
         self.plotItem.setLabel("left", y_label)
@@ -166,6 +267,21 @@ class TimeSeriesPlotWidget(pg.PlotWidget):
         self.getPlotItem().getAxis("left").setStyle(tickTextOffset=10)
         self.getPlotItem().getAxis("bottom").setStyle(tickTextOffset=10)
 
+    def set_decimation(self, enabled: bool = True) -> None:
+        """Включить/выключить прореживание min/max по ширине графика в пикселях."""
+        self._decimate = bool(enabled)
+
+    def set_history_source(self, fetch: Optional[Callable]) -> None:
+        """Задать источник агрегатов истории для длинных окон.
+
+        ``fetch(t_from, t_to, max_buckets)`` возвращает ``(factor, t, min, max, mean)``
+        или ``None`` (например, ``RealTimeData.get_torque_history``); значения -
+        уже в единицах оси Y. Когда окно длиннее отсчётов, доступных в
+        ``update_live``, его начало заполняется парами (min, max) из истории.
+        """
+        self._history = fetch
+        self._live_total = None
+
     def set_grid(self, visible: bool = True, alpha: float = 0.3) -> None:
         self.plotItem.showGrid(x=visible, y=visible, alpha=alpha)
 
@@ -180,14 +296,30 @@ class TimeSeriesPlotWidget(pg.PlotWidget):
         self._x_window_seconds = float(seconds)
         if points is not None:
             self._points_per_window = int(points)
-        self._dt = self._x_window_seconds / max(1, (self._points_per_window - 1))
-        self._x_window = np.linspace(0.0, self._x_window_seconds, self._points_per_window)
+        else:
+            self._points_per_window = int(round(self._x_window_seconds * self._sample_rate))
+        self._dt = 1.0 / self._sample_rate
+        self._x_window = np.linspace(0.0, self._x_window_seconds, self._display_points())
         self.plotItem.setXRange(0.0, self._x_window_seconds, padding=0.0)
+        self._init_live_buffers()
         # Перерисуем, чтобы x соответствовал новому окну
         for item in self._series.values():
-            y = item.yData if item.yData is not None else np.zeros(self._points_per_window)
+            y = item.yData if item.yData is not None else np.zeros(self._x_window.size)
             y = self._fit_to_window(np.asarray(y))
+            item.setPos(0.0, 0.0)
             item.setData(self._x_window, y, connect='finite')
+        self.windowChanged.emit(self._x_window_seconds)
+
+    def contextMenuEvent(self, ev: QtGui.QContextMenuEvent) -> None:  # type: ignore[override]
+        """Контекстное меню: выбор длины окна из WINDOW_PRESETS."""
+        menu = QtWidgets.QMenu(self)
+        window_menu = menu.addMenu("Окно")
+        for seconds, label in WINDOW_PRESETS:
+            action = window_menu.addAction(label)
+            action.setCheckable(True)
+            action.setChecked(math.isclose(seconds, self._x_window_seconds))
+            action.triggered.connect(lambda _checked, s=seconds: self.set_x_window(s))
+        menu.exec(ev.globalPos())
 
     def set_legend(self, visible: bool = True, **kwargs) -> None:
         if visible and self._legend is None:
@@ -224,21 +356,228 @@ class TimeSeriesPlotWidget(pg.PlotWidget):
         self._cursor_index = 0
         self.update(data, 0)
 
-    def update(self,data: Optional[np.ndarray] = None, cursor_index: Optional[int] = None) -> None: # noqa: D401
-        x = self._x_window
-        if cursor_index < 7500:
-            y_slice = data[0:7500]
+    def update(self,data: Optional[np.ndarray] = None, cursor_index: Optional[int] = None,
+               times: Optional[np.ndarray] = None) -> None: # noqa: D401
+        """Отобразить срез данных.
+
+        Если переданы ``times`` (метки времени отсчётов ``data``, с), ось X строится
+        по ним: последний отсчёт - у правого края окна. Иначе отсчёты считаются
+        равноотстоящими с частотой ``sample_rate``.
+        """
+        points = self._points_per_window
+        if cursor_index < points:
+            window = slice(0, points)
+        else:
+            window = slice(cursor_index - points, cursor_index)
+        y_slice = data[window]
+        t_slice = times[window] if times is not None else None
+        if t_slice is not None and t_slice.size and np.isfinite(t_slice[-1]):
+            x = t_slice - t_slice[-1] + self._x_window_seconds
+            # Ещё не записанные отсчёты (метка NaN) уводим за левый край окна
+            x[np.isnan(x)] = -self._x_window_seconds
+        else:
+            x = np.arange(y_slice.size) * self._dt
+        if self._transform is not None:
+            arr_float = self._transform(y_slice, np.empty(y_slice.size, dtype=np.float32))
         else:
-            y_slice = data[cursor_index - 7500:cursor_index]
-        arr_float = y_slice.astype(np.float32)
-        arr_float /= 500
-        self._series['Сигнал'].setData(x, arr_float, connect='finite')
+            arr_float = y_slice.astype(np.float32)
+            arr_float[y_slice == GAP_MARKER] = np.nan  # разрывы данных не соединяем линией
+            arr_float /= self._y_scale
+        if self._decimate:
+            columns = int(self._vb.width())
+            if columns > 0:
+                x, arr_float = decimate_minmax(x, arr_float, columns)
+        item = self._series['Сигнал']
+        item.setPos(0.0, 0.0)
+        item.setData(x, arr_float, connect='finite')
+        self._live_total = None
 
         self.plotItem.setXRange(0.0, self._x_window_seconds, padding=0.0)
         self.plotItem.setYRange(self._y_range[0], self._y_range[1], padding=0.0)
 
         # self.dataUpdated.emit(start, end)
 
+    def update_live(self, data: np.ndarray, total: int, times: Optional[np.ndarray] = None) -> None:
+        """Дописать в график только новые отсчёты потока.
+
+        ``data`` - последние отсчёты потока в хронологическом порядке (не меньше
+        ``live_missing(total)``, например из ``RealTimeData.read_stream``),
+        ``total`` - номер последнего из них плюс один
+        (``RealTimeSnapshot.torque_total``), ``times`` - метки времени отсчётов ``data``, с.
+        Масштабируются и копируются только отсчёты, пришедшие с прошлого вызова;
+        данные графика хранятся в предвыделенных буферах удвоенной длины, так что
+        окно всегда доступно непрерывным представлением без копирования.
+        Ось X не пересчитывается: кривая сдвигается целиком (``setPos``).
+
+        Если отсчётов в окне больше ``max_points``, новые отсчёты по мере
+        поступления сводятся в пары (min, max) по ``_live_factor`` штук: буферы
+        и отрисовка длинного окна (минуты, часы) не больше, чем короткого.
+        Неполная последняя группа появляется на графике, когда заполнится.
+        """
+        # Начать заново: первый вызов, сброс потока или пропуск длиннее ``data``
+        # (виджет был скрыт) - тогда окно заново заполняется из ``data`` и истории
+        if self._live_total is None or not 0 <= total - self._live_total <= data.size:
+            self._init_live_buffers()
+            self._live_total = total - min(total, data.size, self._points_per_window)
+            count = total - self._live_total
+            if self._history is not None and times is not None and count > 0 and self._live_factor > 1:
+                self._live_backfill(float(times[times.size - count]), float(times[-1]))
+        count = min(total - self._live_total, data.size, self._points_per_window)
+        self._live_total = total
+        if count > 0:
+            raw = data[data.size - count:]
+            if times is not None:
+                stamps = times[times.size - count:]
+            else:
+                stamps = None
+            self._live_write(raw, stamps, count)
+
+        capacity = self._live_capacity
+        pos = self._live_pos
+        x = self._live_x[pos:pos + capacity]
+        y = self._live_y[pos:pos + capacity]
+        if self._decimate:
+            columns = int(self._vb.width())
+            if columns > 0:
+                if self._decimated[0].size < 2 * columns:
+                    self._decimated = (np.empty(2 * columns), np.empty(2 * columns, dtype=np.float32))
+                x, y = decimate_minmax(x, y, columns, out=self._decimated)
+        item = self._series['Сигнал']
+        item.setData(x, y, connect='finite')
+        # Последний отсчёт - у правого края окна
+        t_last = self._live_x[pos + capacity - 1]
+        item.setPos(self._x_window_seconds - t_last, 0.0)
+
+    def live_missing(self, total: int) -> int:
+        """Сколько последних отсчётов потока нужно ``update_live`` при счётчике ``total``.
+
+        Обычно - пришедшие с прошлого вызова; после сброса или долгого перерыва -
+        на всё окно.
+        """
+        if self._live_total is None or not 0 <= total - self._live_total <= self._points_per_window:
+            return min(total, self._points_per_window)
+        return total - self._live_total
+
+    def _init_live_buffers(self) -> None:
+        """Предвыделить буферы режима живого дописывания (по 2 окна)."""
+        points = self._points_per_window
+        if self._max_points is None or points <= self._max_points:
+            factor, capacity = 1, points
+        else:
+            # По паре (min, max) на группу из factor отсчётов
+            factor = math.ceil(points / max(1, self._max_points // 2))
+            capacity = 2 * math.ceil(points / factor)
+        self._live_factor: int = factor
+        self._live_capacity: int = capacity
+        self._live_pos: int = 0             # начало окна в буферах
+        self._live_total: Optional[int] = None
+        self._live_t_last: float = 0.0      # метка последнего принятого отсчёта
+        # Незавершённая группа отсчётов (при factor > 1)
+        self._acc_count: int = 0
+        self._acc_min = np.float32(np.nan)
+        self._acc_max = np.float32(np.nan)
+        # Рабочие буферы масштабированных отсчётов и готовых пар
+        self._live_scaled = np.empty(0, dtype=np.float32)
+        self._live_pairs = (np.empty(0), np.empty(0, dtype=np.float32))
+        # Ещё не полученные отсчёты: y = NaN (не рисуются), x - левее окна по возрастанию
+        step = self._x_window_seconds / capacity
+        self._live_y = np.full(2 * capacity, np.nan, dtype=np.float32)
+        self._live_x = np.tile(np.arange(-capacity, 0, dtype=np.float64) * step, 2)
+
+    def _live_backfill(self, t_first: float, t_last: float) -> None:
+        """Заполнить окно, оканчивающееся в ``t_last``, агрегатами истории до отсчёта ``t_first``."""
+        if not (np.isfinite(t_first) and np.isfinite(t_last)):
+            return
+        history = self._history(t_last - self._x_window_seconds, t_first, self._live_capacity // 2)
+        if history is None:
+            return
+        _factor, t, vmin, vmax, _mean = history
+        x = np.repeat(t, 2)
+        y = np.empty(2 * t.size, dtype=np.float32)
+        y[0::2] = vmin
+        y[1::2] = vmax
+        self._live_push(x, y)
+        self._live_t_last = float(t[-1])
+
+    def _live_write(self, raw: np.ndarray, stamps: Optional[np.ndarray], count: int) -> None:
+        """Масштабировать ``count`` новых отсчётов и дописать их (или их группы) в буферы."""
+        if stamps is None:
+            # Без меток времени отсчёты равноотстоящие
+            stamps = self._live_t_last + self._dt * np.arange(1, count + 1)
+        self._live_t_last = float(stamps[-1])
+        if self._live_scaled.size < count:
+            self._live_scaled = np.empty(count, dtype=np.float32)
+            pairs = 2 * (count // self._live_factor + 1)
+            self._live_pairs = (np.empty(pairs), np.empty(pairs, dtype=np.float32))
+        y = self._live_scaled[:count]
+        if self._transform is not None:
+            self._transform(raw, y)
+        else:
+            np.multiply(raw, 1.0 / self._y_scale, out=y, casting='unsafe')
+            np.copyto(y, np.nan, where=raw == GAP_MARKER)  # разрывы не соединяем линией
+        if self._live_factor == 1:
+            self._live_push(stamps, y)
+        else:
+            self._live_aggregate(stamps, y)
+
+    def _live_aggregate(self, x: np.ndarray, y: np.ndarray) -> None:
+        """Свести отсчёты в пары (min, max) по группам из ``_live_factor`` штук.
+
+        Группа может начаться в одном вызове и закончиться в следующем;
+        её промежуточные min/max хранятся в ``_acc_min``/``_acc_max``.
+        Разрыв (NaN) в группе делает NaN и её пару.
+        """
+        factor = self._live_factor
+        count = y.size
+        x_out, y_out = self._live_pairs
+        n = 0           # готовых пар
+        i = 0           # обработано отсчётов
+        if self._acc_count:
+            i = min(factor - self._acc_count, count)
+            self._acc_min = np.minimum(self._acc_min, y[:i].min())
+            self._acc_max = np.maximum(self._acc_max, y[:i].max())
+            self._acc_count += i
+            if self._acc_count == factor:
+                y_out[0], y_out[1] = self._acc_min, self._acc_max
+                x_out[0] = x_out[1] = x[i - 1]
+                n = 1
+                self._acc_count = 0
+        groups = (count - i) // factor
+        if groups:
+            end = i + groups * factor
+            bins = y[i:end].reshape(groups, factor)
+            np.min(bins, axis=1, out=y_out[2 * n:2 * (n + groups):2])
+            np.max(bins, axis=1, out=y_out[2 * n + 1:2 * (n + groups):2])
+            # Пара ставится на метку последнего отсчёта группы
+            x_out[2 * n:2 * (n + groups):2] = x[i + factor - 1:end:factor]
+            x_out[2 * n + 1:2 * (n + groups):2] = x_out[2 * n:2 * (n + groups):2]
+            n += groups
+            i = end
+        if i < count:
+            self._acc_min = y[i:].min()
+            self._acc_max = y[i:].max()
+            self._acc_count = count - i
+        if n:
+            self._live_push(x_out[:2 * n], y_out[:2 * n])
+
+    def _live_push(self, x: np.ndarray, y: np.ndarray) -> None:
+        """Записать точки кривой в обе половины буферов."""
+        capacity = self._live_capacity
+        if y.size > capacity:
+            x, y = x[-capacity:], y[-capacity:]
+        count = y.size
+        pos = self._live_pos
+        first = min(count, capacity - pos)
+        for src, dst in ((slice(0, first), pos), (slice(first, count), 0)):
+            n = src.stop - src.start
+            if n <= 0:
+                continue
+            self._live_y[dst:dst + n] = y[src]
+            self._live_y[dst + capacity:dst + capacity + n] = y[src]
+            self._live_x[dst:dst + n] = x[src]
+            self._live_x[dst + capacity:dst + capacity + n] = x[src]
+        self._live_pos = (pos + count) % capacity
+
     # def update(self, data: Optional[np.ndarray] = None, cursor_index: Optional[int] = None) -> None:  # noqa: D401
     #     """Обновить отображаемый срез.
     #
@@ -292,8 +631,14 @@ class TimeSeriesPlotWidget(pg.PlotWidget):
     #     self.dataUpdated.emit(start, end)
 
     # ------------- Вспомогательные -------------
+    def _display_points(self) -> int:
+        """Число точек кривой на всё окно (не больше ``max_points``)."""
+        if self._max_points is None:
+            return self._points_per_window
+        return min(self._points_per_window, self._max_points)
+
     def _fit_to_window(self, y: np.ndarray) -> np.ndarray:
-        target = self._points_per_window
+        target = self._x_window.size
         if y.size == 0:
             return np.zeros(target, dtype=float)
         if y.size == target:
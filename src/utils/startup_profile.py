@@ -0,0 +1,198 @@
+"""Профилирование запуска приложения.
+
+Режим включается ключом ``--profile-startup[=ФАЙЛ]`` у ``app.py`` или
+переменной окружения ``STAND_PROFILE_STARTUP=ФАЙЛ`` и собирает:
+
+- время импорта каждого модуля (собственное и вместе с вложенными импортами,
+  как ``python -X importtime``);
+- время создания каждого класса виджетов приложения (``src.*``);
+- этапы запуска и отметки времени (показ окна, первый кадр данных от ПЛК).
+
+Результат записывается в JSON, чтобы сравнивать запуск между версиями.
+Без включения режима профилировщик ничего не делает.
+"""
+
+import builtins
+import datetime
+import functools
+import json
+import logging
+import platform
+import sys
+import threading
+import time
+from contextlib import contextmanager
+
+logger = logging.getLogger(__name__)
+
+PROFILE_ENV = 'STAND_PROFILE_STARTUP'
+PROFILE_FLAG = '--profile-startup'
+DEFAULT_REPORT = 'startup_profile.json'
+REPORT_VERSION = 1
+
+
+def report_path_from(argv, environ):
+    """Имя файла отчёта из ключа командной строки или окружения (``None`` - выключено)."""
+    for arg in argv[1:]:
+        if arg == PROFILE_FLAG:
+            return DEFAULT_REPORT
+        if arg.startswith(PROFILE_FLAG + '='):
+            return arg.split('=', 1)[1] or DEFAULT_REPORT
+    return environ.get(PROFILE_ENV) or None
+
+
+class StartupProfiler:
+    """Сборщик данных о запуске (один на приложение - ``profiler``)."""
+
+    def __init__(self):
+        self.enabled = False
+        self.path = None
+        self.t0 = time.perf_counter()
+        self.imports = {}       # модуль -> [собственное время, с вложенными], с
+        self.widgets = {}       # класс -> [число экземпляров, суммарное время], с
+        self.phases = []        # (имя, начало, длительность), с от t0
+        self.marks = {}         # имя -> время от t0, с
+        self._import_stack = []
+        self._original_import = None
+        self._constructing = set()
+        self._lock = threading.Lock()
+        self._written = False
+
+    def enable(self, path, t0=None):
+        """Включить сбор данных; ``t0`` - начало отсчёта (по умолчанию - сейчас)."""
+        self.enabled = True
+        self.path = path
+        if t0 is not None:
+            self.t0 = t0
+        self._original_import = builtins.__import__
+        builtins.__import__ = self._timed_import
+
+    def stop_imports(self):
+        """Прекратить учёт импортов (после запуска)."""
+        if self._original_import is not None:
+            builtins.__import__ = self._original_import
+            self._original_import = None
+
+    def _timed_import(self, name, globals=None, locals=None, fromlist=(), level=0):
+        original = self._original_import or builtins.__import__
+        if threading.current_thread() is not threading.main_thread():
+            return original(name, globals, locals, fromlist, level)
+        loaded = len(sys.modules)
+        self._import_stack.append(0.0)
+        start = time.perf_counter()
+        try:
+            return original(name, globals, locals, fromlist, level)
+        finally:
+            elapsed = time.perf_counter() - start
+            nested = self._import_stack.pop()
+            if self._import_stack:
+                self._import_stack[-1] += elapsed
+            if len(sys.modules) > loaded:
+                if level and globals:
+                    name = f"{globals.get('__package__') or ''}.{name}".strip('.')
+                entry = self.imports.setdefault(name, [0.0, 0.0])
+                entry[0] += elapsed - nested
+                entry[1] += elapsed
+
+    def instrument_widgets(self, base, prefix='src.'):
+        """Замерять создание всех загруженных подклассов ``base`` из модулей ``prefix*``.
+
+        Время - от входа в ``__init__`` до выхода, включая дочерние виджеты.
+        """
+        if not self.enabled:
+            return
+        for module_name, module in list(sys.modules.items()):
+            if not module_name.startswith(prefix) or module is None:
+                continue
+            for value in list(vars(module).values()):
+                if (isinstance(value, type) and issubclass(value, base)
+                        and value.__module__ == module_name and '__init__' in vars(value)
+                        and not getattr(value.__init__, '_startup_profiled', False)):
+                    value.__init__ = self._timed_init(value.__init__)
+
+    def _timed_init(self, init):
+        @functools.wraps(init)
+        def wrapper(obj, *args, **kwargs):
+            key = id(obj)
+            if key in self._constructing:       # вызов __init__ базового класса
+                return init(obj, *args, **kwargs)
+            self._constructing.add(key)
+            start = time.perf_counter()
+            try:
+                return init(obj, *args, **kwargs)
+            finally:
+                self._constructing.discard(key)
+                entry = self.widgets.setdefault(type(obj).__qualname__, [0, 0.0])
+                entry[0] += 1
+                entry[1] += time.perf_counter() - start
+        wrapper._startup_profiled = True
+        return wrapper
+
+    @contextmanager
+    def section(self, name):
+        """Этап запуска."""
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            if self.enabled:
+                self.phases.append((name, start - self.t0, time.perf_counter() - start))
+
+    def mark(self, name, t=None):
+        """Отметка времени (первая для данного имени)."""
+        if self.enabled and name not in self.marks:
+            self.marks[name] = (time.perf_counter() if t is None else t) - self.t0
+
+    def first_data_frame(self, registers=None, t_received=None):
+        """Слот для сигнала кадра данных ``(регистры, time.monotonic())``.
+
+        Отмечает первый кадр и записывает отчёт; подключается с очередью
+        (QueuedConnection), чтобы выполняться в потоке GUI.
+        """
+        if not self.enabled or 'first_data_frame' in self.marks:
+            return
+        t = time.perf_counter()
+        if t_received is not None:
+            t -= max(0.0, time.monotonic() - t_received)
+        self.mark('first_data_frame', t)
+        self.write()
+
+    def report(self):
+        """Отчёт в виде словаря (времена - в миллисекундах)."""
+        ms = 1000.0
+        imports = sorted(self.imports.items(), key=lambda item: item[1][1], reverse=True)
+        widgets = sorted(self.widgets.items(), key=lambda item: item[1][1], reverse=True)
+        return {
+            'version': REPORT_VERSION,
+            'created': datetime.datetime.now().isoformat(timespec='seconds'),
+            'python': platform.python_version(),
+            'platform': platform.platform(),
+            'argv': sys.argv,
+            'marks_ms': {name: round(t * ms, 3) for name, t in self.marks.items()},
+            'phases': [
+                {'name': name, 'start_ms': round(start * ms, 3), 'duration_ms': round(duration * ms, 3)}
+                for name, start, duration in self.phases
+            ],
+            'imports': [
+                {'module': name, 'self_ms': round(own * ms, 3), 'cumulative_ms': round(total * ms, 3)}
+                for name, (own, total) in imports
+            ],
+            'widgets': [
+                {'class': name, 'count': count, 'total_ms': round(total * ms, 3)}
+                for name, (count, total) in widgets
+            ],
+        }
+
+    def write(self):
+        """Записать отчёт (один раз; повторные вызовы ничего не делают)."""
+        with self._lock:
+            if not self.enabled or self._written:
+                return
+            self._written = True
+            self.stop_imports()
+            with open(self.path, 'w', encoding='utf-8') as f:
+                json.dump(self.report(), f, ensure_ascii=False, indent=2)
+        logger.info("Отчёт о запуске записан: %s", self.path)
+
+
+profiler = StartupProfiler()
@@ -0,0 +1,74 @@
+"""Экран «Архив»: повреждённый файл испытания не завершает программу."""
+
+import os
+import sys
+
+import numpy as np
+import pytest
+
+os.environ.setdefault('QT_QPA_PLATFORM', 'offscreen')
+
+from PyQt6.QtWidgets import QApplication  # noqa: E402
+
+from src.data.archive import ArchiveReader, ArchiveWriter  # noqa: E402
+from src.data.archive_index import SummaryWriter  # noqa: E402
+from src.data.calibration import TorqueCalibration  # noqa: E402
+from src.ui.widgets.archive_panel import ArchivePanel  # noqa: E402
+
+RECORDS = 2000
+CHUNK_RECORDS = 500
+
+
+def _write_archive(path, summaries):
+    writer = ArchiveWriter(
+        path, {'sample_rate': 250.0, 'torque_scale': 500.0, 'angle_scale': 768.0},
+        summaries=SummaryWriter(path, TorqueCalibration(), 768.0) if summaries else None,
+        chunk_records=CHUNK_RECORDS,
+    )
+    writer.start()
+    t = np.arange(RECORDS) * 0.004
+    writer.append(t, (np.sin(t) * 5000).astype(np.int16), np.zeros(RECORDS, np.uint16), np.zeros(RECORDS, np.uint32))
+    writer.stop()
+
+
+def _corrupt_chunk(path, i):
+    entry = ArchiveReader(path).chunks[i]
+    with open(path, 'r+b') as f:
+        f.seek(int(entry['position']) + 10)
+        byte = f.read(1)
+        f.seek(-1, 1)
+        f.write(bytes([byte[0] ^ 0xFF]))
+
+
+@pytest.fixture
+def panel():
+    app = QApplication.instance() or QApplication(sys.argv)
+    panel = ArchivePanel()
+    yield panel
+    panel.deleteLater()
+    app.processEvents()
+
+
+def test_open_damaged_archive_reports_error(panel, tmp_path):
+    path = str(tmp_path / 'test.arc')
+    _write_archive(path, summaries=False)
+    _corrupt_chunk(path, 2)
+
+    # Сводок нет: они строятся при открытии и наталкиваются на повреждённый блок
+    panel.open_archive(path)
+    assert panel._index is None
+    assert 'ошибка' in panel.lbl_info.text()
+
+
+def test_zoom_into_damaged_block_reports_error(panel, tmp_path):
+    path = str(tmp_path / 'test.arc')
+    _write_archive(path, summaries=True)
+    panel.open_archive(path)
+    assert panel._index is not None
+    _corrupt_chunk(path, 2)
+
+    # Увеличение до значений архива: читается повреждённый блок
+    panel.plot.setXRange(4.2, 4.4, padding=0.0)
+    panel._redraw()
+    assert panel._index is None
+    assert 'ошибка' in panel.lbl_info.text()
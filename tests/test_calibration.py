@@ -0,0 +1,59 @@
+"""Калибровочная таблица момента: смещение C1 и маркер разрыва -32768."""
+
+import numpy as np
+import pytest
+
+from src.data.calibration import TorqueCalibration
+from src.data.plc_ring_reader import GAP_MARKER, PlcRingReader
+from src.data.register_frame import BUF_START, BUFFER_LENGTH, READ_BUFFER_SIZE, TORQUE_SCALE, RegisterFrame
+
+COEFFS = {'A1': 0.002, 'B1': 0.98, 'C1': 0.15, 'A2': 1.01, 'B2': 0.05}
+THRESHOLD = 10.0
+
+
+def _model(x):
+    """Калибровочная модель для значения со знаком, Нм."""
+    if abs(x) < THRESHOLD:
+        return (COEFFS['A1'] * x + COEFFS['B1']) * x + COEFFS['C1']
+    return COEFFS['A2'] * x + COEFFS['B2']
+
+
+@pytest.fixture
+def calibration():
+    return TorqueCalibration(COEFFS, THRESHOLD)
+
+
+def test_offset_c1_kept_at_zero_and_small_torque(calibration):
+    raw = np.array([0, 1, -1, 2500, -2500], dtype=np.int16)
+    values = calibration.apply(raw)
+    expected = [_model(v / TORQUE_SCALE) for v in raw]
+    assert values[0] == pytest.approx(COEFFS['C1'])
+    np.testing.assert_allclose(values, expected, rtol=1e-6, atol=1e-6)
+    # Кривая непрерывна в нуле: соседние значения отличаются на шаг шкалы
+    assert abs(values[1] - values[2]) < 0.01
+
+
+def test_upper_range_uses_signed_value(calibration):
+    raw = np.array([10000, -10000, 32767], dtype=np.int16)
+    expected = [_model(v / TORQUE_SCALE) for v in raw]
+    np.testing.assert_allclose(calibration.apply(raw), expected, rtol=1e-6)
+    assert calibration.convert(-20.0) == pytest.approx(_model(-20.0), rel=1e-6)
+
+
+def test_gap_marker_is_nan(calibration):
+    values = calibration.apply(np.array([GAP_MARKER, -32767], dtype=np.int16))
+    assert np.isnan(values[0])
+    assert values[1] == pytest.approx(_model(-32767 / TORQUE_SCALE), rel=1e-6)
+
+
+def test_plc_reading_at_negative_full_scale_is_not_a_gap(calibration):
+    words = np.zeros(READ_BUFFER_SIZE, dtype=np.uint16)
+    torque = np.full(BUFFER_LENGTH, 100, dtype=np.int16)
+    torque[-3:] = GAP_MARKER        # датчик в отрицательном пределе шкалы
+    words[BUF_START:BUF_START + BUFFER_LENGTH] = torque.view(np.uint16)
+    lost, values = PlcRingReader(0.004).read(RegisterFrame(words), 0.0)
+
+    assert lost == 0
+    assert values[-3:].tolist() == [-32767] * 3
+    assert values[:-3].tolist() == [100] * (BUFFER_LENGTH - 3)
+    assert np.isfinite(calibration.apply(values)).all()
@@ -0,0 +1,108 @@
+"""Порядок записи команд в ПЛК: обычные и срочные записи через один поток."""
+
+import asyncio
+import sys
+
+import pytest
+from PyQt6.QtCore import QCoreApplication, QObject
+
+from src.command_handler import CommandHandler
+from src.data.model import default_write_registers
+from src.data.realtime_data import ModbusPoller
+from src.data.register_frame import WRITE_BUFFER_ADDRESS
+from src.data.write_registers import REGISTER_MAP, WriteRegisters
+
+
+class _Config:
+    """Конфигурация опроса: таймер не срабатывает за время теста."""
+
+    def get(self, section, key, default=None):
+        return {'poll_interval_ms': 3_600_000}.get(key, default)
+
+
+class _Response:
+    def isError(self):
+        return False
+
+
+class _Client:
+    """Клиент Modbus, запоминающий срочные записи."""
+
+    connected = True
+
+    def __init__(self):
+        self.writes = []
+
+    async def write_registers(self, address, values):
+        self.writes.append((address, list(values)))
+        return _Response()
+
+    def close(self):
+        pass
+
+
+class _DataSet:
+    def __init__(self):
+        self.config = _Config()
+        self.write_registers = WriteRegisters(defaults=default_write_registers())
+
+    def update(self, registers, t_received):
+        pass
+
+
+class _Model(QObject):
+    def __init__(self):
+        super().__init__()
+        self.modbus_write_regs = default_write_registers()
+        self.realtime_data = _DataSet()
+        self.realtime_data.poller = ModbusPoller(self.realtime_data)
+
+
+@pytest.fixture
+def model():
+    app = QCoreApplication.instance() or QCoreApplication(sys.argv)
+    model = _Model()
+    poller = model.realtime_data.poller
+    poller.timer.stop()
+    poller.client = _Client()
+    poller.connected = True
+    poller.loop = asyncio.new_event_loop()
+    model.realtime_data.write_registers.take_dirty_span()   # начальный блок уже в ПЛК
+    yield model
+    poller.loop.close()
+    app.processEvents()
+
+
+def _flush(model):
+    QCoreApplication.processEvents()
+    return model.realtime_data.poller.client.writes
+
+
+def _word(values, address, name):
+    return values[REGISTER_MAP[name][0] - (address - WRITE_BUFFER_ADDRESS)]
+
+
+def test_tension_setpoint_reaches_plc_with_following_command(model):
+    handler = CommandHandler(model)
+    handler.set_tension(tension=50, velocity=200)
+    handler.torque_hold()
+
+    writes = _flush(model)
+    assert len(writes) == 1
+    address, values = writes[0]
+    assert _word(values, address, 'Modbus_TensionSV') == 50
+    assert _word(values, address, 'Modbus_VelocitySV') == 200
+    assert _word(values, address, 'Modbus_CTRL') == model.modbus_write_regs['Modbus_CTRL']
+    assert model.realtime_data.write_registers.take_dirty_span() is None
+
+
+def test_urgent_write_carries_pending_queued_changes(model):
+    handler = CommandHandler(model)
+    handler.set_plc_register('Modbus_TensionSV', 30)     # не срочная запись
+    handler.jog_cw()
+
+    writes = _flush(model)
+    assert len(writes) == 1
+    address, values = writes[0]
+    assert _word(values, address, 'Modbus_TensionSV') == 30
+    assert _word(values, address, 'Modbus_CTRL') & 0b1110 == 0b0010
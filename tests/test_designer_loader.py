@@ -0,0 +1,21 @@
+"""Загрузка форм Qt Designer: контрольная сумма формы."""
+
+import pytest
+
+pytest.importorskip('pyqt_led')     # пользовательские виджеты форм
+
+from src.ui.designer_loader import UI_DIR, _compiled_form, ui_digest  # noqa: E402
+
+
+def test_digest_ignores_line_endings(tmp_path):
+    lf = tmp_path / 'lf.ui'
+    crlf = tmp_path / 'crlf.ui'
+    text = b'<?xml version="1.0"?>\n<ui version="4.0">\n</ui>\n'
+    lf.write_bytes(text)
+    crlf.write_bytes(text.replace(b'\n', b'\r\n'))
+    assert ui_digest(lf) == ui_digest(crlf)
+
+
+def test_compiled_forms_are_up_to_date():
+    for ui_path in sorted(UI_DIR.glob('*.ui')):
+        assert _compiled_form(ui_path) is not None, ui_path.name
@@ -0,0 +1,155 @@
+"""Восстановление испытания по журналу кадров после сбоя."""
+
+import os
+
+import numpy as np
+
+from src.data.archive import ARCHIVE_DTYPE, ArchiveReader, ArchiveWriter
+from src.data.archive_index import SUMMARY_PERIODS, SummaryWriter, summary_path
+from src.data.calibration import TorqueCalibration
+from src.data.journal import FrameJournal, archive_session, recover_journals
+from src.data.plc_ring_reader import GAP_MARKER, PlcRingReader
+from src.data.register_frame import (
+    ANGLE_ADDRESS,
+    ANGLE_SCALE,
+    BUF_START,
+    BUFFER_LENGTH,
+    DI_ADDRESS,
+    INDEX_ADDRESS,
+    READ_BUFFER_SIZE,
+    TORQUE_SCALE,
+    RegisterFrame,
+)
+from src.data.timebase import SampleTimebase
+
+PLC_CYCLE_S = 0.004
+POLL_S = 0.1
+FRAMES = 100
+KEEP = 10000
+ORIGIN = 1000.0
+CHUNK_RECORDS = 500
+
+
+def _frames():
+    """Кадры опроса ПЛК: непрерывный сигнал, одна пауза опроса с переполнением буфера."""
+    signal = (np.sin(np.arange(200000) * 0.01) * 20000).astype(np.int16)
+    t = ORIGIN
+    produced = BUFFER_LENGTH
+    for i in range(FRAMES + 1):
+        # Пауза опроса 0.3 с: буфер ПЛК оборачивается, часть значений теряется
+        step = 3 * POLL_S if i == FRAMES // 2 else POLL_S
+        if i:
+            t += step
+            produced += round(step / PLC_CYCLE_S)
+        words = np.zeros(READ_BUFFER_SIZE, dtype=np.uint16)
+        words[DI_ADDRESS] = i & 0xFF
+        words[ANGLE_ADDRESS] = i * 7
+        words[BUF_START:BUF_START + BUFFER_LENGTH] = signal[produced - BUFFER_LENGTH:produced].view(np.uint16)
+        words[INDEX_ADDRESS] = produced % BUFFER_LENGTH
+        yield words, t
+
+
+def _record_session(tmp_path):
+    """Записать испытание как ``RealTimeData``: архив, журнал и отправленные в архив записи.
+
+    Возвращает запущенный ``ArchiveWriter``, имя файла архива и записи.
+    """
+    path = str(tmp_path / 'archive' / 'test.arc')
+    os.makedirs(os.path.dirname(path))
+    calibration = TorqueCalibration()
+    header = {
+        'created': 0.0,
+        'time_origin': 0.0,
+        'sample_rate': 1.0 / PLC_CYCLE_S,
+        'torque_scale': TORQUE_SCALE,
+        'angle_scale': ANGLE_SCALE,
+        'calibration': list(calibration.coefficients.values()) + [calibration.threshold],
+    }
+    reader = PlcRingReader(PLC_CYCLE_S)
+    timebase = SampleTimebase(PLC_CYCLE_S)
+    frames = _frames()
+    # Кадр до начала испытания: от него отсчитываются новые значения буфера
+    words, t = next(frames)
+    reader.read(RegisterFrame(words), t)
+    timebase.assign(BUFFER_LENGTH, t, keep=KEEP)
+    session = archive_session(path, header, PLC_CYCLE_S, ORIGIN, KEEP, (words, t, timebase.state()))
+    journal = FrameJournal(str(tmp_path / 'journal' / 'test'), session, flush_interval_s=0.05)
+    journal.start()
+    writer = ArchiveWriter(path, header, flush_interval_s=0.05,
+                           summaries=SummaryWriter(path, calibration, ANGLE_SCALE),
+                           chunk_records=CHUNK_RECORDS)
+    writer.start()
+    sent = []
+    for words, t in frames:
+        journal.record(words, t)
+        frame = RegisterFrame(words)
+        lost, new_values = reader.read(frame, t)
+        stamps = timebase.assign(lost + new_values.size, t, keep=KEEP) - ORIGIN
+        values = np.full(stamps.size, GAP_MARKER, dtype=np.int16)
+        values[stamps.size - new_values.size:] = new_values
+        writer.append(stamps, values, frame.di, frame.angle)
+        block = np.empty(stamps.size, dtype=ARCHIVE_DTYPE)
+        block['t'] = stamps
+        block['torque'] = values
+        block['di'] = frame.di
+        block['angle'] = frame.angle
+        sent.append(block)
+    journal.stop(discard=False)
+    return writer, path, np.concatenate(sent)
+
+
+def _assert_records_equal(records, sent):
+    """Записи архива совпадают с отправленными (время в архиве - с точностью до мкс)."""
+    assert records.size == sent.size
+    np.testing.assert_allclose(records['t'], sent['t'], rtol=0, atol=1e-6)
+    for name in ('torque', 'di', 'angle'):
+        np.testing.assert_array_equal(records[name], sent[name])
+
+
+def _crash(writer):
+    """Остановить поток архива без финальной записи неполного блока и сводок."""
+    writer._stop.set()
+    writer._thread.join()
+    writer._thread = None
+    writer._file.close()
+    for level in writer.summaries._files:
+        level.close()
+
+
+def test_recover_after_crash_restores_sent_records(tmp_path):
+    writer, path, sent = _record_session(tmp_path)
+    assert (sent['torque'] == GAP_MARKER).any()
+    _crash(writer)
+    assert ArchiveReader(path).size < sent.size
+
+    assert recover_journals(str(tmp_path / 'journal')) == [path]
+
+    _assert_records_equal(ArchiveReader(path).read(), sent)
+    for period in SUMMARY_PERIODS:
+        assert os.path.exists(summary_path(path, period))
+    assert not os.path.exists(tmp_path / 'journal' / 'test')
+
+
+def test_recover_complete_archive_rebuilds_summaries(tmp_path):
+    writer, path, sent = _record_session(tmp_path)
+    writer.stop()
+    summaries = {}
+    for period in SUMMARY_PERIODS:
+        with open(summary_path(path, period), 'rb') as f:
+            summaries[period] = f.read()
+        # Хвост сводок не дошёл до диска
+        with open(summary_path(path, period), 'r+b') as f:
+            f.truncate(len(summaries[period]) // 2)
+    with open(path, 'rb') as f:
+        archive = f.read()
+
+    assert recover_journals(str(tmp_path / 'journal')) == [path]
+
+    # Полный архив не переписывается, сводки строятся заново
+    with open(path, 'rb') as f:
+        assert f.read() == archive
+    _assert_records_equal(ArchiveReader(path).read(), sent)
+    for period in SUMMARY_PERIODS:
+        with open(summary_path(path, period), 'rb') as f:
+            assert f.read() == summaries[period]
+    assert not os.path.exists(tmp_path / 'journal' / 'test')
@@ -0,0 +1,63 @@
+"""Выделение новых значений из буфера ПЛК: обёртки, потери, замерший указатель."""
+
+import numpy as np
+import pytest
+
+from src.data.plc_ring_reader import PlcRingReader
+from src.data.register_frame import BUF_START, BUFFER_LENGTH, INDEX_ADDRESS, READ_BUFFER_SIZE, RegisterFrame
+
+PERIOD = 0.004
+START_INDEX = 7
+
+
+def _frame(index, torque):
+    """Кадр регистров с заданным указателем и содержимым буфера момента."""
+    words = np.zeros(READ_BUFFER_SIZE, dtype=np.uint16)
+    words[BUF_START:BUF_START + BUFFER_LENGTH] = np.asarray(torque, dtype=np.int16).view(np.uint16)
+    words[INDEX_ADDRESS] = index % BUFFER_LENGTH
+    return RegisterFrame(words)
+
+
+def test_first_frame_returns_whole_buffer():
+    torque = np.arange(BUFFER_LENGTH, dtype=np.int16)
+    reader = PlcRingReader(PERIOD)
+    lost, values = reader.read(_frame(START_INDEX, torque), 0.0)
+    assert lost == 0
+    np.testing.assert_array_equal(values, torque)
+    assert reader.samples_received == BUFFER_LENGTH
+    assert reader.samples_lost == 0
+    assert reader.overrun_events == 0
+
+
+@pytest.mark.parametrize(
+    'offset, dt, expected_new, expected_lost',
+    [
+        # Без обёртки: смещение согласуется со временем
+        (25, 25 * PERIOD, 25, 0),
+        # Опрос с опозданием, но меньше оборота буфера
+        (30, 40 * PERIOD, 30, 0),
+        # Одна обёртка: 60 значений за интервал, 10 перезаписаны
+        (10, 60 * PERIOD, BUFFER_LENGTH, 10),
+        # Несколько обёрток: 155 значений за интервал
+        (5, 155 * PERIOD, BUFFER_LENGTH, 105),
+        # Ровно один оборот: указатель на месте, но буфер полностью новый
+        (0, BUFFER_LENGTH * PERIOD, BUFFER_LENGTH, 0),
+        # Замерший указатель: ПЛК не пишет значения
+        (0, 25 * PERIOD, 0, 0),
+    ],
+    ids=['no-wrap', 'late-no-wrap', 'one-wrap', 'multi-wrap', 'full-turn', 'frozen-index'],
+)
+def test_read_second_frame(offset, dt, expected_new, expected_lost):
+    reader = PlcRingReader(PERIOD)
+    reader.read(_frame(START_INDEX, np.zeros(BUFFER_LENGTH)), 0.0)
+
+    torque = np.arange(100, 100 + BUFFER_LENGTH, dtype=np.int16)
+    lost, values = reader.read(_frame(START_INDEX + offset, torque), dt)
+
+    assert lost == expected_lost
+    assert values.size == expected_new
+    # Новые значения - хвост буфера в хронологическом порядке
+    np.testing.assert_array_equal(values, torque[BUFFER_LENGTH - expected_new:])
+    assert reader.samples_received == BUFFER_LENGTH + expected_new
+    assert reader.samples_lost == expected_lost
+    assert reader.overrun_events == (1 if expected_lost else 0)
@@ -0,0 +1,36 @@
+"""Кольцевой буфер: чтение отсчётов по номерам."""
+
+import numpy as np
+
+from src.data.ring_buffer import RingBuffer
+
+
+def _filled(capacity, count, chunk):
+    buffer = RingBuffer(capacity, np.int64)
+    for start in range(0, count, chunk):
+        buffer.extend(np.arange(start, min(start + chunk, count)))
+    return buffer
+
+
+def test_read_returns_numbered_values_across_wrap():
+    buffer = _filled(100, 250, 7)
+    assert np.array_equal(buffer.read(180, 250), np.arange(180, 250))
+    assert np.array_equal(buffer.read(240, 245), np.arange(240, 245))
+    assert buffer.read(250, 250).size == 0
+
+
+def test_read_drops_overwritten_values():
+    buffer = _filled(100, 250, 7)
+    # Отсчёты до 150 уже перезаписаны
+    assert np.array_equal(buffer.read(120, 250), np.arange(150, 250))
+    assert np.array_equal(buffer.read(0, 200), np.arange(150, 200))
+
+
+def test_block_longer_than_capacity_keeps_slot_numbering():
+    buffer = RingBuffer(100, np.int64)
+    buffer.extend(np.arange(30))
+    buffer.extend(np.arange(30, 285))
+    assert np.array_equal(buffer.last(), np.arange(185, 285))
+    assert np.array_equal(buffer.read(200, 285), np.arange(200, 285))
+    buffer.extend(np.arange(285, 300))
+    assert np.array_equal(buffer.last(), np.arange(200, 300))
@@ -0,0 +1,57 @@
+"""Блок регистров записи в ПЛК: начальные значения и повторная передача."""
+
+import numpy as np
+
+from src.data.model import default_write_registers
+from src.data.register_frame import floats_to_words
+from src.data.write_registers import REGISTER_MAP, WriteRegisters
+
+CALIBRATION = {'A1': 0.5, 'B1': 2.0, 'C1': -0.25, 'A2': 3.0, 'B2': 1.5}
+
+
+def _words(span, name):
+    """Слова параметра ``name`` в участке записи ``span``."""
+    start, values = span
+    offset, count, kind = REGISTER_MAP[name]
+    size = 2 * count if kind == 'float' else 1
+    return values[offset - start:offset - start + size]
+
+
+def _expected(values):
+    return floats_to_words(values).tolist()
+
+
+def test_first_span_carries_configured_defaults():
+    registers = WriteRegisters(defaults=default_write_registers(CALIBRATION))
+    span = registers.take_dirty_span()
+
+    assert span[0] == 0
+    assert _words(span, 'Modbus_KP') == _expected(1.0)
+    assert _words(span, 'Modbus_KI') == _expected(0.01)
+    assert _words(span, 'Modbus_CC_LO') == _expected([0.5, 2.0, -0.25])
+    assert _words(span, 'Modbus_CC_HI') == _expected([3.0, 1.5])
+    assert registers.take_dirty_span() is None
+
+
+def test_reset_resends_defaults_with_later_changes():
+    registers = WriteRegisters(defaults=default_write_registers(CALIBRATION))
+    registers.take_dirty_span()
+    registers.set('Modbus_KI', 0.2)
+    registers.take_dirty_span()
+
+    # Переподключение: блок уходит целиком, с начальными и изменёнными значениями
+    registers.reset()
+    span = registers.take_dirty_span()
+    assert span[0] == 0
+    assert len(span[1]) == registers.words.size
+    assert _words(span, 'Modbus_KP') == _expected(1.0)
+    assert _words(span, 'Modbus_KI') == _expected(0.2)
+    assert _words(span, 'Modbus_CC_LO') == _expected([0.5, 2.0, -0.25])
+
+
+def test_without_calibration_defaults_are_identity_model():
+    regs = default_write_registers()
+    assert regs['Modbus_CC_LO'] == [0.0, 1.0, 0.0]
+    assert regs['Modbus_CC_HI'] == [1.0, 0.0]
+    registers = WriteRegisters(defaults=regs)
+    assert np.array_equal(registers.words[17:23], floats_to_words([0.0, 1.0, 0.0]))